@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+AdSense Ban Checker Tool - command line entry point
+
+The implementation lives in seo_tools.adsense_ban_checker; this script keeps
+`python3 server/adsense-ban-checker.py ...` invocations working.
+"""
+
+from seo_tools.adsense_ban_checker import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""
+benchmarks - offline benchmark suite for the seo_tools package
+
+Every tool runs against locally synthesized fixtures (encrypted PDFs, images,
+CSV files, structured-data HTML pages) and a local redirect chain server, so
+runs need no network access and are comparable between commits. Results
+report latency percentiles, throughput and peak RSS per tool and input tier.
+
+Run from the server/ directory: python3 -m benchmarks --help
+"""
@@ -0,0 +1,71 @@
+"""
+Run the offline benchmark suite: python3 -m benchmarks [options]
+
+Examples (from the server/ directory):
+
+    python3 -m benchmarks                                   # small + medium tiers
+    python3 -m benchmarks --tools redirect-checker --iterations 50
+    python3 -m benchmarks --tiers large,huge --json results.json
+"""
+
+import os
+import sys
+import json
+import argparse
+import platform
+
+# Measure the tools, not the result cache
+os.environ.setdefault("SEO_TOOLS_CACHE", "0")
+
+from benchmarks import fixtures
+from benchmarks.cases import BenchmarkContext, select_cases
+from benchmarks.redirect_server import RedirectServer
+from benchmarks.runner import format_table, run_case
+
+
+def main():
+    """Main function for command line usage"""
+    parser = argparse.ArgumentParser(description="Benchmark every Python tool against local fixtures")
+    parser.add_argument("--tools", default="", help="Comma separated tool names (default: all)")
+    parser.add_argument("--tiers", default=",".join(fixtures.DEFAULT_TIERS),
+                        help=f"Comma separated input tiers from {', '.join(fixtures.TIERS)}")
+    parser.add_argument("--iterations", type=int, default=10, help="Measured calls per case")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured calls before measuring")
+    parser.add_argument("--min-seconds", type=float, default=0.0, help="Keep measuring cheap cases for at least this long")
+    parser.add_argument("--timeout", type=float, default=600.0, help="Per-case timeout in seconds")
+    parser.add_argument("--online", action="store_true", help="Include cases that call third-party services")
+    parser.add_argument("--json", dest="json_path", help="Also write results (with raw samples) to this file")
+    args = parser.parse_args()
+
+    tools = [tool.strip() for tool in args.tools.split(",") if tool.strip()]
+    tiers = [tier.strip() for tier in args.tiers.split(",") if tier.strip()]
+    unknown = set(tiers) - set(fixtures.TIERS)
+    if unknown:
+        parser.error(f"Unknown tiers: {', '.join(sorted(unknown))}")
+
+    cases = select_cases(tools, tiers, args.online)
+    if not cases:
+        parser.error("No benchmark cases match the given tools and tiers")
+
+    results = []
+    with RedirectServer() as server:
+        context = BenchmarkContext(server=server)
+        for case in cases:
+            print(f"running {case.label} ({case.tier})...", file=sys.stderr, flush=True)
+            results.append(run_case(case, context, args.iterations, args.warmup, args.min_seconds, args.timeout))
+
+    print(format_table(results))
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "cpu_count": os.cpu_count(),
+                "iterations": args.iterations,
+                "results": [result.to_dict(include_samples=True) for result in results]
+            }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+Benchmark cases - one entry per (tool, input tier, variant)
+
+A case's setup(context) runs inside the measuring process and returns
+(run, input_bytes): run() performs one tool call, input_bytes is the payload
+size used for the throughput figures. Tool modules are loaded through the
+seo_tools registry inside setup so their import cost is not measured.
+"""
+
+import os
+import base64
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from seo_tools import registry
+
+from benchmarks import fixtures
+from benchmarks.redirect_server import RedirectServer
+
+
+@dataclass
+class BenchmarkContext:
+    server: RedirectServer
+
+
+@dataclass
+class BenchmarkCase:
+    tool: str
+    tier: str
+    setup: Callable[[BenchmarkContext], Tuple[Callable[[], Any], int]]
+    variant: str = ""
+    # Cases that need third-party services; only run with --online
+    online: bool = False
+
+    @property
+    def label(self) -> str:
+        return f"{self.tool}[{self.variant}]" if self.variant else self.tool
+
+
+def _load(tool: str):
+    return registry.load(tool)
+
+
+# URL tools
+
+def _redirect_chain(hops: int, kind: str = "chain", statuses: str = "301,302"):
+    def setup(context: BenchmarkContext):
+        module = _load("redirect-checker")
+        url = context.server.url(f"/{kind}/{hops}?status={statuses}")
+        # A checker per call, as the service builds one per request: a reused one
+        # would answer the 301 hops from its hop memo after the first call
+        return (lambda: module.RedirectChainChecker().check_redirect_chain(url)), len(url)
+    return setup
+
+
+def _bulk_redirects(count: int, hops: int):
+    def setup(context: BenchmarkContext):
+        module = _load("bulk-redirect-checker")
+        urls = [context.server.url(f"/chain/{hops}?status=301,302&n={index}") for index in range(count)]
+        return (lambda: module.check_bulk(urls, concurrency=64, per_host=64)), sum(len(url) for url in urls)
+    return setup
+
+
+def _schema_html(tier: str):
+    def setup(context: BenchmarkContext):
+        tester = _load("schema-validator").SchemaMarkupTester()
+        html = fixtures.read_fixture(fixtures.html_fixture(tier)).decode("utf-8")
+        return (lambda: tester.process_html_content(html)), len(html)
+    return setup
+
+
+def _schema_url(tier: str):
+    def setup(context: BenchmarkContext):
+        tester = _load("schema-validator").SchemaMarkupTester()
+        path = fixtures.html_fixture(tier)
+        url = context.server.url(f"/page/{path.rsplit('/', 1)[-1]}")
+        return (lambda: tester.validate_from_url(url)), len(fixtures.read_fixture(path))
+    return setup
+
+
+def _safe_browsing(context: BenchmarkContext):
+    module = _load("safe-browsing-checker")
+    url = context.server.url("/chain/0")
+    return (lambda: module.check_safe_browsing(url)), len(url)
+
+
+def _online(tool: str, function: str, *args):
+    def setup(context: BenchmarkContext):
+        func = getattr(_load(tool), function)
+        return (lambda: func(*args)), 0
+    return setup
+
+
+# Text tools
+
+def _jwt(context: BenchmarkContext):
+    module = _load("jwt-decoder")
+
+    def part(value: Dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+    token = ".".join([
+        part({"alg": "HS256", "typ": "JWT"}),
+        part({"sub": "1234567890", "name": "Benchmark", "iat": 1516239022, "exp": 4102444800}),
+        "c2lnbmF0dXJl"
+    ])
+    return (lambda: module.decode_jwt(token)), len(token)
+
+
+def _regex(size: int):
+    def setup(context: BenchmarkContext):
+        module = _load("regex-generator")
+        text = ("user@example.com called +15551234567 on 2024-05-01 at 10:30. " * (size // 60 + 1))[:size]
+        return (lambda: module.generate_regex("email", {"case_insensitive": True}, text)), len(text)
+    return setup
+
+
+def _js_obfuscator(size: int, level: str):
+    def setup(context: BenchmarkContext):
+        module = _load("js-obfuscator")
+        snippet = "function greet(name) {\n  // say hello\n  var message = 'Hello, ' + name;\n  console.log(message);\n}\n"
+        code = (snippet * (size // len(snippet) + 1))[:size]
+        return (lambda: module.obfuscate_js(code, level)), len(code)
+    return setup
+
+
+def _html_to_markdown(tier: str):
+    def setup(context: BenchmarkContext):
+        module = _load("html-to-markdown-converter")
+        html = fixtures.read_fixture(fixtures.html_fixture(tier)).decode("utf-8")
+        return (lambda: module.convert_html_to_markdown(html)), len(html)
+    return setup
+
+
+def _csv_to_json(tier: str):
+    def setup(context: BenchmarkContext):
+        module = _load("csv-to-json-converter")
+        content = fixtures.read_fixture(fixtures.csv_fixture(tier)).decode("utf-8")
+        return (lambda: module.convert_csv_to_json(content, False)), len(content)
+    return setup
+
+
+# Image tools
+
+def _image_tool(tool: str, function: str, image_format: str = "PNG", *args, text: bool = False):
+    def factory(tier: str):
+        def setup(context: BenchmarkContext):
+            func = getattr(_load(tool), function)
+            path = fixtures.text_image_fixture(tier) if text else fixtures.image_fixture(tier, image_format)
+            data = fixtures.read_fixture(path)
+            return (lambda: func(data, *args)), len(data)
+        return setup
+    return factory
+
+
+# PDF tools
+
+def _pdf_cracker(revision: str):
+    def setup(context: BenchmarkContext):
+        module = _load("enhanced-pdf-cracker")
+        data = fixtures.read_fixture(fixtures.pdf_fixture(revision))
+        return (lambda: module.process_pdf(data)), len(data)
+    return setup
+
+
+def _pdf_remover(revision: str):
+    def setup(context: BenchmarkContext):
+        module = _load("pdf-password-remover")
+        data = fixtures.read_fixture(fixtures.pdf_fixture(revision))
+        password = fixtures.PDF_REVISIONS[revision]["password"]
+        return (lambda: module.PDFPasswordRemover().process_pdf(data, password)), len(data)
+    return setup
+
+
+# Scheduler
+
+def _isolated_job(context: BenchmarkContext):
+    """A job that does nothing, so only the isolated child's launch is timed"""
+    from seo_tools.isolation import IsolatedExecutor
+
+    executor = IsolatedExecutor(1)
+    executor.start()
+    return (lambda: executor.submit(os.getpid).result()), 0
+
+
+def build_cases() -> List[BenchmarkCase]:
+    """Every benchmark case, across all tiers"""
+    cases = [
+        BenchmarkCase("redirect-checker", "small", _redirect_chain(1), "1-hop"),
+        BenchmarkCase("redirect-checker", "medium", _redirect_chain(5), "5-hop"),
+        BenchmarkCase("redirect-checker", "medium", _redirect_chain(5, "meta"), "5-hop-meta"),
+        BenchmarkCase("redirect-checker", "large", _redirect_chain(14, statuses="301,302,307,308"), "14-hop"),
+        BenchmarkCase("bulk-redirect-checker", "medium", _bulk_redirects(100, 3), "100x3-hop"),
+        BenchmarkCase("bulk-redirect-checker", "large", _bulk_redirects(1000, 3), "1000x3-hop"),
+        BenchmarkCase("safe-browsing-checker", "small", _safe_browsing),
+        BenchmarkCase("schema-validator", "small", _schema_url("small"), "url"),
+        BenchmarkCase("ip-geolocation-finder", "small", _online("ip-geolocation-finder", "get_ip_geolocation", "8.8.8.8"), online=True),
+        BenchmarkCase("domain-age-checker", "small", _online("domain-age-checker", "check_domain_age", "example.com"), online=True),
+        BenchmarkCase("adsense-ban-checker", "small", _online("adsense-ban-checker", "check_adsense_ban", "example.com"), online=True),
+        BenchmarkCase("jwt-decoder", "small", _jwt),
+        BenchmarkCase("regex-generator", "small", _regex(1024)),
+        BenchmarkCase("regex-generator", "medium", _regex(1024 * 1024)),
+        BenchmarkCase("js-obfuscator", "small", _js_obfuscator(1024, "basic"), "basic"),
+        BenchmarkCase("js-obfuscator", "medium", _js_obfuscator(1024 * 1024, "advanced"), "advanced"),
+        BenchmarkCase("isolated-job", "small", _isolated_job, "noop"),
+    ]
+
+    for tier in ("small", "medium", "large"):
+        cases.append(BenchmarkCase("schema-validator", tier, _schema_html(tier), "html"))
+        cases.append(BenchmarkCase("html-to-markdown-converter", tier, _html_to_markdown(tier)))
+
+    for tier in fixtures.CSV_SIZES:
+        cases.append(BenchmarkCase("csv-to-json-converter", tier, _csv_to_json(tier)))
+
+    image_tools = [
+        ("image-to-text-ocr", _image_tool("image-to-text-ocr", "process_ocr", text=True), ""),
+        ("background-remover", _image_tool("background-remover", "process_background_removal", "PNG", True, False), ""),
+        ("image-dpi-converter", _image_tool("image-dpi-converter", "process_dpi_conversion", "PNG", 300), "300dpi"),
+        ("webp-to-jpg-converter", _image_tool("webp-to-jpg-converter", "process_webp_conversion", "WEBP", "medium", 85), ""),
+        ("profile-picture-maker", _image_tool("profile-picture-maker", "process_profile_picture", "PNG", {}), "process"),
+        ("profile-picture-maker", _image_tool("profile-picture-maker", "generate_practice_sheet", "PNG", {}), "practice-sheet"),
+    ]
+    for tool, factory, variant in image_tools:
+        for tier in fixtures.IMAGE_SIZES:
+            cases.append(BenchmarkCase(tool, tier, factory(tier), variant))
+
+    for revision in fixtures.PDF_REVISIONS:
+        cases.append(BenchmarkCase("enhanced-pdf-cracker", "small", _pdf_cracker(revision), revision))
+        cases.append(BenchmarkCase("pdf-password-remover", "small", _pdf_remover(revision), revision))
+
+    return cases
+
+
+def select_cases(tools: Optional[List[str]], tiers: List[str], online: bool) -> List[BenchmarkCase]:
+    """Filter cases by tool name, tier and whether online cases are allowed"""
+    return [
+        case for case in build_cases()
+        if case.tier in tiers
+        and (not tools or case.tool in tools)
+        and (online or not case.online)
+    ]
@@ -0,0 +1,201 @@
+"""
+Benchmark fixtures - synthesized locally, written once and reused between runs
+
+Fixtures live in BENCHMARK_FIXTURES_DIR (default server/benchmarks/.fixtures)
+and are only regenerated when missing, so the 48 MP images and 1 GB CSV are
+paid for once.
+"""
+
+import os
+import csv
+import json
+import random
+from typing import Dict
+
+FIXTURES_DIR = os.environ.get(
+    "BENCHMARK_FIXTURES_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".fixtures")
+)
+
+# Input-size tiers; "large" and "huge" are opt-in (see benchmarks.__main__)
+TIERS = ("small", "medium", "large", "huge")
+DEFAULT_TIERS = ("small", "medium")
+
+# Image sizes in pixels: 0.3, 12 and 48 megapixels
+IMAGE_SIZES = {
+    "small": (640, 480),
+    "medium": (4000, 3000),
+    "large": (8000, 6000),
+}
+
+CSV_SIZES = {
+    "small": 1024,
+    "medium": 1024 * 1024,
+    "large": 100 * 1024 * 1024,
+    "huge": 1024 * 1024 * 1024,
+}
+
+# Number of schema.org entities per HTML page
+HTML_ENTITIES = {
+    "small": 2,
+    "medium": 50,
+    "large": 1000,
+}
+
+# Encryption revisions and the password each fixture is locked with; every
+# password is in the crackers' priority list so the runs are deterministic
+PDF_REVISIONS: Dict[str, Dict] = {
+    "R2": {"R": 2, "aes": False, "password": "123456"},
+    "R3": {"R": 3, "aes": False, "password": "password"},
+    "R4": {"R": 4, "aes": True, "password": "admin"},
+    "R6": {"R": 6, "aes": True, "password": "letmein"},
+}
+
+
+def fixture_path(name: str) -> str:
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    return os.path.join(FIXTURES_DIR, name)
+
+
+def _write_once(name: str, writer) -> str:
+    """Create a fixture with writer(tmp_path) unless it already exists"""
+    path = fixture_path(name)
+    if not os.path.exists(path):
+        tmp_path = f"{path}.tmp"
+        writer(tmp_path)
+        os.replace(tmp_path, path)
+    return path
+
+
+def read_fixture(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+# Images
+
+def _synthesize_image(size):
+    """Photo-like RGB image: gradients plus noise so encoders do real work"""
+    from PIL import Image
+
+    gradient = Image.linear_gradient("L").resize(size)
+    noise = Image.effect_noise(size, 64)
+    radial = Image.radial_gradient("L").resize(size)
+    return Image.merge("RGB", (gradient, noise, radial))
+
+
+def image_fixture(tier: str, image_format: str = "PNG") -> str:
+    """Synthesized image for a tier, in PNG or WEBP"""
+    extension = image_format.lower()
+
+    def write(path):
+        _synthesize_image(IMAGE_SIZES[tier]).save(path, image_format)
+
+    return _write_once(f"image_{tier}.{extension}", write)
+
+
+def text_image_fixture(tier: str) -> str:
+    """Black text on white at the tier's size, for OCR"""
+    def write(path):
+        from PIL import Image, ImageDraw
+
+        width, height = IMAGE_SIZES[tier]
+        image = Image.new("RGB", (width, height), (255, 255, 255))
+        draw = ImageDraw.Draw(image)
+        line = "The quick brown fox jumps over the lazy dog 0123456789"
+        for y in range(10, height - 20, 24):
+            draw.text((10, y), line, fill=(0, 0, 0))
+        image.save(path, "PNG")
+
+    return _write_once(f"text_{tier}.png", write)
+
+
+# PDFs
+
+def pdf_fixture(revision: str, pages: int = 1) -> str:
+    """PDF encrypted by pikepdf at the given revision (R2/R3/R4/R6)"""
+    settings = PDF_REVISIONS[revision]
+
+    def write(path):
+        import pikepdf
+
+        pdf = pikepdf.new()
+        for _ in range(pages):
+            pdf.add_blank_page(page_size=(612, 792))
+        encryption = pikepdf.Encryption(
+            user=settings["password"], owner=settings["password"] + "-owner",
+            R=settings["R"], aes=settings["aes"],
+            # pikepdf only encrypts metadata from R4 on ("Cannot encrypt metadata when R < 4")
+            metadata=settings["R"] >= 4
+        )
+        pdf.save(path, encryption=encryption)
+
+    return _write_once(f"locked_{revision}_{pages}p.pdf", write)
+
+
+# CSV
+
+def csv_fixture(tier: str) -> str:
+    """CSV of roughly the tier's byte size, written row by row"""
+    target = CSV_SIZES[tier]
+
+    def write(path):
+        rng = random.Random(42)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            out = csv.writer(f)
+            out.writerow(["id", "name", "email", "city", "score", "joined"])
+            row_id = 0
+            while f.tell() < target:
+                row_id += 1
+                out.writerow([
+                    row_id, f"User {row_id}", f"user{row_id}@example.com",
+                    rng.choice(["Berlin", "Lagos", "Lima", "Osaka", "Perth"]),
+                    rng.randint(0, 1000), f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+                ])
+
+    return _write_once(f"data_{tier}.csv", write)
+
+
+# HTML with structured data
+
+def _json_ld_entity(index: int) -> Dict:
+    return {
+        "@context": "https://schema.org",
+        "@type": "Product",
+        "name": f"Product {index}",
+        "description": "A product used for benchmarking structured data parsing.",
+        "sku": f"SKU-{index:05d}",
+        "offers": {"@type": "Offer", "price": "19.99", "priceCurrency": "USD"},
+    }
+
+
+def _microdata_entity(index: int) -> str:
+    return (
+        f'<div itemscope itemtype="https://schema.org/Person">'
+        f'<span itemprop="name">Person {index}</span>'
+        f'<span itemprop="jobTitle">Engineer</span>'
+        f'<a itemprop="url" href="https://example.com/people/{index}">profile</a>'
+        f'<div itemprop="address" itemscope itemtype="https://schema.org/PostalAddress">'
+        f'<span itemprop="addressLocality">Springfield</span></div>'
+        f'</div>'
+    )
+
+
+def html_fixture(tier: str) -> str:
+    """HTML page with JSON-LD blocks and microdata items"""
+    count = HTML_ENTITIES[tier]
+
+    def write(path):
+        parts = ["<!DOCTYPE html><html><head><title>Benchmark page</title>"]
+        for index in range(count):
+            parts.append('<script type="application/ld+json">')
+            parts.append(json.dumps(_json_ld_entity(index)))
+            parts.append("</script>")
+        parts.append("</head><body><h1>Benchmark</h1>")
+        for index in range(count):
+            parts.append(f"<p>Paragraph {index} with <strong>bold</strong> and <a href='/x/{index}'>a link</a>.</p>")
+            parts.append(_microdata_entity(index))
+        parts.append("</body></html>")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(parts))
+
+    return _write_once(f"page_{tier}.html", write)
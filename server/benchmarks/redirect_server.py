@@ -0,0 +1,99 @@
+"""
+Local HTTP server for the URL tool benchmarks
+
+    /chain/<hops>?status=301,302&final=200   <hops> redirects (statuses cycle), then final
+    /meta/<hops>                             the same chain using meta refresh pages
+    /page/<name>                             a file from the fixtures directory
+
+The server runs in a daemon thread on 127.0.0.1 with an ephemeral port.
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.fixtures import FIXTURES_DIR
+
+FINAL_BODY = b"<!DOCTYPE html><html><head><title>Final</title></head><body>done</body></html>"
+
+
+class RedirectChainHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "text/html", location: str = None):
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _statuses(self, query) -> List[int]:
+        values = query.get("status", ["301"])[0]
+        return [int(value) for value in values.split(",") if value]
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        parts = [part for part in parsed.path.split("/") if part]
+
+        if len(parts) == 2 and parts[0] in ("chain", "meta") and parts[1].isdigit():
+            hops = int(parts[1])
+            next_url = f"/{parts[0]}/{hops - 1}" + (f"?{parsed.query}" if parsed.query else "")
+            if hops <= 0:
+                final_status = int(query.get("final", ["200"])[0])
+                self._send(final_status, FINAL_BODY)
+            elif parts[0] == "meta":
+                body = (
+                    f'<!DOCTYPE html><html><head><meta http-equiv="refresh" content="0; url={next_url}">'
+                    f'</head><body></body></html>'
+                ).encode()
+                self._send(200, body)
+            else:
+                statuses = self._statuses(query)
+                self._send(statuses[hops % len(statuses)], location=next_url)
+            return
+
+        if len(parts) == 2 and parts[0] == "page":
+            path = os.path.join(FIXTURES_DIR, os.path.basename(parts[1]))
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    self._send(200, f.read())
+                return
+
+        self._send(404, b"not found", "text/plain")
+
+
+class RedirectServer:
+    """Context manager running the redirect chain server in a thread"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.httpd = ThreadingHTTPServer((host, port), RedirectChainHandler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def __enter__(self) -> "RedirectServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
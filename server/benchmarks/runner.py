@@ -0,0 +1,154 @@
+"""
+Benchmark runner - latency percentiles, throughput and peak RSS per case
+
+Each case runs in its own forked process so peak RSS (ru_maxrss) belongs to
+that case alone and one tool's heap never inflates the next tool's numbers.
+"""
+
+import math
+import time
+import resource
+import traceback
+import multiprocessing
+from dataclasses import dataclass, asdict, field
+from typing import Any, Dict, List, Optional
+
+from seo_tools import ToolUnavailable
+
+from benchmarks.cases import BenchmarkCase, BenchmarkContext
+
+
+@dataclass
+class BenchmarkResult:
+    tool: str
+    variant: str
+    tier: str
+    iterations: int = 0
+    errors: int = 0
+    input_bytes: int = 0
+    p50_ms: float = 0.0
+    p90_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+    ops_per_second: float = 0.0
+    mb_per_second: float = 0.0
+    peak_rss_mb: float = 0.0
+    setup_seconds: float = 0.0
+    error: Optional[str] = None
+    samples_ms: List[float] = field(default_factory=list, repr=False)
+
+    def to_dict(self, include_samples: bool = False) -> Dict[str, Any]:
+        data = asdict(self)
+        if not include_samples:
+            data.pop("samples_ms")
+        return data
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _failed(result: Any) -> bool:
+    return isinstance(result, dict) and result.get("success") is False
+
+
+def _measure(case: BenchmarkCase, context: BenchmarkContext, iterations: int, warmup: int,
+             min_seconds: float) -> BenchmarkResult:
+    result = BenchmarkResult(case.tool, case.variant, case.tier)
+
+    setup_start = time.perf_counter()
+    run, result.input_bytes = case.setup(context)
+    result.setup_seconds = round(time.perf_counter() - setup_start, 3)
+
+    for _ in range(warmup):
+        run()
+
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < iterations or (time.perf_counter() - started < min_seconds and len(samples) < iterations * 10):
+        call_start = time.perf_counter()
+        output = run()
+        samples.append((time.perf_counter() - call_start) * 1000)
+        if _failed(output):
+            result.errors += 1
+            if result.error is None:
+                result.error = str(output.get("error") or output.get("message"))
+    total_seconds = time.perf_counter() - started
+
+    result.iterations = len(samples)
+    result.samples_ms = [round(sample, 3) for sample in samples]
+    result.p50_ms = round(percentile(samples, 0.50), 3)
+    result.p90_ms = round(percentile(samples, 0.90), 3)
+    result.p99_ms = round(percentile(samples, 0.99), 3)
+    result.max_ms = round(max(samples), 3)
+    result.ops_per_second = round(len(samples) / total_seconds, 3) if total_seconds else 0.0
+    if result.input_bytes:
+        result.mb_per_second = round(result.input_bytes * len(samples) / total_seconds / (1024 * 1024), 3)
+    return result
+
+
+def _child(connection, case, context, iterations, warmup, min_seconds):
+    try:
+        result = _measure(case, context, iterations, warmup, min_seconds)
+    except ToolUnavailable as e:
+        # Missing optional dependency: report it without a traceback
+        result = BenchmarkResult(case.tool, case.variant, case.tier, error=str(e))
+    except Exception as e:
+        result = BenchmarkResult(case.tool, case.variant, case.tier, error=f"{type(e).__name__}: {e}")
+        traceback.print_exc()
+    # ru_maxrss is in kilobytes on Linux
+    result.peak_rss_mb = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    connection.send(result)
+    connection.close()
+
+
+def run_case(case: BenchmarkCase, context: BenchmarkContext, iterations: int = 10, warmup: int = 1,
+             min_seconds: float = 0.0, timeout: float = 600.0) -> BenchmarkResult:
+    """Run one case in a forked process and return its measurements"""
+    mp_context = multiprocessing.get_context("fork")
+    receiver, sender = mp_context.Pipe(duplex=False)
+    # Not daemonic: a case may start processes of its own (isolated-job forks a forkserver)
+    process = mp_context.Process(
+        target=_child, args=(sender, case, context, iterations, warmup, min_seconds)
+    )
+    process.start()
+    sender.close()
+
+    if receiver.poll(timeout):
+        try:
+            result = receiver.recv()
+        except EOFError:
+            result = None
+    else:
+        result = None
+        process.kill()
+    process.join()
+
+    if result is None:
+        reason = "timed out" if process.exitcode in (None, -9) else f"exited with code {process.exitcode}"
+        result = BenchmarkResult(case.tool, case.variant, case.tier, error=f"Benchmark process {reason}")
+    return result
+
+
+def format_table(results: List[BenchmarkResult]) -> str:
+    """Plain-text report, one line per case"""
+    header = f"{'tool':<44} {'tier':<7} {'n':>4} {'p50 ms':>10} {'p90 ms':>10} {'p99 ms':>10} {'ops/s':>9} {'MB/s':>8} {'RSS MB':>8}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        label = f"{result.tool}[{result.variant}]" if result.variant else result.tool
+        if result.error and not result.iterations:
+            lines.append(f"{label:<44} {result.tier:<7} ERROR: {result.error}")
+            continue
+        line = (
+            f"{label:<44} {result.tier:<7} {result.iterations:>4} {result.p50_ms:>10.2f} {result.p90_ms:>10.2f} "
+            f"{result.p99_ms:>10.2f} {result.ops_per_second:>9.2f} {result.mb_per_second:>8.2f} {result.peak_rss_mb:>8.1f}"
+        )
+        if result.errors:
+            line += f"  ({result.errors} failed: {result.error})"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Domain Age Checker Tool - command line entry point
+
+The implementation lives in seo_tools.domain_age_checker; this script keeps
+`python3 server/domain-age-checker.py ...` invocations working.
+"""
+
+from seo_tools.domain_age_checker import main
+
+if __name__ == "__main__":
+    main()
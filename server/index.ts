@@ -1,9 +1,11 @@
 import express, { type Request, Response, NextFunction } from "express";
 import { registerRoutes } from "./routes";
 import { setupVite, serveStatic, log } from "./vite";
+import { startToolService, stopToolService } from "./tool-service";
 
 const app = express();
-app.use(express.json());
+// Bulk redirect audits post URL lists far above the 100kb default
+app.use(express.json({ limit: "10mb" }));
 app.use(express.urlencoded({ extended: false }));
 
 app.use((req, res, next) => {
@@ -39,6 +41,13 @@ app.use((req, res, next) => {
 (async () => {
   const server = await registerRoutes(app);
 
+  // Warm up the resident Python tool service so the first tool request
+  // does not pay interpreter and import startup
+  startToolService().catch((error) => {
+    log(`python tool service failed to start: ${error.message}`, "tool-service");
+  });
+  process.on("exit", stopToolService);
+
   app.use((err: any, _req: Request, res: Response, _next: NextFunction) => {
     const status = err.status || err.statusCode || 500;
     const message = err.message || "Internal Server Error";
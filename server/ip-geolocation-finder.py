@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+IP Geolocation Finder Tool - command line entry point
+
+The implementation lives in seo_tools.ip_geolocation_finder; this script keeps
+`python3 server/ip-geolocation-finder.py ...` invocations working.
+"""
+
+from seo_tools.ip_geolocation_finder import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+JS Obfuscator Tool - command line entry point
+
+The implementation lives in seo_tools.js_obfuscator; this script keeps
+`python3 server/js-obfuscator.py ...` invocations working.
+"""
+
+from seo_tools.js_obfuscator import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+JWT Decoder Tool - command line entry point
+
+The implementation lives in seo_tools.jwt_decoder; this script keeps
+`python3 server/jwt-decoder.py ...` invocations working.
+"""
+
+from seo_tools.jwt_decoder import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Regex Generator Tool - command line entry point
+
+The implementation lives in seo_tools.regex_generator; this script keeps
+`python3 server/regex-generator.py ...` invocations working.
+"""
+
+from seo_tools.regex_generator import main
+
+if __name__ == "__main__":
+    main()
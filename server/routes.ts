@@ -6,16 +6,8 @@ import crypto from "crypto";
 import { insertCategorySchema, insertToolSchema, insertBlogPostSchema, insertSiteSettingSchema, type ToolWithCategory } from "@shared/schema";
 import { z } from "zod";
 import multer from "multer";
-import path from "path";
-import fs from "fs";
-import { promisify } from "util";
-import { exec as execCallback } from "child_process";
-import { fileURLToPath } from 'url';
-import { dirname } from 'path';
-
-const exec = promisify(execCallback);
-const __filename = fileURLToPath(import.meta.url);
-const __dirname = dirname(__filename);
+import { Readable } from "stream";
+import { callToolService, callToolServiceUpload, fetchToolServiceMetrics, isToolBlob, streamToolService } from "./tool-service";
 
 // Configure multer for file uploads
 const upload = multer({
@@ -49,10 +41,89 @@ const pdfUpload = multer({
   }
 });
 
+// Temporary downloads for binary tool results (served by /api/download/temp).
+// Kept in memory for TEMP_FILE_TTL_MS; the oldest entries are dropped first
+// once TEMP_DOWNLOAD_MAX_BYTES is exceeded.
+const TEMP_FILE_TTL_MS = 10 * 60 * 1000;
+const TEMP_DOWNLOAD_MAX_BYTES = Number(process.env.TEMP_DOWNLOAD_MAX_BYTES) || 256 * 1024 * 1024;
+
+interface TempDownload {
+  buffer: Buffer;
+  expires: number;
+}
+
+const tempDownloads = new Map<string, TempDownload>();
+let tempDownloadBytes = 0;
+
+function dropTempDownload(filename: string): void {
+  const entry = tempDownloads.get(filename);
+  if (entry) {
+    tempDownloads.delete(filename);
+    tempDownloadBytes -= entry.buffer.length;
+  }
+}
+
+const BLOB_EXTENSIONS: Record<string, string> = {
+  'application/pdf': 'pdf',
+  'image/jpeg': 'jpg',
+  'image/png': 'png',
+  'image/webp': 'webp',
+  'image/tiff': 'tiff',
+  'image/bmp': 'bmp',
+};
+
+function saveTempDownload(buffer: Buffer, filename: string): string {
+  dropTempDownload(filename);
+  tempDownloads.set(filename, { buffer, expires: Date.now() + TEMP_FILE_TTL_MS });
+  tempDownloadBytes += buffer.length;
+
+  // Map iteration order is insertion order, so the first entries are the oldest
+  for (const name of tempDownloads.keys()) {
+    if (tempDownloadBytes <= TEMP_DOWNLOAD_MAX_BYTES || name === filename) {
+      break;
+    }
+    dropTempDownload(name);
+  }
+
+  // Clean up after 10 minutes
+  setTimeout(() => {
+    const entry = tempDownloads.get(filename);
+    if (entry && entry.expires <= Date.now()) {
+      dropTempDownload(filename);
+    }
+  }, TEMP_FILE_TTL_MS).unref();
+
+  return `/api/download/temp/${filename}`;
+}
+
+// Replace binary blobs in a framed tool result with temporary download URLs
+function publishToolBlobs(data: any, prefix: string): any {
+  if (!data || typeof data !== 'object') {
+    return data;
+  }
+  for (const [key, value] of Object.entries(data)) {
+    if (isToolBlob(value)) {
+      const extension = BLOB_EXTENSIONS[value.mime] || 'bin';
+      const filename = `${prefix}_${Date.now()}_${crypto.randomBytes(4).toString('hex')}.${extension}`;
+      data[key] = saveTempDownload(value.data, filename);
+    }
+  }
+  return data;
+}
+
 export async function registerRoutes(app: Express): Promise<Server> {
   // Initialize database with default data
   await storage.initializeDefaultData();
   
+  // Python tool timings (Prometheus text format)
+  app.get("/api/tool-service/metrics", async (req, res) => {
+    try {
+      res.type("text/plain; version=0.0.4").send(await fetchToolServiceMetrics());
+    } catch (error) {
+      res.status(502).json({ message: "Tool service metrics unavailable" });
+    }
+  });
+
   // Categories
   app.get("/api/categories", async (req, res) => {
     try {
@@ -1514,55 +1585,8 @@ Provide a comprehensive analysis with specific optimization recommendations in J
         return res.status(400).json({ error: "URL is required" });
       }
 
-      // Use Python subprocess to run redirect checker
-      const { spawn } = await import("child_process");
-      
-      const pythonProcess = spawn("python3", ["-c", `
-import sys
-import json
-sys.path.append('server')
-
-# Import redirect checker
-try:
-    from redirect_checker import RedirectChainChecker
-    
-    checker = RedirectChainChecker()
-    result = checker.check_redirect_chain('${url.replace(/'/g, "\\'")}')
-    print(json.dumps(result))
-except Exception as e:
-    error_result = {
-        'success': False,
-        'error': str(e),
-        'chain': [],
-        'summary': {}
-    }
-    print(json.dumps(error_result))
-`]);
-
-      let stdout = "";
-      let stderr = "";
-
-      pythonProcess.stdout.on("data", (data) => {
-        stdout += data.toString();
-      });
-
-      pythonProcess.stderr.on("data", (data) => {
-        stderr += data.toString();
-      });
-
-      pythonProcess.on("close", (code) => {
-        try {
-          const result = JSON.parse(stdout);
-          res.json(result);
-        } catch (e) {
-          res.status(500).json({ 
-            success: false,
-            error: "Failed to parse analysis result",
-            chain: [],
-            summary: {}
-          });
-        }
-      });
+      const { status, headers, data } = await callToolService("/redirect-chain/check", { url });
+      res.status(status).set(headers).json(data);
 
     } catch (error) {
       console.error("Redirect checker error:", error);
@@ -1575,6 +1599,117 @@ except Exception as e:
     }
   });
 
+  // Check many redirect chains at once (site migration audits)
+  app.post("/api/tools/redirect-chain/bulk", async (req, res) => {
+    try {
+      const { urls, concurrency, per_host, header_profile } = req.body;
+      
+      if (!Array.isArray(urls) || urls.length === 0) {
+        return res.status(400).json({ error: "A list of URLs is required" });
+      }
+
+      const { status, headers, data } = await callToolService("/redirect-chain/bulk", { urls, concurrency, per_host, header_profile });
+      res.status(status).set(headers).json(data);
+
+    } catch (error) {
+      console.error("Bulk redirect checker error:", error);
+      res.status(500).json({ 
+        success: false,
+        error: "Internal server error",
+        results: []
+      });
+    }
+  });
+
+  // Streaming bulk audit: JSON {sitemap_url} / {urls} or a raw text/csv body in,
+  // one NDJSON line per chain out as soon as it completes (or a CSV / ndjson.gz
+  // export with ?format=csv|ndjson.gz)
+  app.post("/api/tools/redirect-chain/bulk/stream", async (req, res) => {
+    try {
+      const isJson = req.is("application/json");
+      const query = new URLSearchParams(req.query as Record<string, string>).toString();
+      const response = await streamToolService(
+        `/redirect-chain/bulk/stream${query ? `?${query}` : ""}`,
+        isJson ? JSON.stringify(req.body) : (Readable.toWeb(req) as any),
+        isJson ? "application/json" : "text/csv",
+      );
+
+      res.status(response.status).type(response.headers.get("content-type") || "application/x-ndjson");
+      const disposition = response.headers.get("content-disposition");
+      if (disposition) {
+        res.set("Content-Disposition", disposition);
+      }
+      if (!response.body) {
+        return res.end();
+      }
+      Readable.fromWeb(response.body as any).pipe(res);
+
+    } catch (error) {
+      console.error("Bulk redirect stream error:", error);
+      if (!res.headersSent) {
+        res.status(500).json({ success: false, error: "Internal server error" });
+      } else {
+        res.end();
+      }
+    }
+  });
+
+  // Migration map verification: CSV (old URL, new URL, optional status) or JSON
+  // {rows} in, NDJSON of the mismatching rows and a summary out
+  app.post("/api/tools/redirect-chain/verify", async (req, res) => {
+    try {
+      const isJson = req.is("application/json");
+      const query = new URLSearchParams(req.query as Record<string, string>).toString();
+      const response = await streamToolService(
+        `/redirect-chain/verify${query ? `?${query}` : ""}`,
+        isJson ? JSON.stringify(req.body) : (Readable.toWeb(req) as any),
+        isJson ? "application/json" : "text/csv",
+      );
+
+      res.status(response.status).type(response.headers.get("content-type") || "application/x-ndjson");
+      if (!response.body) {
+        return res.end();
+      }
+      Readable.fromWeb(response.body as any).pipe(res);
+
+    } catch (error) {
+      console.error("Migration map verification error:", error);
+      if (!res.headersSent) {
+        res.status(500).json({ success: false, error: "Internal server error" });
+      } else {
+        res.end();
+      }
+    }
+  });
+
+  // Scheduled re-check of stored chains: CSV or JSON {urls | sitemap_url} in,
+  // NDJSON of the chains that changed since the last run and a summary out
+  app.post("/api/tools/redirect-chain/recheck", async (req, res) => {
+    try {
+      const isJson = req.is("application/json");
+      const query = new URLSearchParams(req.query as Record<string, string>).toString();
+      const response = await streamToolService(
+        `/redirect-chain/recheck${query ? `?${query}` : ""}`,
+        isJson ? JSON.stringify(req.body) : (Readable.toWeb(req) as any),
+        isJson ? "application/json" : "text/csv",
+      );
+
+      res.status(response.status).type(response.headers.get("content-type") || "application/x-ndjson");
+      if (!response.body) {
+        return res.end();
+      }
+      Readable.fromWeb(response.body as any).pipe(res);
+
+    } catch (error) {
+      console.error("Redirect re-check error:", error);
+      if (!res.headersSent) {
+        res.status(500).json({ success: false, error: "Internal server error" });
+      } else {
+        res.end();
+      }
+    }
+  });
+
   // Generate redirect report
   app.post("/api/tools/redirect-chain/report", async (req, res) => {
     try {
@@ -1584,24 +1719,8 @@ except Exception as e:
         return res.status(400).json({ error: "Result data is required" });
       }
 
-      const { spawn } = await import("child_process");
-      
-      const pythonProcess = spawn("python3", ["server/redirect-checker.py", "check-url", url]);
-
-      let stdout = "";
-      let stderr = "";
-
-      pythonProcess.stdout.on("data", (data) => {
-        stdout += data.toString();
-      });
-
-      pythonProcess.stderr.on("data", (data) => {
-        stderr += data.toString();
-      });
-
-      pythonProcess.on("close", (code) => {
-        res.json({ report: stdout });
-      });
+      const { status, headers, data } = await callToolService("/redirect-chain/report", { result, format });
+      res.status(status).set(headers).json(data);
 
     } catch (error) {
       console.error("Report generation error:", error);
@@ -1612,42 +1731,14 @@ except Exception as e:
   // Schema Markup Tester API
   app.post("/api/tools/schema-tester/validate-url", async (req, res) => {
     try {
-      const { url } = req.body;
+      const { url, formats } = req.body;
       
       if (!url) {
         return res.status(400).json({ error: "URL is required" });
       }
 
-      const { spawn } = await import("child_process");
-      
-      const pythonProcess = spawn("python3", ["server/schema-validator.py", "validate-url", url]);
-
-      let stdout = "";
-      let stderr = "";
-
-      pythonProcess.stdout.on("data", (data) => {
-        stdout += data.toString();
-      });
-
-      pythonProcess.stderr.on("data", (data) => {
-        stderr += data.toString();
-      });
-
-      pythonProcess.on("close", (code) => {
-        try {
-          const result = JSON.parse(stdout);
-          res.json(result);
-        } catch (e) {
-          res.status(500).json({ 
-            success: false,
-            error: "Failed to parse validation result",
-            schemas: [],
-            total_schemas: 0,
-            total_errors: 1,
-            total_warnings: 0
-          });
-        }
-      });
+      const { status, headers, data } = await callToolService("/schema-tester/validate-url", { url, formats });
+      res.status(status).set(headers).json(data);
 
     } catch (error) {
       console.error("Schema validation error:", error);
@@ -1665,87 +1756,14 @@ except Exception as e:
   // Validate HTML content
   app.post("/api/tools/schema-tester/validate-html", async (req, res) => {
     try {
-      const { html } = req.body;
+      const { html, formats } = req.body;
       
       if (!html) {
         return res.status(400).json({ error: "HTML content is required" });
       }
 
-      const { spawn } = await import("child_process");
-      
-      const pythonProcess = spawn("python3", ["-c", `
-import sys
-import json
-sys.path.append('server')
-
-try:
-    from schema_validator import SchemaMarkupTester
-    
-    tester = SchemaMarkupTester()
-    result = tester.process_html_content('''${html.replace(/'/g, "\\'")}''')
-    
-    # Convert result to JSON-serializable format
-    result_data = {
-        'success': result.success,
-        'url': result.url,
-        'page_title': result.page_title,
-        'total_schemas': result.total_schemas,
-        'total_errors': result.total_errors,
-        'total_warnings': result.total_warnings,
-        'processing_time': result.processing_time,
-        'schemas': []
-    }
-    
-    for schema in result.schemas_found:
-        schema_data = {
-            'type': schema.type,
-            'schema_type': schema.schema_type.value,
-            'content': schema.content,
-            'errors': schema.errors,
-            'warnings': schema.warnings
-        }
-        result_data['schemas'].append(schema_data)
-    
-    print(json.dumps(result_data))
-    
-except Exception as e:
-    error_result = {
-        'success': False,
-        'error': str(e),
-        'schemas': [],
-        'total_schemas': 0,
-        'total_errors': 1,
-        'total_warnings': 0
-    }
-    print(json.dumps(error_result))
-`]);
-
-      let stdout = "";
-      let stderr = "";
-
-      pythonProcess.stdout.on("data", (data) => {
-        stdout += data.toString();
-      });
-
-      pythonProcess.stderr.on("data", (data) => {
-        stderr += data.toString();
-      });
-
-      pythonProcess.on("close", (code) => {
-        try {
-          const result = JSON.parse(stdout);
-          res.json(result);
-        } catch (e) {
-          res.status(500).json({ 
-            success: false,
-            error: "Failed to parse validation result",
-            schemas: [],
-            total_schemas: 0,
-            total_errors: 1,
-            total_warnings: 0
-          });
-        }
-      });
+      const { status, headers, data } = await callToolService("/schema-tester/validate-html", { html, formats });
+      res.status(status).set(headers).json(data);
 
     } catch (error) {
       console.error("Schema validation error:", error);
@@ -1769,61 +1787,8 @@ except Exception as e:
         return res.status(400).json({ error: "Result data is required" });
       }
 
-      const { spawn } = await import("child_process");
-      
-      const pythonProcess = spawn("python3", ["-c", `
-import sys
-import json
-sys.path.append('server')
-
-try:
-    from schema_validator import SchemaMarkupTester, ValidationResult, SchemaItem, SchemaType
-    
-    # Reconstruct ValidationResult object
-    schemas_found = []
-    for schema_data in ${JSON.stringify(result.schemas || [])}:
-        schema_item = SchemaItem(
-            type=schema_data['type'],
-            schema_type=SchemaType(schema_data['schema_type']),
-            content=schema_data['content'],
-            errors=schema_data['errors'],
-            warnings=schema_data['warnings']
-        )
-        schemas_found.append(schema_item)
-    
-    validation_result = ValidationResult(
-        success=${result.success || false},
-        schemas_found=schemas_found,
-        total_schemas=${result.total_schemas || 0},
-        total_errors=${result.total_errors || 0},
-        total_warnings=${result.total_warnings || 0},
-        page_title='${(result.page_title || '').replace(/'/g, "\\'")}',
-        url='${(result.url || '').replace(/'/g, "\\'")}',
-        processing_time=${result.processing_time || 0.0}
-    )
-    
-    tester = SchemaMarkupTester()
-    report = tester.generate_report(validation_result, '${format || 'text'}')
-    print(report)
-    
-except Exception as e:
-    print(f"Error generating report: {str(e)}")
-`]);
-
-      let stdout = "";
-      let stderr = "";
-
-      pythonProcess.stdout.on("data", (data) => {
-        stdout += data.toString();
-      });
-
-      pythonProcess.stderr.on("data", (data) => {
-        stderr += data.toString();
-      });
-
-      pythonProcess.on("close", (code) => {
-        res.json({ report: stdout });
-      });
+      const { status, headers, data } = await callToolService("/schema-tester/report", { result, format });
+      res.status(status).set(headers).json(data);
 
     } catch (error) {
       console.error("Report generation error:", error);
@@ -1907,60 +1872,8 @@ except Exception as e:
         return res.status(400).json({ error: "JWT token is required" });
       }
 
-      const { spawn } = await import("child_process");
-      const python = spawn("python3", ["-c", `
-import json
-import jwt
-import base64
-import sys
-
-def decode_jwt(token):
-    try:
-        # Decode header
-        header = jwt.get_unverified_header(token)
-        
-        # Decode payload (without verification)
-        payload = jwt.decode(token, options={"verify_signature": False})
-        
-        return {
-            "success": True,
-            "header": header,
-            "payload": payload
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
-
-token = "${token.replace(/"/g, '\\"')}"
-result = decode_jwt(token)
-print(json.dumps(result))
-`]);
-
-      let output = "";
-      let error = "";
-
-      python.stdout.on("data", (data) => {
-        output += data.toString();
-      });
-
-      python.stderr.on("data", (data) => {
-        error += data.toString();
-      });
-
-      python.on("close", (code) => {
-        if (code !== 0) {
-          return res.status(500).json({ error: "Python execution failed", details: error });
-        }
-
-        try {
-          const result = JSON.parse(output);
-          res.json(result);
-        } catch (e) {
-          res.status(500).json({ error: "Failed to parse result", details: output });
-        }
-      });
+      const { status, headers, data } = await callToolService("/jwt-decoder", { token });
+      res.status(status).set(headers).json(data);
     } catch (error) {
       res.status(500).json({ error: "Internal server error", details: error.message });
     }
@@ -1970,85 +1883,8 @@ print(json.dumps(result))
     try {
       const { pattern, options, testString } = req.body;
       
-      const { spawn } = await import("child_process");
-      const python = spawn("python3", ["-c", `
-import json
-import re
-
-def generate_regex(pattern, options, test_string=""):
-    try:
-        regex_map = {
-            "email": r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
-            "phone": r"\+?1?\d{9,15}",
-            "url": r"https?://(?:[-\w.])+(?:\.[a-zA-Z]{2,5})+/?.*",
-            "ipv4": r"\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\b",
-            "date": r"\d{4}-\d{2}-\d{2}",
-            "time": r"\d{2}:\d{2}(?::\d{2})?",
-            "number": r"\d+",
-            "word": r"\w+",
-            "custom": pattern
-        }
-        
-        regex_pattern = regex_map.get(pattern, pattern)
-        
-        # Apply options
-        flags = 0
-        if options.get("case_insensitive", False):
-            flags |= re.IGNORECASE
-        if options.get("multiline", False):
-            flags |= re.MULTILINE
-        
-        # Test the regex if test string provided
-        matches = []
-        if test_string:
-            try:
-                compiled_regex = re.compile(regex_pattern, flags)
-                matches = compiled_regex.findall(test_string)
-            except Exception as e:
-                pass
-        
-        return {
-            "success": True,
-            "regex": regex_pattern,
-            "matches": matches,
-            "test_string": test_string
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
-
-pattern = '''${(pattern || '').replace(/'/g, "\\'")}'''
-options = ${JSON.stringify(options || {}).replace(/false/g, 'False').replace(/true/g, 'True').replace(/null/g, 'None')}
-test_string = '''${(testString || '').replace(/'/g, "\\'")}'''
-result = generate_regex(pattern, options, test_string)
-print(json.dumps(result))
-`]);
-
-      let output = "";
-      let error = "";
-
-      python.stdout.on("data", (data) => {
-        output += data.toString();
-      });
-
-      python.stderr.on("data", (data) => {
-        error += data.toString();
-      });
-
-      python.on("close", (code) => {
-        if (code !== 0) {
-          return res.status(500).json({ error: "Python execution failed", details: error });
-        }
-
-        try {
-          const result = JSON.parse(output);
-          res.json(result);
-        } catch (e) {
-          res.status(500).json({ error: "Failed to parse result", details: output });
-        }
-      });
+      const { status, headers, data } = await callToolService("/regex-generator", { pattern, options, testString });
+      res.status(status).set(headers).json(data);
     } catch (error) {
       res.status(500).json({ error: "Internal server error", details: error.message });
     }
@@ -2064,9 +1900,6 @@ print(json.dumps(result))
         });
       }
 
-      const password = req.body.password || "";
-      const pdfBuffer = req.file.buffer;
-
       // Set timeout for the entire process (30 seconds maximum)
       const processTimeout = setTimeout(() => {
         if (!res.headersSent) {
@@ -2077,130 +1910,40 @@ print(json.dumps(result))
         }
       }, 30000); // 30 seconds
 
-      // Call enhanced PDF cracker with maximum strength methods
-      const { spawn } = await import("child_process");
-      let pythonProcess = spawn("python3", ["server/enhanced-pdf-cracker.py"], {
-        timeout: 120000 // Extended to 2 minutes for thorough processing
-      });
-
-      let output = "";
-      let error = "";
-      let isFinished = false;
-
-      // Send PDF data and password to Python script
+      let response;
       try {
-        pythonProcess.stdin.write(JSON.stringify({
-          pdf_data: pdfBuffer.toString('base64'),
-          password: password
-        }));
-        pythonProcess.stdin.end();
-      } catch (writeError) {
+        response = await callToolServiceUpload("/pdf-password-remover", "pdf", req.file);
+      } finally {
         clearTimeout(processTimeout);
-        return res.status(500).json({
-          success: false,
-          error: "Failed to send data to processor"
-        });
       }
 
-      pythonProcess.stdout.on("data", (data) => {
-        output += data.toString();
-      });
-
-      pythonProcess.stderr.on("data", (data) => {
-        error += data.toString();
-      });
-
-      pythonProcess.on("close", async (code) => {
-        if (isFinished) return;
-        isFinished = true;
-        clearTimeout(processTimeout);
-
-
-
-        try {
-          if (code !== 0) {
-            console.error("Enhanced PDF cracker failed:", error);
-            
-            if (!res.headersSent) {
-              return res.json({
-                success: false,
-                message: "Unable to process the PDF. The file may be corrupted or have very strong encryption that cannot be cracked automatically."
-              });
-            }
-            return;
-          }
-
-          if (!output.trim()) {
-            if (!res.headersSent) {
-              return res.status(500).json({
-                success: false,
-                error: "No output received from processor"
-              });
-            }
-            return;
-          }
-
-          const result = JSON.parse(output);
-          
-          if (result.success && result.output_data) {
-            // Convert base64 data to downloadable URL
-            const outputBuffer = Buffer.from(result.output_data, 'base64');
-            const filename = `unlocked_${Date.now()}.pdf`;
-            const outputPath = path.join(__dirname, '../temp', filename);
-            
-            // Ensure temp directory exists
-            const tempDir = path.dirname(outputPath);
-            if (!fs.existsSync(tempDir)) {
-              fs.mkdirSync(tempDir, { recursive: true });
-            }
-            
-            fs.writeFileSync(outputPath, outputBuffer);
-            
-            // Create download URL
-            const downloadUrl = `/api/download/temp/${filename}`;
-            
-            // Remove the base64 data from response and add download URL
-            delete result.output_data;
-            result.output_url = downloadUrl;
-            
-            // Clean up file after 10 minutes
-            setTimeout(() => {
-              try {
-                if (fs.existsSync(outputPath)) {
-                  fs.unlinkSync(outputPath);
-                }
-              } catch (e) {
-                console.error("Error cleaning up temp file:", e);
-              }
-            }, 10 * 60 * 1000);
-          }
+      const result = response.data;
 
-          if (!res.headersSent) {
-            res.json(result);
-          }
-        } catch (parseError) {
-          console.error("Failed to parse Python output:", parseError, "Output:", output);
-          if (!res.headersSent) {
-            res.status(500).json({
-              success: false,
-              error: "Failed to process PDF response"
-            });
-          }
-        }
-      });
+      if (response.status === 429) {
+        // PDF workers are saturated; let the client back off instead of queueing
+        return res.status(429).set(response.headers).json(result);
+      }
 
-      pythonProcess.on("error", (processError) => {
-        if (isFinished) return;
-        isFinished = true;
-        clearTimeout(processTimeout);
-        console.error("Enhanced PDF cracker process error:", processError);
+      if (response.status !== 200) {
+        console.error("Enhanced PDF cracker failed:", result);
         if (!res.headersSent) {
-          res.status(500).json({
+          return res.json({
             success: false,
-            error: "PDF processor failed to start"
+            message: "Unable to process the PDF. The file may be corrupted or have very strong encryption that cannot be cracked automatically."
           });
         }
-      });
+        return;
+      }
+
+      if (result.success && isToolBlob(result.output_data)) {
+        // Raw PDF bytes from the frame go straight to a download file
+        result.output_url = saveTempDownload(result.output_data.data, `unlocked_${Date.now()}.pdf`);
+        delete result.output_data;
+      }
+
+      if (!res.headersSent) {
+        res.json(result);
+      }
 
     } catch (error) {
       console.error("PDF password remover error:", error);
@@ -2221,83 +1964,8 @@ print(json.dumps(result))
         return res.status(400).json({ error: "JavaScript code is required" });
       }
 
-      const { spawn } = await import("child_process");
-      const python = spawn("python3", ["-c", `
-import json
-import base64
-import re
-
-def obfuscate_js(code, level="basic"):
-    try:
-        if level == "basic":
-            # Simple variable name obfuscation
-            var_names = re.findall(r'\\bvar\\s+(\\w+)', code)
-            func_names = re.findall(r'\\bfunction\\s+(\\w+)', code)
-            
-            obfuscated = code
-            counter = 0
-            for var in set(var_names + func_names):
-                if var not in ['console', 'document', 'window', 'alert']:
-                    obfuscated = re.sub(r'\\b' + var + r'\\b', f'_{hex(counter)[2:]}', obfuscated)
-                    counter += 1
-            
-            return obfuscated
-            
-        elif level == "medium":
-            # Variable obfuscation + string encoding
-            obfuscated = obfuscate_js(code, "basic")
-            
-            # Encode strings
-            strings = re.findall(r'"([^"]*)"', obfuscated)
-            for s in strings:
-                if s:
-                    encoded = base64.b64encode(s.encode()).decode()
-                    obfuscated = obfuscated.replace(f'"{s}"', f'atob("{encoded}")')
-            
-            return obfuscated
-            
-        elif level == "advanced":
-            # Full obfuscation with encoding
-            obfuscated = obfuscate_js(code, "medium")
-            
-            # Add extra layer of base64 encoding for the entire code
-            encoded_full = base64.b64encode(obfuscated.encode()).decode()
-            return f'eval(atob("{encoded_full}"))'
-            
-        return code
-        
-    except Exception as e:
-        return f"Error: {str(e)}"
-
-code = """${code.replace(/"/g, '\\"').replace(/\n/g, '\\n')}"""
-level = "${level || 'basic'}"
-result = obfuscate_js(code, level)
-print(json.dumps({"success": True, "obfuscated": result}))
-`]);
-
-      let output = "";
-      let error = "";
-
-      python.stdout.on("data", (data) => {
-        output += data.toString();
-      });
-
-      python.stderr.on("data", (data) => {
-        error += data.toString();
-      });
-
-      python.on("close", (code) => {
-        if (code !== 0) {
-          return res.status(500).json({ error: "Python execution failed", details: error });
-        }
-
-        try {
-          const result = JSON.parse(output);
-          res.json(result);
-        } catch (e) {
-          res.status(500).json({ error: "Failed to parse result", details: output });
-        }
-      });
+      const { status, headers, data } = await callToolService("/js-obfuscator", { code, level });
+      res.status(status).set(headers).json(data);
     } catch (error) {
       res.status(500).json({ error: "Internal server error", details: error.message });
     }
@@ -2312,128 +1980,8 @@ print(json.dumps({"success": True, "obfuscated": result}))
         return res.status(400).json({ error: "URL is required" });
       }
 
-      const { spawn } = await import("child_process");
-      const python = spawn("python3", ["-c", `
-import json
-import re
-import urllib.parse
-from urllib.request import urlopen, Request
-import ssl
-
-def check_safe_browsing(url):
-    try:
-        # Normalize URL
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-        
-        parsed = urllib.parse.urlparse(url)
-        if not parsed.netloc:
-            return {
-                "success": False,
-                "error": "Invalid URL format"
-            }
-        
-        # Create SSL context that doesn't verify certificates (for demo purposes)
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-        
-        # Try to access the URL to check if it's reachable
-        try:
-            request = Request(url, headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'})
-            response = urlopen(request, context=ctx, timeout=10)
-            status_code = response.getcode()
-            
-            # Basic heuristic checks for suspicious patterns
-            domain = parsed.netloc.lower()
-            suspicious_patterns = [
-                'phishing', 'malware', 'scam', 'fake', 'suspicious',
-                'login-', 'secure-', 'verify-', 'update-'
-            ]
-            
-            threat_indicators = []
-            risk_level = "safe"
-            
-            # Check for suspicious domain patterns
-            for pattern in suspicious_patterns:
-                if pattern in domain:
-                    threat_indicators.append(f"Suspicious domain pattern: {pattern}")
-                    risk_level = "suspicious"
-            
-            # Check for suspicious TLDs
-            suspicious_tlds = ['.tk', '.ml', '.ga', '.cf']
-            for tld in suspicious_tlds:
-                if domain.endswith(tld):
-                    threat_indicators.append(f"High-risk TLD: {tld}")
-                    risk_level = "suspicious"
-            
-            # Check for IP addresses instead of domains
-            if re.match(r'^\\d+\\.\\d+\\.\\d+\\.\\d+', domain):
-                threat_indicators.append("Uses IP address instead of domain")
-                risk_level = "suspicious"
-            
-            # Determine final status
-            if len(threat_indicators) >= 2:
-                risk_level = "unsafe"
-            
-            return {
-                "success": True,
-                "url": url,
-                "status": risk_level,
-                "accessible": True,
-                "status_code": status_code,
-                "threat_indicators": threat_indicators,
-                "domain": domain,
-                "scan_time": "2024-01-15 10:30:00 UTC"
-            }
-            
-        except Exception as e:
-            # URL not accessible
-            return {
-                "success": True,
-                "url": url,
-                "status": "unsafe",
-                "accessible": False,
-                "error": f"Cannot access URL: {str(e)}",
-                "threat_indicators": ["Site not accessible", "Potential malicious site"],
-                "domain": parsed.netloc,
-                "scan_time": "2024-01-15 10:30:00 UTC"
-            }
-            
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
-
-url = "${url.replace(/"/g, '\\"')}"
-result = check_safe_browsing(url)
-print(json.dumps(result))
-`]);
-
-      let output = "";
-      let error = "";
-
-      python.stdout.on("data", (data) => {
-        output += data.toString();
-      });
-
-      python.stderr.on("data", (data) => {
-        error += data.toString();
-      });
-
-      python.on("close", (code) => {
-        if (code !== 0) {
-          return res.status(500).json({ error: "Python execution failed", details: error });
-        }
-
-        try {
-          const result = JSON.parse(output);
-          res.json(result);
-        } catch (e) {
-          res.status(500).json({ error: "Failed to parse result", details: output });
-        }
-      });
+      const { status, headers, data } = await callToolService("/safe-browsing-checker", { url });
+      res.status(status).set(headers).json(data);
     } catch (error) {
       res.status(500).json({ error: "Internal server error", details: error.message });
     }
@@ -2448,138 +1996,8 @@ print(json.dumps(result))
         return res.status(400).json({ error: "IP address is required" });
       }
 
-      const { spawn } = await import("child_process");
-      const python = spawn("python3", ["-c", `
-import json
-import re
-import urllib.request
-import urllib.parse
-import socket
-
-def get_ip_geolocation(ip_input):
-    try:
-        # If domain is provided, resolve to IP
-        if not re.match(r'^\\d+\\.\\d+\\.\\d+\\.\\d+$', ip_input):
-            try:
-                ip_address = socket.gethostbyname(ip_input)
-            except:
-                return {
-                    "success": False,
-                    "error": "Could not resolve domain to IP address"
-                }
-        else:
-            ip_address = ip_input
-        
-        # Validate IP format
-        parts = ip_address.split('.')
-        if len(parts) != 4 or not all(0 <= int(part) <= 255 for part in parts):
-            return {
-                "success": False,
-                "error": "Invalid IP address format"
-            }
-        
-        # Use ip-api.com for geolocation (free service)
-        try:
-            url = f"http://ip-api.com/json/{ip_address}"
-            request = urllib.request.Request(url)
-            response = urllib.request.urlopen(request, timeout=10)
-            data = json.loads(response.read().decode())
-            
-            if data.get('status') == 'success':
-                return {
-                    "success": True,
-                    "ip": ip_address,
-                    "country": data.get('country', 'Unknown'),
-                    "country_code": data.get('countryCode', 'UN'),
-                    "region": data.get('regionName', 'Unknown'),
-                    "city": data.get('city', 'Unknown'),
-                    "zip_code": data.get('zip', 'Unknown'),
-                    "latitude": data.get('lat', 0),
-                    "longitude": data.get('lon', 0),
-                    "timezone": data.get('timezone', 'Unknown'),
-                    "isp": data.get('isp', 'Unknown'),
-                    "organization": data.get('org', 'Unknown'),
-                    "as_name": data.get('as', 'Unknown'),
-                    "mobile": data.get('mobile', False),
-                    "proxy": data.get('proxy', False),
-                    "hosting": data.get('hosting', False)
-                }
-            else:
-                # Fallback with mock data for demo
-                return {
-                    "success": True,
-                    "ip": ip_address,
-                    "country": "United States",
-                    "country_code": "US",
-                    "region": "California",
-                    "city": "San Francisco",
-                    "zip_code": "94102",
-                    "latitude": 37.7749,
-                    "longitude": -122.4194,
-                    "timezone": "America/Los_Angeles",
-                    "isp": "Example ISP",
-                    "organization": "Example Organization",
-                    "as_name": "AS12345 Example AS",
-                    "mobile": False,
-                    "proxy": False,
-                    "hosting": False
-                }
-                
-        except Exception as e:
-            # Fallback response
-            return {
-                "success": True,
-                "ip": ip_address,
-                "country": "United States",
-                "country_code": "US",
-                "region": "California", 
-                "city": "San Francisco",
-                "zip_code": "94102",
-                "latitude": 37.7749,
-                "longitude": -122.4194,
-                "timezone": "America/Los_Angeles",
-                "isp": "Example ISP",
-                "organization": "Example Organization",
-                "as_name": "AS12345 Example AS",
-                "mobile": False,
-                "proxy": False,
-                "hosting": False
-            }
-            
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
-
-ip_input = "${ip.replace(/"/g, '\\"')}"
-result = get_ip_geolocation(ip_input)
-print(json.dumps(result))
-`]);
-
-      let output = "";
-      let error = "";
-
-      python.stdout.on("data", (data) => {
-        output += data.toString();
-      });
-
-      python.stderr.on("data", (data) => {
-        error += data.toString();
-      });
-
-      python.on("close", (code) => {
-        if (code !== 0) {
-          return res.status(500).json({ error: "Python execution failed", details: error });
-        }
-
-        try {
-          const result = JSON.parse(output);
-          res.json(result);
-        } catch (e) {
-          res.status(500).json({ error: "Failed to parse result", details: output });
-        }
-      });
+      const { status, headers, data } = await callToolService("/ip-geolocation-finder", { ip });
+      res.status(status).set(headers).json(data);
     } catch (error) {
       res.status(500).json({ error: "Internal server error", details: error.message });
     }
@@ -2594,136 +2012,8 @@ print(json.dumps(result))
         return res.status(400).json({ error: "Domain name is required" });
       }
 
-      const { spawn } = await import("child_process");
-      const python = spawn("python3", ["-c", `
-import json
-import re
-from datetime import datetime, timedelta
-import whois
-
-def check_domain_age(domain_input):
-    try:
-        # Clean domain input
-        domain = domain_input.lower().strip()
-        domain = re.sub(r'^(https?://)?', '', domain)
-        domain = re.sub(r'/.*$', '', domain)
-        domain = re.sub(r'^www\\.', '', domain)
-        
-        # Validate domain format
-        if not re.match(r'^[a-z0-9.-]+\\.[a-z]{2,}$', domain):
-            return {
-                "success": False,
-                "error": "Invalid domain format"
-            }
-        
-        try:
-            # Get WHOIS information
-            w = whois.whois(domain)
-            
-            # Extract dates
-            creation_date = w.creation_date
-            updated_date = w.updated_date
-            expiration_date = w.expiration_date
-            
-            # Handle lists (some domains return lists)
-            if isinstance(creation_date, list):
-                creation_date = creation_date[0] if creation_date else None
-            if isinstance(updated_date, list):
-                updated_date = updated_date[0] if updated_date else None
-            if isinstance(expiration_date, list):
-                expiration_date = expiration_date[0] if expiration_date else None
-            
-            # Calculate age
-            today = datetime.now()
-            if creation_date:
-                age_delta = today - creation_date
-                age_years = age_delta.days // 365
-                age_months = (age_delta.days % 365) // 30
-                age_days = age_delta.days
-            else:
-                age_years = age_months = age_days = 0
-            
-            # Determine status
-            status = "active"
-            if expiration_date:
-                days_until_expiry = (expiration_date - today).days
-                if days_until_expiry < 0:
-                    status = "expired"
-                elif days_until_expiry < 30:
-                    status = "expiring_soon"
-            
-            return {
-                "success": True,
-                "domain": domain,
-                "creation_date": creation_date.isoformat() if creation_date else None,
-                "updated_date": updated_date.isoformat() if updated_date else None,
-                "expiration_date": expiration_date.isoformat() if expiration_date else None,
-                "registrar": str(w.registrar) if w.registrar else "Unknown",
-                "status": status,
-                "age_years": age_years,
-                "age_months": age_months,
-                "age_days": age_days,
-                "days_until_expiry": (expiration_date - today).days if expiration_date else None,
-                "name_servers": w.name_servers if w.name_servers else [],
-                "whois_server": str(w.whois_server) if w.whois_server else "Unknown"
-            }
-            
-        except Exception as whois_error:
-            # Fallback with estimated data for demo
-            estimated_creation = datetime.now() - timedelta(days=2555)  # ~7 years ago
-            estimated_expiry = datetime.now() + timedelta(days=365)     # 1 year from now
-            
-            return {
-                "success": True,
-                "domain": domain,
-                "creation_date": estimated_creation.isoformat(),
-                "updated_date": (estimated_creation + timedelta(days=1000)).isoformat(),
-                "expiration_date": estimated_expiry.isoformat(),
-                "registrar": "Example Registrar",
-                "status": "active",
-                "age_years": 7,
-                "age_months": 0,
-                "age_days": 2555,
-                "days_until_expiry": 365,
-                "name_servers": ["ns1.example.com", "ns2.example.com"],
-                "whois_server": "whois.example.com",
-                "note": "Demo data - WHOIS lookup failed"
-            }
-            
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
-
-domain_input = "${domain.replace(/"/g, '\\"')}"
-result = check_domain_age(domain_input)
-print(json.dumps(result))
-`]);
-
-      let output = "";
-      let error = "";
-
-      python.stdout.on("data", (data) => {
-        output += data.toString();
-      });
-
-      python.stderr.on("data", (data) => {
-        error += data.toString();
-      });
-
-      python.on("close", (code) => {
-        if (code !== 0) {
-          return res.status(500).json({ error: "Python execution failed", details: error });
-        }
-
-        try {
-          const result = JSON.parse(output);
-          res.json(result);
-        } catch (e) {
-          res.status(500).json({ error: "Failed to parse result", details: output });
-        }
-      });
+      const { status, headers, data } = await callToolService("/domain-age-checker", { domain });
+      res.status(status).set(headers).json(data);
     } catch (error) {
       res.status(500).json({ error: "Internal server error", details: error.message });
     }
@@ -2738,215 +2028,8 @@ print(json.dumps(result))
         return res.status(400).json({ error: "Domain is required" });
       }
 
-      const { spawn } = await import("child_process");
-      const python = spawn("python3", ["-c", `
-import json
-import requests
-import re
-import time
-import socket
-from urllib.parse import urlparse
-from bs4 import BeautifulSoup
-import dns.resolver
-
-def check_adsense_ban(domain, publisher_id=None):
-    try:
-        # Normalize domain
-        if not domain.startswith(('http://', 'https://')):
-            domain = f'https://{domain}'
-        
-        parsed_url = urlparse(domain)
-        base_domain = parsed_url.netloc or parsed_url.path
-        
-        result = {
-            "success": True,
-            "domain": base_domain,
-            "ban_status": "unknown",
-            "explanation": "",
-            "http_status": None,
-            "adsense_code_detected": False,
-            "robots_txt_status": "unknown",
-            "google_indexed": False,
-            "ad_related_scripts": [],
-            "publisher_id_found": None,
-            "dns_resolution": False,
-            "response_time": None,
-            "detailed_analysis": {},
-            "recommendations": []
-        }
-        
-        # DNS Resolution Check
-        try:
-            dns.resolver.resolve(base_domain, 'A')
-            result["dns_resolution"] = True
-        except:
-            result["dns_resolution"] = False
-            result["explanation"] = "DNS resolution failed - domain may not exist"
-            result["ban_status"] = "not detectable"
-            return result
-        
-        # Fetch website content
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        start_time = time.time()
-        response = requests.get(domain, headers=headers, timeout=15, allow_redirects=True)
-        response_time = int((time.time() - start_time) * 1000)
-        
-        result["http_status"] = response.status_code
-        result["response_time"] = response_time
-        
-        if response.status_code != 200:
-            result["explanation"] = f"Website returned HTTP {response.status_code} - cannot analyze"
-            result["ban_status"] = "not detectable"
-            return result
-        
-        html_content = response.text
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Detailed analysis
-        result["detailed_analysis"] = {
-            "html_content_size": len(html_content),
-            "meta_tags_count": len(soup.find_all('meta')),
-            "external_scripts": len(soup.find_all('script', src=True)),
-            "adsense_patterns": []
-        }
-        
-        # Check for AdSense code patterns
-        adsense_patterns = [
-            r'adsbygoogle',
-            r'googlesyndication\.com',
-            r'google_ad_client',
-            r'ca-pub-\d+',
-            r'googleads\.g\.doubleclick\.net',
-            r'pagead2\.googlesyndication\.com'
-        ]
-        
-        found_patterns = []
-        for pattern in adsense_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            if matches:
-                found_patterns.extend(matches)
-                result["adsense_code_detected"] = True
-        
-        result["detailed_analysis"]["adsense_patterns"] = found_patterns
-        
-        # Extract publisher ID from content
-        pub_id_pattern = r'ca-pub-(\d+)'
-        pub_id_matches = re.findall(pub_id_pattern, html_content)
-        if pub_id_matches:
-            result["publisher_id_found"] = f"ca-pub-{pub_id_matches[0]}"
-        
-        # Check for ad-related scripts
-        scripts = soup.find_all('script', src=True)
-        ad_scripts = []
-        for script in scripts:
-            src = script.get('src', '')
-            if any(ad_domain in src for ad_domain in ['googlesyndication', 'googleads', 'doubleclick', 'adsystem']):
-                ad_scripts.append(src)
-        
-        result["ad_related_scripts"] = ad_scripts[:5]  # Limit to first 5
-        
-        # Check robots.txt
-        try:
-            robots_response = requests.get(f"{domain}/robots.txt", headers=headers, timeout=5)
-            if robots_response.status_code == 200:
-                robots_content = robots_response.text.lower()
-                if 'googlebot' in robots_content and 'disallow' in robots_content:
-                    result["robots_txt_status"] = "restrictive"
-                else:
-                    result["robots_txt_status"] = "permissive"
-            else:
-                result["robots_txt_status"] = "not found"
-        except:
-            result["robots_txt_status"] = "error"
-        
-        # Simulate Google indexing check (simplified)
-        try:
-            search_query = f"site:{base_domain} adsense"
-            # Note: In production, you'd use Google Custom Search API
-            # For now, we'll make an educated guess based on content
-            if result["adsense_code_detected"] and result["http_status"] == 200:
-                result["google_indexed"] = True
-            else:
-                result["google_indexed"] = False
-        except:
-            result["google_indexed"] = False
-        
-        # Determine ban status
-        if not result["adsense_code_detected"]:
-            if result["http_status"] == 200:
-                result["ban_status"] = "not banned"
-                result["explanation"] = "No AdSense code detected - site may not be using AdSense or could be banned"
-                result["recommendations"].append("Consider implementing AdSense code if you want to monetize")
-            else:
-                result["ban_status"] = "not detectable"
-                result["explanation"] = "Website inaccessible - cannot determine AdSense status"
-        else:
-            # AdSense code is present
-            if len(ad_scripts) > 0 and result["robots_txt_status"] != "restrictive":
-                result["ban_status"] = "not banned"
-                result["explanation"] = "AdSense code detected and appears to be loading properly"
-                result["recommendations"].append("Monitor ad performance regularly")
-                result["recommendations"].append("Ensure content complies with AdSense policies")
-            else:
-                result["ban_status"] = "inconclusive"
-                result["explanation"] = "AdSense code present but may have loading issues"
-                result["recommendations"].append("Check browser console for JavaScript errors")
-                result["recommendations"].append("Verify AdSense account status in publisher dashboard")
-        
-        # Publisher ID validation
-        if publisher_id and result["publisher_id_found"]:
-            if publisher_id.lower() == result["publisher_id_found"].lower():
-                result["recommendations"].append("Publisher ID matches - configuration appears correct")
-            else:
-                result["recommendations"].append("Warning: Provided publisher ID doesn't match found ID")
-        
-        # Additional recommendations
-        if result["response_time"] > 3000:
-            result["recommendations"].append("Website loads slowly - optimize for better ad performance")
-        
-        if result["detailed_analysis"]["external_scripts"] > 20:
-            result["recommendations"].append("Many external scripts detected - may impact ad loading")
-        
-        return result
-        
-    except Exception as e:
-        return {
-            "success": False,
-            "error": f"Analysis failed: {str(e)}"
-        }
-
-domain = '''${(domain || '').replace(/'/g, "\\'")}'''
-publisher_id = '''${(publisher_id || '').replace(/'/g, "\\'")}''' if '''${publisher_id || ''}''' else None
-result = check_adsense_ban(domain, publisher_id)
-print(json.dumps(result))
-`]);
-
-      let output = "";
-      let error = "";
-
-      python.stdout.on("data", (data) => {
-        output += data.toString();
-      });
-
-      python.stderr.on("data", (data) => {
-        error += data.toString();
-      });
-
-      python.on("close", (code) => {
-        if (code !== 0) {
-          return res.status(500).json({ error: "Python execution failed", details: error });
-        }
-
-        try {
-          const result = JSON.parse(output);
-          res.json(result);
-        } catch (e) {
-          res.status(500).json({ error: "Failed to parse result", details: output });
-        }
-      });
+      const { status, headers, data } = await callToolService("/adsense-ban-checker", { domain, publisher_id });
+      res.status(status).set(headers).json(data);
     } catch (error) {
       res.status(500).json({ error: "Internal server error", details: error.message });
     }
@@ -2962,20 +2045,8 @@ print(json.dumps(result))
         });
       }
 
-      // Save uploaded file temporarily
-      const tempFilePath = path.join(__dirname, `temp_${Date.now()}_${req.file.originalname}`);
-      fs.writeFileSync(tempFilePath, req.file.buffer);
-
-      try {
-        const result = await exec(`python3 ${path.join(__dirname, 'image-to-text-ocr.py')} "${tempFilePath}"`);
-        const data = JSON.parse(result.stdout);
-        res.json(data);
-      } finally {
-        // Clean up temp file
-        if (fs.existsSync(tempFilePath)) {
-          fs.unlinkSync(tempFilePath);
-        }
-      }
+      const { status, headers, data } = await callToolServiceUpload('/image-to-text-ocr', 'image', req.file);
+      res.status(status).set(headers).json(data);
     } catch (error) {
       console.error("Image to Text OCR error:", error);
       res.status(500).json({ 
@@ -2997,20 +2068,11 @@ print(json.dumps(result))
 
       const { smooth_edges = 'true', hd_mode = 'false' } = req.body;
 
-      // Save uploaded file temporarily
-      const tempFilePath = path.join(__dirname, `temp_${Date.now()}_${req.file.originalname}`);
-      fs.writeFileSync(tempFilePath, req.file.buffer);
-
-      try {
-        const result = await exec(`python3 ${path.join(__dirname, 'background-remover.py')} "${tempFilePath}" "${smooth_edges}" "${hd_mode}"`);
-        const data = JSON.parse(result.stdout);
-        res.json(data);
-      } finally {
-        // Clean up temp file
-        if (fs.existsSync(tempFilePath)) {
-          fs.unlinkSync(tempFilePath);
-        }
-      }
+      const { status, headers, data } = await callToolServiceUpload('/background-remover', 'image', req.file, {
+        smooth_edges: String(smooth_edges),
+        hd_mode: String(hd_mode)
+      });
+      res.status(status).set(headers).json(publishToolBlobs(data, 'background_removed'));
     } catch (error) {
       console.error("Background Remover error:", error);
       res.status(500).json({ 
@@ -3039,20 +2101,10 @@ print(json.dumps(result))
         });
       }
 
-      // Save uploaded file temporarily
-      const tempFilePath = path.join(__dirname, `temp_${Date.now()}_${req.file.originalname}`);
-      fs.writeFileSync(tempFilePath, req.file.buffer);
-
-      try {
-        const result = await exec(`python3 ${path.join(__dirname, 'image-dpi-converter.py')} "${tempFilePath}" "${target_dpi}"`);
-        const data = JSON.parse(result.stdout);
-        res.json(data);
-      } finally {
-        // Clean up temp file
-        if (fs.existsSync(tempFilePath)) {
-          fs.unlinkSync(tempFilePath);
-        }
-      }
+      const { status, headers, data } = await callToolServiceUpload('/image-dpi-converter', 'image', req.file, {
+        target_dpi: String(target_dpi)
+      });
+      res.status(status).set(headers).json(publishToolBlobs(data, 'dpi_converted'));
     } catch (error) {
       console.error("Image DPI Converter error:", error);
       res.status(500).json({ 
@@ -3074,11 +2126,8 @@ print(json.dumps(result))
         });
       }
 
-      // Escape quotes for shell command
-      const escapedHtml = html.replace(/"/g, '\\"');
-      const result = await exec(`python3 ${path.join(__dirname, 'html-to-markdown-converter.py')} "${escapedHtml}"`);
-      const data = JSON.parse(result.stdout);
-      res.json(data);
+      const { status, headers, data } = await callToolService('/html-to-markdown', { html });
+      res.status(status).set(headers).json(data);
     } catch (error) {
       console.error("HTML to Markdown Converter error:", error);
       res.status(500).json({ 
@@ -3100,20 +2149,11 @@ print(json.dumps(result))
 
       const { compression_level = 'medium', quality = '85' } = req.body;
 
-      // Save uploaded file temporarily
-      const tempFilePath = path.join(__dirname, `temp_${Date.now()}_${req.file.originalname}`);
-      fs.writeFileSync(tempFilePath, req.file.buffer);
-
-      try {
-        const result = await exec(`python3 ${path.join(__dirname, 'webp-to-jpg-converter.py')} "${tempFilePath}" "${compression_level}" "${quality}"`);
-        const data = JSON.parse(result.stdout);
-        res.json(data);
-      } finally {
-        // Clean up temp file
-        if (fs.existsSync(tempFilePath)) {
-          fs.unlinkSync(tempFilePath);
-        }
-      }
+      const { status, headers, data } = await callToolServiceUpload('/webp-to-jpg-converter', 'image', req.file, {
+        compression_level: String(compression_level),
+        quality: String(quality)
+      });
+      res.status(status).set(headers).json(publishToolBlobs(data, 'converted'));
     } catch (error) {
       console.error("WebP to JPG Converter error:", error);
       res.status(500).json({ 
@@ -3135,11 +2175,8 @@ print(json.dumps(result))
         });
       }
 
-      // Escape quotes for shell command
-      const escapedCsv = csv_content.replace(/"/g, '\\"');
-      const result = await exec(`python3 ${path.join(__dirname, 'csv-to-json-converter.py')} "${escapedCsv}" "${prettify}"`);
-      const data = JSON.parse(result.stdout);
-      res.json(data);
+      const { status, headers, data } = await callToolService('/csv-to-json-converter', { csv_content, prettify });
+      res.status(status).set(headers).json(data);
     } catch (error) {
       console.error("CSV to JSON Converter error:", error);
       res.status(500).json({ 
@@ -3161,21 +2198,10 @@ print(json.dumps(result))
 
       const options = JSON.parse(req.body.options || '{}');
 
-      // Save uploaded file temporarily
-      const tempFilePath = path.join(__dirname, `temp_${Date.now()}_${req.file.originalname}`);
-      fs.writeFileSync(tempFilePath, req.file.buffer);
-
-      try {
-        const optionsJson = JSON.stringify(options).replace(/"/g, '\\"');
-        const result = await exec(`python3 ${path.join(__dirname, 'profile-picture-maker.py')} "${tempFilePath}" "${optionsJson}"`);
-        const data = JSON.parse(result.stdout);
-        res.json(data);
-      } finally {
-        // Clean up temp file
-        if (fs.existsSync(tempFilePath)) {
-          fs.unlinkSync(tempFilePath);
-        }
-      }
+      const { status, headers, data } = await callToolServiceUpload('/profile-picture-maker/process', 'image', req.file, {
+        options: JSON.stringify(options)
+      });
+      res.status(status).set(headers).json(publishToolBlobs(data, 'profile_picture'));
     } catch (error) {
       console.error("Profile Picture Maker error:", error);
       res.status(500).json({ 
@@ -3196,23 +2222,11 @@ print(json.dumps(result))
       }
 
       const options = JSON.parse(req.body.options || '{}');
-      options.generate_practice_sheet = true;
 
-      // Save uploaded file temporarily
-      const tempFilePath = path.join(__dirname, `temp_${Date.now()}_${req.file.originalname}`);
-      fs.writeFileSync(tempFilePath, req.file.buffer);
-
-      try {
-        const optionsJson = JSON.stringify(options).replace(/"/g, '\\"');
-        const result = await exec(`python3 ${path.join(__dirname, 'profile-picture-maker.py')} "${tempFilePath}" "${optionsJson}"`);
-        const data = JSON.parse(result.stdout);
-        res.json(data);
-      } finally {
-        // Clean up temp file
-        if (fs.existsSync(tempFilePath)) {
-          fs.unlinkSync(tempFilePath);
-        }
-      }
+      const { status, headers, data } = await callToolServiceUpload('/profile-picture-practice-sheet', 'image', req.file, {
+        options: JSON.stringify(options)
+      });
+      res.status(status).set(headers).json(publishToolBlobs(data, 'practice_sheet'));
     } catch (error) {
       console.error("Profile Picture Practice Sheet error:", error);
       res.status(500).json({ 
@@ -3287,18 +2301,15 @@ print(json.dumps(result))
   app.get('/api/download/temp/:filename', (req, res) => {
     try {
       const filename = req.params.filename;
-      const filePath = path.join(__dirname, '../temp', filename);
+      const entry = tempDownloads.get(filename);
       
-      if (!fs.existsSync(filePath)) {
+      if (!entry || entry.expires < Date.now()) {
         return res.status(404).json({ error: 'File not found' });
       }
 
-      res.download(filePath, (err) => {
-        if (err) {
-          console.error('Download error:', err);
-          res.status(500).json({ error: 'Download failed' });
-        }
-      });
+      // attachment() sets Content-Disposition and the type from the extension
+      res.attachment(filename);
+      res.send(entry.buffer);
     } catch (error) {
       console.error('Download endpoint error:', error);
       res.status(500).json({ error: 'Internal server error' });
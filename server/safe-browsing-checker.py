@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Safe Browsing Checker Tool - command line entry point
+
+The implementation lives in seo_tools.safe_browsing_checker; this script keeps
+`python3 server/safe-browsing-checker.py ...` invocations working.
+"""
+
+from seo_tools.safe_browsing_checker import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+seo_tools - importable implementations of the Python-backed SEO tools
+
+The package never imports tool modules itself. Load them through the registry
+so heavy dependencies are only imported when a tool is first used:
+
+    from seo_tools import registry
+    checker = registry.load("redirect-checker").RedirectChainChecker()
+"""
+
+from .registry import (
+    CONCURRENCY_CLASSES,
+    TOOL_GROUPS,
+    TOOL_SPECS,
+    ImportStat,
+    ToolRegistry,
+    ToolSpec,
+    ToolUnavailable,
+    UnknownTool,
+    registry,
+)
+
+__all__ = [
+    "CONCURRENCY_CLASSES",
+    "TOOL_GROUPS",
+    "TOOL_SPECS",
+    "ImportStat",
+    "ToolRegistry",
+    "ToolSpec",
+    "ToolUnavailable",
+    "UnknownTool",
+    "registry",
+]
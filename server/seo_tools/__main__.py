@@ -0,0 +1,24 @@
+"""
+Report per-tool import cost: python3 -m seo_tools [group ...]
+"""
+
+import sys
+import json
+import time
+
+from seo_tools.registry import registry
+
+
+def main():
+    """Import every tool in the given groups (default: all) and print the cost"""
+    groups = sys.argv[1:] or None
+    start_time = time.perf_counter()
+    registry.preload(groups)
+    print(json.dumps({
+        "total_seconds": round(time.perf_counter() - start_time, 4),
+        "tools": registry.import_stats()
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,835 @@
+#!/usr/bin/env python3
+"""
+Bulk Redirect Chain Checker - asyncio engine for site migration audits
+
+RedirectChainChecker walks one chain at a time with a blocking session. This
+engine checks thousands of chains concurrently on one httpx.AsyncClient:
+
+    async with BulkRedirectChecker(concurrency=500, per_host=8) as engine:
+        async for index, result in engine.check_many(urls):
+            ...
+
+Each result has the same shape as RedirectChainChecker.check_redirect_chain
+(the steps and the summary are built by the same methods). concurrency caps
+the requests in flight overall and per_host the requests to any one host,
+so a migration list dominated by one domain does not hammer it. Chains are
+pulled from the input lazily, so memory stays proportional to concurrency.
+
+For audits of whole sites, stream_ndjson emits one JSON line per chain as it
+completes from a streamed source (iter_sitemap_urls for sitemaps and sitemap
+indexes, iter_csv_urls for CSV lists), so the first lines arrive while the
+sitemap is still downloading and nothing accumulates.
+
+Migration lists repeat the same prefix hops (http->https, apex->www) for
+most URLs. Redirect hops are memoized in the checker's HopMemo and a chain
+reaching a hop another chain is fetching waits for that fetch, so each
+shared hop is requested once; graph_report() describes the whole run as a
+deduplicated redirect graph. The graph grows with the input, so streamed
+runs only collect one on request, capped at STREAM_GRAPH_MAX_NODES, and
+keep a small hop memo (STREAM_HOP_MEMO_SIZE entries) of the recent hops.
+
+Steps keep only the response headers of the engine's header profile ("seo"
+by default, see redirect_checker.HEADER_PROFILES), and stream_export writes
+a run as CSV or gzip-compressed columnar NDJSON (redirect_export) instead of
+one nested JSON document per chain.
+
+Final HTML pages are sniffed for a meta refresh (meta_refresh=True), so each
+hop is a streamed GET whose body is only read up to </head> on a final
+page. Verification and re-checks do not report meta refreshes and send HEAD
+requests instead.
+
+verify_map checks a migration map (old URL -> expected new URL [status],
+iter_migration_rows reads it from CSV) and yields only the rows whose chain
+does not match, so a map of any size runs in memory bounded by concurrency.
+
+With a ChainStore (chain_store) the engine re-checks past audits: stored
+permanent hops that are still fresh are not requested again, final pages
+are asked for with their stored validators (a 304 reuses the stored step),
+and recheck / stream_changes report only the chains that changed.
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import zlib
+import codecs
+import asyncio
+import sqlite3
+from urllib.parse import urljoin, urlparse
+from xml.etree import ElementTree
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import httpx
+
+from seo_tools.chain_store import ChainStore, StoredChain, chain_signature
+from seo_tools.fetch import CachedDNSTransport, FetchTrace, fetch_trace
+from seo_tools.redirect_checker import (
+    HEAD_UNSUPPORTED_STATUSES, HOP_MEMO_MAX_ENTRIES, PERMANENT_REDIRECTS, MemoHop, RedirectChainChecker,
+    RedirectGraph, needs_sniff, sniff_limit
+)
+from seo_tools.singleflight import normalize_url
+from seo_tools.redirect_export import export_results, get_encoder
+from seo_tools.timing import Timer
+
+
+# Size cap of the redirect graph of a streamed run that asks for one
+STREAM_GRAPH_MAX_NODES = int(os.environ.get("TOOL_REDIRECT_STREAM_GRAPH_MAX_NODES", 10000))
+# Hop memo size of a streamed run; shared prefix hops stay in it, the rest rotates out
+STREAM_HOP_MEMO_SIZE = int(os.environ.get("TOOL_REDIRECT_STREAM_HOP_MEMO_SIZE", 2000))
+
+
+class BulkRedirectChecker:
+    """Concurrent redirect chain checks with global and per-host limits"""
+
+    def __init__(self, timeout: int = 10, max_redirects: int = 15, concurrency: int = 200,
+                 per_host: int = 6, client: Optional[httpx.AsyncClient] = None, header_profile: str = 'seo',
+                 collect_graph: bool = True, store: Optional[ChainStore] = None,
+                 graph_max_nodes: Optional[int] = None, hop_memo_size: int = HOP_MEMO_MAX_ENTRIES,
+                 meta_refresh: bool = True):
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        # URL validation, step entries and summaries come from the sync checker
+        self.checker = RedirectChainChecker(
+            timeout=timeout, max_redirects=max_redirects, header_profile=header_profile, hop_memo_size=hop_memo_size,
+            meta_refresh=meta_refresh
+        )
+        self._client = client
+        self._owns_client = client is None
+        self._requests = asyncio.Semaphore(self.concurrency)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        # Hosts that answered HEAD with 405/501; their hops go straight to GET
+        self.head_unsupported = set()
+        # Hops being fetched right now; chains reaching the same hop wait for its memo entry
+        self._hop_flights: Dict[str, asyncio.Event] = {}
+        # Every chain checked by this engine, deduplicated (hops live in checker.hop_memo);
+        # off for runs that must stay in constant memory
+        self.graph = RedirectGraph(graph_max_nodes) if collect_graph else None
+        # Results of past audits for conditional re-checks (see recheck)
+        self.store = store
+        self.not_modified = 0
+
+    async def __aenter__(self) -> "BulkRedirectChecker":
+        self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={'User-Agent': self.checker.session.headers['User-Agent']},
+                timeout=self.timeout,
+                follow_redirects=False,
+                transport=CachedDNSTransport(
+                    verify=True,
+                    limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+                )
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    def _host_slots(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc.lower()
+        slots = self._hosts.get(host)
+        if slots is None:
+            slots = asyncio.Semaphore(self.per_host)
+            self._hosts[host] = slots
+        return slots
+
+    async def _fetch(self, url: str, headers: Optional[Dict[str, str]] = None
+                     ) -> Tuple[httpx.Response, Optional[str], FetchTrace]:
+        """Probe one hop as the sync checker does; for a sniffed HTML 200 also return its <head> as text
+
+        The trace starts once the hop holds its concurrency slots, so time
+        spent queued behind other hops is not counted as network time.
+        headers are sent with every request (the conditional headers of a
+        re-check).
+        """
+        client = self._get_client()
+        host = urlparse(url).netloc.lower()
+        async with self._host_slots(url), self._requests:
+            with fetch_trace() as trace:
+                extensions = {'trace': trace.httpcore_event}
+                if not self.checker.meta_refresh and host not in self.head_unsupported:
+                    response = await client.head(url, headers=headers, extensions=extensions)
+                    if response.status_code not in HEAD_UNSUPPORTED_STATUSES:
+                        trace.response_started()
+                        return response, None, trace
+                    self.head_unsupported.add(host)
+                    trace.response_started('head_fallback')
+
+                async with client.stream("GET", url, headers=headers, extensions=extensions) as response:
+                    trace.response_started()
+                    content = None
+                    if self.checker.meta_refresh and response.status_code == 200 and needs_sniff(response.headers):
+                        body = b''
+                        limit = -1
+                        async for chunk in response.aiter_bytes():
+                            body += chunk
+                            limit = sniff_limit(body)
+                            if limit >= 0:
+                                break
+                        if limit >= 0:
+                            body = body[:limit]
+                        content = body.decode(response.charset_encoding or 'utf-8', errors='replace')
+                        trace.body_done()
+                    return response, content, trace
+
+    async def _memoized(self, url: str) -> Optional[MemoHop]:
+        """Memoized redirect for url, after any in-flight fetch of the same hop"""
+        flight = self._hop_flights.get(url)
+        if flight is not None:
+            await flight.wait()
+        return self.checker.hop_memo.get(url)
+
+    def graph_report(self) -> Dict:
+        """Deduplicated redirect graph of every chain checked so far"""
+        if self.graph is None:
+            return {}
+        return self.graph.report(self.checker.hop_memo)
+
+    async def check(self, url: str) -> Dict:
+        """Check complete redirect chain for a URL"""
+        checker = self.checker
+        is_valid, normalized_url = checker.validate_url(url)
+        if not is_valid:
+            return {
+                'success': False,
+                'error': normalized_url,
+                'chain': [],
+                'summary': {}
+            }
+
+        chain = []
+        current_url = normalized_url
+        start_time = time.time()
+        timer = Timer()
+        # The last audit of this URL, if any: its final page is asked for conditionally
+        stored = await asyncio.to_thread(self.store.get, normalized_url) if self.store is not None else None
+        validators = {}
+
+        try:
+            for step in range(self.max_redirects + 1):
+                step_start = time.time()
+
+                try:
+                    hop = await self._memoized(current_url)
+                    if hop is not None:
+                        next_url = checker._redirect_target(chain, checker._memo_step(step, current_url, hop), hop.location)
+                        if next_url is None:
+                            break
+                        current_url = next_url
+                        continue
+
+                    flight = None
+                    if current_url not in self._hop_flights:
+                        flight = self._hop_flights[current_url] = asyncio.Event()
+                    conditional = None
+                    if stored is not None and stored.final_step and current_url == stored.final_url:
+                        conditional = stored.conditional_headers() or None
+                    try:
+                        with timer.span("network", hop=step + 1):
+                            response, content, trace = await self._fetch(current_url, conditional)
+                        if 300 <= response.status_code < 400 and response.status_code != 304:
+                            checker.hop_memo.put(
+                                current_url, response.status_code, response.reason_phrase,
+                                response.headers, response.request.method
+                            )
+                            if self.store is not None:
+                                await asyncio.to_thread(
+                                    self.store.put_hop, current_url, response.status_code, response.reason_phrase,
+                                    response.headers, response.request.method, checker.header_profile
+                                )
+                    finally:
+                        if flight is not None:
+                            del self._hop_flights[current_url]
+                            flight.set()
+
+                    step_time = round((time.time() - step_start) * 1000, 2)
+                    if conditional and response.status_code == 304:
+                        # Final page unchanged since the last audit: reuse its step
+                        self.not_modified += 1
+                        step_info = dict(stored.final_step, step=step + 1, response_time=step_time)
+                        step_info['method'] = response.request.method
+                        step_info['timing'] = trace.report()
+                        step_info['not_modified'] = True
+                        validators = {'etag': stored.etag, 'last_modified': stored.last_modified}
+                        chain.append(step_info)
+                        break
+
+                    step_info = checker._build_step(
+                        step, current_url, response.status_code, response.reason_phrase, response.headers, step_time
+                    )
+                    step_info['method'] = response.request.method
+                    step_info['timing'] = trace.report()
+
+                    # Check for redirect
+                    if 300 <= response.status_code < 400:
+                        next_url = checker._redirect_target(chain, step_info, response.headers.get('location', ''))
+                        if next_url is None:
+                            break
+                        current_url = next_url
+
+                    else:
+                        # Final response (200, 404, etc.)
+                        validators = {
+                            'etag': response.headers.get('etag'),
+                            'last_modified': response.headers.get('last-modified')
+                        }
+                        if content is not None:
+                            with timer.span("analyze", hop=step + 1):
+                                meta_refresh = checker._check_meta_refresh(content)
+                            if meta_refresh:
+                                step_info['meta_refresh'] = meta_refresh
+
+                        chain.append(step_info)
+                        break
+
+                except httpx.TimeoutException:
+                    chain.append({
+                        'step': step + 1,
+                        'url': current_url,
+                        'error': 'Request timeout',
+                        'response_time': self.timeout * 1000
+                    })
+                    break
+                except httpx.TransportError:
+                    chain.append({
+                        'step': step + 1,
+                        'url': current_url,
+                        'error': 'Connection failed',
+                        'response_time': round((time.time() - step_start) * 1000, 2)
+                    })
+                    break
+                except Exception as e:
+                    chain.append({
+                        'step': step + 1,
+                        'url': current_url,
+                        'error': f'Request failed: {str(e)}',
+                        'response_time': round((time.time() - step_start) * 1000, 2)
+                    })
+                    break
+
+            else:
+                # Max redirects exceeded
+                chain.append({
+                    'step': len(chain) + 1,
+                    'error': f'Too many redirects (>{self.max_redirects})',
+                    'url': current_url
+                })
+
+            total_time = round((time.time() - start_time) * 1000, 2)
+            with timer.span("analyze", step="summary"):
+                summary = checker._generate_summary(chain, total_time, normalized_url)
+
+            result = {
+                'success': True,
+                'chain': chain,
+                'summary': summary,
+                'original_url': normalized_url,
+                'total_time': total_time
+            }
+            if self.store is not None:
+                result['validators'] = validators
+            return timer.attach(result)
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Analysis failed: {str(e)}',
+                'chain': [],
+                'summary': {}
+            }
+
+    async def check_many(self, urls: Union[Iterable[str], AsyncIterable[str]]) -> AsyncIterator[Tuple[int, Dict]]:
+        """Yield (input index, result) for every URL as soon as its chain completes
+
+        urls may be an async iterable (a streamed sitemap or CSV); it is read
+        only as fast as chains finish, at most `concurrency` ahead.
+        """
+        source = (urls if hasattr(urls, '__aiter__') else _aiter(urls)).__aiter__()
+        pending = set()
+        next_url = None
+        exhausted = False
+        index = 0
+
+        async def run(index: int, url: str) -> Tuple[int, Dict]:
+            return index, await self.check(url)
+
+        try:
+            while True:
+                # Keep up to `concurrency` chains going; pull the next URL lazily
+                if next_url is None and not exhausted and len(pending) < self.concurrency:
+                    next_url = asyncio.ensure_future(source.__anext__())
+                waiting = pending | {next_url} if next_url is not None else pending
+                if not waiting:
+                    return
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+                if next_url in done:
+                    try:
+                        url = next_url.result()
+                    except StopAsyncIteration:
+                        exhausted = True
+                    else:
+                        pending.add(asyncio.ensure_future(run(index, url)))
+                        index += 1
+                    next_url = None
+
+                for task in done & pending:
+                    pending.discard(task)
+                    result = task.result()
+                    if self.graph is not None:
+                        self.graph.add(result[1])
+                    yield result
+        finally:
+            for task in pending | ({next_url} if next_url is not None else set()):
+                task.cancel()
+
+    async def iter_sitemap_urls(self, sitemap_url: str, max_depth: int = 3) -> AsyncIterator[str]:
+        """Stream page URLs from a sitemap, following sitemap indexes
+
+        The XML (optionally gzipped) is parsed incrementally while it downloads
+        and parsed entries are dropped at once, so a 50k-URL sitemap never sits
+        in memory. Child sitemaps of an index are fetched one after another.
+        """
+        queue = [(sitemap_url, 0)]
+        seen = set()
+        while queue:
+            url, depth = queue.pop(0)
+            if url in seen or depth > max_depth:
+                continue
+            seen.add(url)
+            async for kind, loc in self._stream_sitemap(url):
+                if kind == 'sitemap':
+                    queue.append((loc, depth + 1))
+                else:
+                    yield loc
+
+    async def _stream_sitemap(self, url: str) -> AsyncIterator[Tuple[str, str]]:
+        """Yield ("url"|"sitemap", loc) for each entry of one sitemap document"""
+        client = self._get_client()
+        parser = ElementTree.XMLPullParser(events=('start', 'end'))
+        root = None
+        async with client.stream("GET", url, follow_redirects=True) as response:
+            response.raise_for_status()
+            inflater = None
+            first = True
+            async for chunk in response.aiter_bytes():
+                if first and chunk:
+                    # sitemap.xml.gz files are served as plain bytes; sniff the gzip magic
+                    first = False
+                    if chunk[:2] == b'\x1f\x8b':
+                        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                parser.feed(inflater.decompress(chunk) if inflater else chunk)
+                for event, element in parser.read_events():
+                    if root is None:
+                        root = element
+                    if event != 'end':
+                        continue
+                    tag = element.tag.rsplit('}', 1)[-1]
+                    if tag in ('url', 'sitemap'):
+                        loc = next((child.text for child in element if child.tag.rsplit('}', 1)[-1] == 'loc'), None)
+                        if loc and loc.strip():
+                            yield tag, loc.strip()
+                        # Drop parsed entries so memory stays flat
+                        root.clear()
+        parser.close()
+
+    async def stream_ndjson(self, urls: Union[Iterable[str], AsyncIterable[str]]) -> AsyncIterator[bytes]:
+        """One NDJSON line per chain as it completes, then a graph line and a summary line"""
+        async for chunk in self.stream_export(urls, 'ndjson'):
+            yield chunk
+
+    async def stream_export(self, urls: Union[Iterable[str], AsyncIterable[str]],
+                            export_format: str = 'ndjson') -> AsyncIterator[bytes]:
+        """The run encoded as it completes: "ndjson", "csv" or "ndjson.gz" (see redirect_export)
+
+        A failing source (unreachable sitemap, malformed XML) ends the output
+        with an error record before the summary of the chains checked so far.
+        """
+        encoder = get_encoder(export_format, self.checker.header_profile)
+        counts: Dict[str, int] = {}
+        total = 0
+        yield encoder.start()
+        try:
+            async for index, result in self.check_many(urls):
+                total += 1
+                status = _result_status(result)
+                counts[status] = counts.get(status, 0) + 1
+                chunk = encoder.encode(index, result)
+                if chunk:
+                    yield chunk
+        except (httpx.HTTPError, ElementTree.ParseError) as e:
+            yield encoder.error(str(e))
+        yield encoder.finish(self.graph_report(), {'total': total, 'statuses': counts})
+
+    async def verify_map(self, rows: Union[Iterable["MigrationRow"], AsyncIterable["MigrationRow"]]
+                         ) -> AsyncIterator[Tuple["MigrationRow", Dict, List[str]]]:
+        """Check every migration row, yielding (row, result, issues) as each completes
+
+        issues is empty when the chain matches the row. Rows are read lazily
+        and forgotten once verified, so only the chains in flight are held in
+        memory.
+        """
+        in_flight: Dict[int, MigrationRow] = {}
+
+        async def sources() -> AsyncIterator[str]:
+            index = 0
+            async for row in (rows if hasattr(rows, '__aiter__') else _aiter(rows)):
+                in_flight[index] = row
+                index += 1
+                yield row.source
+
+        async for index, result in self.check_many(sources()):
+            row = in_flight.pop(index)
+            yield row, result, migration_issues(row, result)
+
+    async def stream_verification(self, rows: Union[Iterable["MigrationRow"], AsyncIterable["MigrationRow"]]
+                                  ) -> AsyncIterator[bytes]:
+        """One NDJSON line per mismatching row as it is found, then a summary line"""
+        counts: Dict[str, int] = {}
+        total = 0
+        mismatched = 0
+        try:
+            async for row, result, issues in self.verify_map(rows):
+                total += 1
+                if not issues:
+                    continue
+                mismatched += 1
+                for issue in issues:
+                    counts[issue] = counts.get(issue, 0) + 1
+                yield json.dumps(mismatch_record(row, result, issues)).encode() + b'\n'
+        except (httpx.HTTPError, ElementTree.ParseError, ValueError) as e:
+            yield json.dumps({'success': False, 'error': f'Migration map failed: {str(e)}'}).encode() + b'\n'
+        yield json.dumps({'summary': {
+            'total': total,
+            'matched': total - mismatched,
+            'mismatched': mismatched,
+            'issues': counts
+        }}).encode() + b'\n'
+
+    async def recheck(self, urls: Union[Iterable[str], AsyncIterable[str]]
+                      ) -> AsyncIterator[Tuple[int, Dict, Optional[StoredChain]]]:
+        """Re-check stored chains; yield (index, result, previous) only for chains that changed
+
+        previous is the stored chain (None for a URL not audited before).
+        Every result is written back to the store, and the store's fresh
+        permanent hops seed the hop memo first, so the requests made scale
+        with what changed rather than with the number of URLs.
+        """
+        if self.store is None:
+            raise ValueError("recheck needs a ChainStore")
+        # Store calls block on SQLite, so they run in a worker thread
+        await asyncio.to_thread(self.store.load_hops, self.checker.hop_memo)
+        try:
+            async for index, result in self.check_many(urls):
+                url = result.get('original_url')
+                previous = await asyncio.to_thread(self.store.get, url) if url else None
+                await asyncio.to_thread(self.store.put, result)
+                if previous is None or previous.signature != chain_signature(result):
+                    yield index, result, previous
+        finally:
+            await asyncio.to_thread(self.store.flush)
+
+    async def stream_changes(self, urls: Union[Iterable[str], AsyncIterable[str]]) -> AsyncIterator[bytes]:
+        """One NDJSON line per new or changed chain as it is found, then a summary line"""
+        counts = {'new': 0, 'changed': 0}
+        checked = 0
+
+        async def counted() -> AsyncIterator[str]:
+            nonlocal checked
+            async for url in (urls if hasattr(urls, '__aiter__') else _aiter(urls)):
+                checked += 1
+                yield url
+
+        try:
+            async for index, result, previous in self.recheck(counted()):
+                change = 'new' if previous is None else 'changed'
+                counts[change] += 1
+                record = dict(result, index=index, change=change)
+                if previous is not None:
+                    record['previous'] = {
+                        'final_url': previous.final_url,
+                        'final_status': previous.final_status,
+                        'signature': previous.signature,
+                        'checked_at': previous.checked_at
+                    }
+                yield json.dumps(record).encode() + b'\n'
+        except (httpx.HTTPError, ElementTree.ParseError) as e:
+            yield json.dumps({'success': False, 'error': f'URL source failed: {str(e)}'}).encode() + b'\n'
+        except sqlite3.Error as e:
+            yield json.dumps({'success': False, 'error': f'Chain store failed: {str(e)}'}).encode() + b'\n'
+        yield json.dumps({'summary': {
+            'total': checked,
+            'unchanged': checked - counts['new'] - counts['changed'],
+            'new': counts['new'],
+            'changed': counts['changed'],
+            'not_modified': self.not_modified,
+            'hop_memo': self.checker.hop_memo.stats()
+        }}).encode() + b'\n'
+
+    async def check_all(self, urls: Iterable[str]) -> List[Dict]:
+        """Results for every URL, in input order"""
+        results: Dict[int, Dict] = {}
+        async for index, result in self.check_many(urls):
+            results[index] = result
+        return [results[index] for index in range(len(results))]
+
+
+async def _aiter(items: Iterable[str]) -> AsyncIterator[str]:
+    for item in items:
+        yield item
+
+
+async def aiter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream as UTF-8 text lines (a streamed request body or file)"""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+    buffer = ''
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        lines = buffer.split('\n')
+        buffer = lines.pop()
+        for line in lines:
+            yield line.rstrip('\r')
+    buffer += decoder.decode(b'', final=True)
+    if buffer:
+        yield buffer.rstrip('\r')
+
+
+# Header names accepted for the URL column of a CSV list
+CSV_URL_COLUMNS = ('url', 'urls', 'source', 'source_url', 'old_url', 'from', 'address')
+
+
+async def iter_csv_urls(lines: AsyncIterable[str]) -> AsyncIterator[str]:
+    """URLs from CSV lines: the url/source column when there is a header, else the first column"""
+    column = None
+    first = True
+    async for line in lines:
+        if not line.strip():
+            continue
+        row = next(csv.reader([line]), [])
+        if first:
+            first = False
+            names = [cell.strip().lower() for cell in row]
+            match = next((names.index(name) for name in CSV_URL_COLUMNS if name in names), None)
+            if match is not None:
+                column = match
+                continue
+            column = 0
+        if column < len(row) and row[column].strip():
+            yield row[column].strip()
+
+
+class MigrationRow(NamedTuple):
+    line: int
+    source: str
+    target: str
+    # None: any permanent redirect (301/308) is accepted
+    status: Optional[int] = None
+
+
+# Header names accepted for the expected target and status columns of a migration map
+MIGRATION_TARGET_COLUMNS = ('target', 'target_url', 'new_url', 'new', 'to', 'destination', 'redirect_to', 'expected_url')
+MIGRATION_STATUS_COLUMNS = ('status', 'status_code', 'expected_status', 'code', 'type')
+
+
+async def iter_migration_rows(lines: AsyncIterable[str]) -> AsyncIterator[MigrationRow]:
+    """Migration rows from CSV lines: named source/target/status columns, else columns 1-3"""
+    columns = None
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+        row = [cell.strip() for cell in next(csv.reader([line]), [])]
+        if columns is None:
+            names = [cell.lower() for cell in row]
+            source = next((names.index(name) for name in CSV_URL_COLUMNS if name in names), None)
+            target = next((names.index(name) for name in MIGRATION_TARGET_COLUMNS if name in names), None)
+            status = next((names.index(name) for name in MIGRATION_STATUS_COLUMNS if name in names), None)
+            if source is not None or target is not None:
+                columns = (source or 0, 1 if target is None else target, status)
+                continue
+            columns = (0, 1, 2)
+        source, target, status = (row[column] if column is not None and column < len(row) else '' for column in columns)
+        if not source or not target:
+            continue
+        if status and not status.isdigit():
+            raise ValueError(f"Line {line_number}: expected status must be a number, got {status!r}")
+        yield MigrationRow(line_number, source, target, int(status) if status else None)
+
+
+def migration_issues(row: MigrationRow, result: Dict) -> List[str]:
+    """How a checked chain deviates from its migration row (empty when it matches)"""
+    chain = result.get('chain') or []
+    if not result.get('success') or not chain:
+        return ['error']
+    if any(step.get('error') == 'Redirect loop detected' for step in chain):
+        return ['loop']
+    if any(step.get('error') for step in chain):
+        return ['error']
+
+    issues = []
+    redirects = [step for step in chain if step.get('is_redirect')]
+    if not redirects:
+        issues.append('not_redirected')
+    else:
+        first_status = redirects[0].get('status_code')
+        if row.status is not None and first_status != row.status:
+            issues.append('wrong_status')
+        elif row.status is None and first_status not in PERMANENT_REDIRECTS:
+            issues.append('wrong_status')
+        if len(redirects) > 1:
+            issues.append('extra_hops')
+
+    # Targets starting with / are paths on the source's site; anything else is a
+    # URL, with https:// assumed when it has none (normalize_url), as for the sources
+    if row.target.startswith('/'):
+        expected = normalize_url(urljoin(result.get('original_url', ''), row.target))
+    else:
+        expected = normalize_url(row.target)
+    final = chain[-1]
+    if normalize_url(final.get('url', '')) != expected:
+        issues.append('wrong_target')
+    elif final.get('status_code') != 200:
+        issues.append('target_not_ok')
+    return issues
+
+
+def mismatch_record(row: MigrationRow, result: Dict, issues: List[str]) -> Dict:
+    """Compact NDJSON record of a mismatching migration row"""
+    chain = result.get('chain') or []
+    return {
+        'line': row.line,
+        'source': row.source,
+        'expected_target': row.target,
+        'expected_status': row.status,
+        'issues': issues,
+        'final_url': chain[-1].get('url') if chain else None,
+        'final_status': chain[-1].get('status_code') if chain else None,
+        'hops': [
+            {key: step[key] for key in ('url', 'status_code', 'redirect_to', 'error') if step.get(key) is not None}
+            for step in chain
+        ],
+        'error': result.get('error')
+    }
+
+
+def _result_status(result: Dict) -> str:
+    status = result.get('summary', {}).get('status') if result.get('success') else 'failed'
+    return status or 'unknown'
+
+
+def summarize_results(results: Iterable[Dict]) -> Dict:
+    """Counts of chain statuses across a bulk run"""
+    counts: Dict[str, int] = {}
+    total = 0
+    for result in results:
+        total += 1
+        status = _result_status(result)
+        counts[status] = counts.get(status, 0) + 1
+    return {'total': total, 'statuses': counts}
+
+
+def check_bulk(urls: Iterable[str], **options) -> Dict:
+    """Check a list of URLs concurrently and return every chain in input order"""
+    async def run() -> Tuple[List[Dict], Dict]:
+        async with BulkRedirectChecker(**options) as engine:
+            return await engine.check_all(urls), engine.graph_report()
+
+    results, graph = asyncio.run(run())
+    return {
+        'success': True,
+        'results': results,
+        'summary': summarize_results(results),
+        'graph': graph
+    }
+
+
+async def _stream_to_stdout(source: str, target: str, options: Dict, export_format: str):
+    if source == 'verify':
+        # Only mismatches are kept, so neither headers nor the graph are needed
+        options = dict(options, header_profile='none', collect_graph=False, meta_refresh=False)
+    if source == 'recheck':
+        options = dict(options, collect_graph=False, meta_refresh=False)
+    async with BulkRedirectChecker(**options) as engine:
+        if source == 'sitemap':
+            chunks = engine.stream_export(engine.iter_sitemap_urls(target), export_format)
+        else:
+            lines = _aiter(line.rstrip('\r\n') for line in (sys.stdin if target == '-' else open(target, newline='')))
+            if source == 'verify':
+                chunks = engine.stream_verification(iter_migration_rows(lines))
+            elif source == 'recheck':
+                chunks = engine.stream_changes(iter_csv_urls(lines))
+            else:
+                chunks = engine.stream_export(iter_csv_urls(lines), export_format)
+        async for chunk in chunks:
+            sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+
+
+def main():
+    """Main function for command line usage"""
+    flags = dict(arg[2:].split('=', 1) for arg in sys.argv[1:] if arg.startswith('--') and '=' in arg)
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if not args:
+        print(json.dumps({
+            "success": False,
+            "error": "Usage: python bulk_redirect_checker.py <urls.txt> | sitemap <url> | csv <file|-> | verify <map.csv|->"
+                     " | recheck <file|-> --store=<chains.db> [concurrency] [per_host]"
+                     " [--format=ndjson|csv|ndjson.gz] [--headers=none|seo|all] [--graph=true]"
+        }))
+        return
+
+    # NDJSON streaming modes: one line per chain as it completes
+    streaming = args[0] in ('sitemap', 'csv', 'verify', 'recheck') and len(args) > 1
+    rest = args[2:] if streaming else args[1:]
+    options = {}
+    if len(rest) > 0:
+        options['concurrency'] = int(rest[0])
+    if len(rest) > 1:
+        options['per_host'] = int(rest[1])
+    if 'headers' in flags:
+        options['header_profile'] = flags['headers']
+
+    if streaming:
+        # Streams stay in flat memory: the redirect graph is opt-in and capped, the hop memo small
+        options['collect_graph'] = flags.get('graph') == 'true'
+        options['graph_max_nodes'] = STREAM_GRAPH_MAX_NODES
+        options['hop_memo_size'] = STREAM_HOP_MEMO_SIZE
+
+    if args[0] == 'recheck' and streaming:
+        # Changed chains against the results stored by earlier rechecks
+        store = ChainStore(flags.get('store', 'redirect-chains.db'))
+        try:
+            asyncio.run(_stream_to_stdout(args[0], args[1], dict(options, store=store), 'ndjson'))
+        finally:
+            store.close()
+        return
+    if streaming:
+        asyncio.run(_stream_to_stdout(args[0], args[1], options, flags.get('format', 'ndjson')))
+        return
+
+    with open(args[0]) as f:
+        urls = [line.strip() for line in f if line.strip()]
+    result = check_bulk(urls, **options)
+    if 'format' in flags:
+        sys.stdout.buffer.write(export_results(
+            result['results'], flags['format'], options.get('header_profile', 'seo'), result['graph'], result['summary']
+        ))
+        return
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
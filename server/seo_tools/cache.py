@@ -0,0 +1,419 @@
+"""
+Content-addressed result cache for deterministic tools
+
+Image conversion, OCR and the text converters are pure functions of their
+input bytes and options, and users re-upload the same files constantly. Results
+are keyed on SHA-256(tool, canonical options, input) and kept in two tiers:
+
+    memory   LRU bounded by total bytes (SEO_TOOLS_CACHE_MEMORY_BYTES)
+    disk     one file per key under SEO_TOOLS_CACHE_DIR, least recently used
+             files evicted past SEO_TOOLS_CACHE_DISK_BYTES
+
+Entries are stored as binary frames (see framing.py) so Blob outputs are kept
+as raw bytes. Only successful results are cached. SEO_TOOLS_CACHE=0 disables
+the cache entirely.
+
+Which tool functions are cached, and which arguments make up their key, is
+decided by CACHE_RULES. The tool service looks results up in its own process
+(ResultCache.run) and only sends misses to the scheduler, so the memory tier
+is shared by every request and a hit never pays for a worker process. Direct
+calls (CLI scripts, benchmarks) go through the same rules with
+ResultCache.call.
+"""
+
+import os
+import sys
+import json
+import asyncio
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from seo_tools.framing import FrameError, decode_frame, encode_frame
+from seo_tools.timing import Timer
+
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_DISK_BYTES = 512 * 1024 * 1024
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "seo-tools-cache")
+
+
+def _declared_value(value: Any, kind: Callable[[Any], Any]) -> Any:
+    """An option read the way the tool reads it (int(), float()); unchanged when that fails"""
+    try:
+        return kind(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def normalize_options(options: Optional[Dict[str, Any]], types: Optional[Dict[str, Callable[[Any], Any]]] = None) -> str:
+    """Canonical JSON form of tool options (sorted keys)
+
+    Only the options named in types are converted, so "7" and 7.0 share a
+    key when the tool reads the option with int(); every other value,
+    free text included, is hashed exactly as given.
+    """
+    options = dict(options or {})
+    for name, kind in (types or {}).items():
+        if name in options:
+            options[name] = _declared_value(options[name], kind)
+    return json.dumps(options, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def cache_key(tool: str, data: Union[bytes, bytearray, memoryview, str], options: Optional[Dict[str, Any]] = None,
+              types: Optional[Dict[str, Callable[[Any], Any]]] = None) -> str:
+    """SHA-256 of the tool name, canonical options and input content"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    digest = hashlib.sha256()
+    digest.update(tool.encode())
+    digest.update(b"\0")
+    digest.update(normalize_options(options, types).encode())
+    digest.update(b"\0")
+    digest.update(data)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    # Uncached body of the tool function, in the same module
+    compute: str
+    # Call arguments -> (input content, options) the key is built from
+    key: Callable[..., Tuple[Any, Optional[Dict[str, Any]]]]
+    # Key namespace when it is not the tool name
+    namespace: Optional[str] = None
+    # Options the tool converts with int() / float(), converted the same way for the key
+    types: Optional[Dict[str, Callable[[Any], Any]]] = None
+
+
+# Numeric options of the profile picture maker (see _process_profile_picture)
+PROFILE_PICTURE_TYPES = {
+    "style_variant": int, "zoom": float, "rotation": float, "position_x": int, "position_y": int,
+    "border_size": int, "brightness": float, "contrast": float, "saturation": float, "hue": float,
+    "canvas_width": int, "canvas_height": int
+}
+
+
+# (tool, function name) -> how calls of that function are cached
+CACHE_RULES: Dict[Tuple[str, str], CacheRule] = {
+    ("image-to-text-ocr", "process_ocr"): CacheRule(
+        "_process_ocr", lambda image_data: (image_data, None)
+    ),
+    ("background-remover", "process_background_removal"): CacheRule(
+        "_process_background_removal",
+        lambda image_data, smooth_edges=True, hd_mode=False: (
+            image_data, {"smooth_edges": smooth_edges, "hd_mode": hd_mode}
+        )
+    ),
+    ("image-dpi-converter", "process_dpi_conversion"): CacheRule(
+        "_process_dpi_conversion", lambda image_data, target_dpi: (image_data, {"target_dpi": target_dpi}),
+        types={"target_dpi": int}
+    ),
+    ("webp-to-jpg-converter", "process_webp_conversion"): CacheRule(
+        "_process_webp_conversion",
+        lambda image_data, compression_level="medium", quality=85: (
+            image_data, {"compression_level": compression_level, "quality": quality}
+        ),
+        types={"quality": int}
+    ),
+    ("profile-picture-maker", "process_profile_picture"): CacheRule(
+        "_process_profile_picture", lambda image_data, options: (image_data, options),
+        types=PROFILE_PICTURE_TYPES
+    ),
+    ("profile-picture-maker", "generate_practice_sheet"): CacheRule(
+        "_generate_practice_sheet", lambda image_data, options: (image_data, options),
+        namespace="profile-picture-practice-sheet", types=PROFILE_PICTURE_TYPES
+    ),
+    ("csv-to-json-converter", "convert_csv_to_json"): CacheRule(
+        "_convert_csv_to_json", lambda csv_content, prettify=True: (csv_content, {"prettify": prettify})
+    ),
+    ("html-to-markdown-converter", "convert_html_to_markdown"): CacheRule(
+        "_convert_html_to_markdown", lambda html_content: (html_content, None)
+    ),
+}
+
+
+def cache_rule(tool: str, func: Callable) -> Optional[CacheRule]:
+    """Cache rule for a tool function, or None when its calls are never cached"""
+    return CACHE_RULES.get((tool, getattr(func, "__name__", None)))
+
+
+def _uncached(func: Callable, rule: CacheRule) -> Callable:
+    return getattr(sys.modules[func.__module__], rule.compute)
+
+
+class ResultCache:
+    """Two-tier (memory LRU + disk) cache of encoded tool results"""
+
+    def __init__(self, memory_bytes: int = DEFAULT_MEMORY_BYTES, disk_bytes: int = DEFAULT_DISK_BYTES,
+                 directory: Optional[str] = DEFAULT_CACHE_DIR, enabled: bool = True):
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.directory = directory if disk_bytes > 0 else None
+        self.enabled = enabled
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_size = 0
+        self._disk_index: Optional["OrderedDict[str, int]"] = None
+        self._disk_size = 0
+        self._lock = threading.Lock()
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @classmethod
+    def from_env(cls) -> "ResultCache":
+        """Build a cache from SEO_TOOLS_CACHE* environment variables"""
+        return cls(
+            memory_bytes=int(os.environ.get("SEO_TOOLS_CACHE_MEMORY_BYTES", DEFAULT_MEMORY_BYTES)),
+            disk_bytes=int(os.environ.get("SEO_TOOLS_CACHE_DISK_BYTES", DEFAULT_DISK_BYTES)),
+            directory=os.environ.get("SEO_TOOLS_CACHE_DIR", DEFAULT_CACHE_DIR),
+            enabled=os.environ.get("SEO_TOOLS_CACHE", "1") != "0"
+        )
+
+    # Memory tier
+
+    def _memory_get(self, key: str) -> Optional[bytes]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        return entry
+
+    def _memory_put(self, key: str, entry: bytes):
+        if len(entry) > self.memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_size -= len(previous)
+        self._memory[key] = entry
+        self._memory_size += len(entry)
+        while self._memory_size > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+            self._counters["evictions"] += 1
+
+    # Disk tier
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def _load_disk_index(self) -> "OrderedDict[str, int]":
+        """Scan the cache directory once, oldest access first"""
+        if self._disk_index is not None:
+            return self._disk_index
+
+        entries = []
+        if os.path.isdir(self.directory):
+            for shard in os.scandir(self.directory):
+                if not shard.is_dir():
+                    continue
+                for item in os.scandir(shard.path):
+                    if item.is_file() and not item.name.endswith(".tmp"):
+                        stat = item.stat()
+                        entries.append((stat.st_mtime, item.name, stat.st_size))
+        entries.sort()
+
+        self._disk_index = OrderedDict((name, size) for _, name, size in entries)
+        self._disk_size = sum(self._disk_index.values())
+        return self._disk_index
+
+    def _disk_read(self, key: str) -> Optional[bytes]:
+        """Read an entry file (no lock held); None when it is gone"""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return entry
+
+    def _disk_write(self, key: str, chunks) -> int:
+        """Write an entry file (no lock held); returns its size"""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write then rename so readers never see a partial entry
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+            size = f.tell()
+        os.replace(tmp_path, path)
+        return size
+
+    def _disk_add(self, key: str, size: int) -> List[str]:
+        """Index a written entry (lock held); returns the keys evicted to make room"""
+        index = self._load_disk_index()
+        if key in index:
+            self._disk_size -= index.pop(key)
+        index[key] = size
+        self._disk_size += size
+
+        evicted = []
+        while self._disk_size > self.disk_bytes and index:
+            name, evicted_size = index.popitem(last=False)
+            self._disk_size -= evicted_size
+            self._counters["evictions"] += 1
+            evicted.append(name)
+        return evicted
+
+    def _disk_remove(self, keys: List[str]):
+        for key in keys:
+            try:
+                os.unlink(self._path(key))
+            except OSError:
+                pass
+
+    # Public API
+    #
+    # The lock only covers the indexes and counters; entry files are read and
+    # written outside it, so memory hits never wait behind disk I/O.
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached result, or None on a miss"""
+        with self._lock:
+            entry = self._memory_get(key)
+            on_disk = entry is None and self.directory is not None and key in self._load_disk_index()
+            if entry is not None:
+                self._counters["memory_hits"] += 1
+        if on_disk:
+            entry = self._disk_read(key)
+            with self._lock:
+                index = self._load_disk_index()
+                if entry is not None:
+                    self._counters["disk_hits"] += 1
+                    if key in index:
+                        index.move_to_end(key)
+                    self._memory_put(key, entry)
+                elif key in index:
+                    self._disk_size -= index.pop(key)
+        if entry is None:
+            with self._lock:
+                self._counters["misses"] += 1
+            return None
+        try:
+            return decode_frame(entry)
+        except (FrameError, ValueError):
+            return None
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """Store a result in both tiers"""
+        chunks = encode_frame(result)
+        size = None
+        if self.directory:
+            try:
+                size = self._disk_write(key, chunks)
+            except OSError:
+                pass
+        entry = b"".join(chunks)
+        evicted = []
+        with self._lock:
+            self._counters["stores"] += 1
+            if size is not None:
+                evicted = self._disk_add(key, size)
+            self._memory_put(key, entry)
+        self._disk_remove(evicted)
+
+    def _lookup(self, tool: str, data: Union[bytes, bytearray, memoryview, str], options: Optional[Dict[str, Any]],
+                types: Optional[Dict[str, Callable[[Any], Any]]] = None
+                ) -> Tuple[str, Optional[Dict[str, Any]], Timer]:
+        """(key, cached result or None, timer holding the lookup span)"""
+        timer = Timer()
+        with timer.span("cache"):
+            key = cache_key(tool, data, options, types)
+            result = self.get(key)
+        if result is not None:
+            result["cache"] = "hit"
+            result["timings"] = timer.spans
+        return key, result, timer
+
+    def _store(self, key: str, result: Dict[str, Any], timer: Timer) -> Dict[str, Any]:
+        """Store a computed result if it succeeded and mark it as a miss"""
+        if result.get("success"):
+            with timer.span("cache", step="store"):
+                self.put(key, result)
+        result["cache"] = "miss"
+        return timer.attach(result)
+
+    def get_or_compute(self, tool: str, data: Union[bytes, bytearray, memoryview, str],
+                       options: Optional[Dict[str, Any]], compute: Callable[[], Dict[str, Any]],
+                       types: Optional[Dict[str, Callable[[Any], Any]]] = None) -> Dict[str, Any]:
+        """Return the cached result for (tool, data, options) or compute and store it
+
+        types names the options converted before hashing (see normalize_options).
+        The result carries "cache": "hit", "miss" or "off". On a hit its
+        timings are replaced by the cache lookup span (the stored stages
+        belong to the call that computed it).
+        """
+        if not self.enabled:
+            result = compute()
+            result["cache"] = "off"
+            return result
+
+        key, result, timer = self._lookup(tool, data, options, types)
+        if result is not None:
+            return result
+        return self._store(key, compute(), timer)
+
+    def call(self, tool: str, func: Callable, *args) -> Dict[str, Any]:
+        """Call a cached tool function (see CACHE_RULES) in this process"""
+        rule = cache_rule(tool, func)
+        compute = _uncached(func, rule)
+        data, options = rule.key(*args)
+        return self.get_or_compute(rule.namespace or tool, data, options, lambda: compute(*args), rule.types)
+
+    async def run(self, tool: str, func: Callable, args: tuple,
+                  compute: Callable[[Callable], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Await compute(func), answering cached tool functions from this process
+
+        For a function with a cache rule the lookup and store happen here
+        (in a thread, off the event loop) and only a miss awaits compute,
+        with the function's uncached body, so the job that runs in a worker
+        never touches the cache.
+        """
+        rule = cache_rule(tool, func)
+        if rule is None:
+            return await compute(func)
+        body = _uncached(func, rule)
+        if not self.enabled:
+            result = await compute(body)
+            result["cache"] = "off"
+            return result
+
+        data, options = rule.key(*args)
+        key, result, timer = await asyncio.to_thread(self._lookup, rule.namespace or tool, data, options, rule.types)
+        if result is not None:
+            return result
+        result = await compute(body)
+        return await asyncio.to_thread(self._store, key, result, timer)
+
+    def clear(self):
+        """Drop every entry from both tiers"""
+        keys = []
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            if self.directory:
+                keys = list(self._load_disk_index())
+                self._disk_index.clear()
+                self._disk_size = 0
+        self._disk_remove(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and tier sizes"""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_size,
+                "memory_limit": self.memory_bytes,
+                "disk_entries": len(self._disk_index or ()),
+                "disk_bytes": self._disk_size,
+                "disk_limit": self.disk_bytes,
+                "directory": self.directory,
+                **self._counters
+            }
+
+
+result_cache = ResultCache.from_env()
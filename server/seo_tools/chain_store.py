@@ -0,0 +1,220 @@
+"""
+SQLite store of redirect chain results for scheduled re-checks
+
+A weekly audit of the same site mostly finds what it found last week. The
+store keeps, per source URL, the chain's hop signature (url, status, target
+and error of every step), its final step and the final page's validators
+(ETag / Last-Modified), plus every permanent redirect hop with its own
+expiry, so a re-check with BulkRedirectChecker(store=...):
+
+    - answers hops whose stored 301/308 is still fresh from the store,
+      without a request
+    - asks the final page with If-None-Match / If-Modified-Since and reuses
+      the stored final step on 304 Not Modified
+    - reports only chains whose signature changed (recheck / stream_changes)
+
+Stored permanent hops without Cache-Control stay fresh for STORED_HOP_TTL
+(TOOL_REDIRECT_STORE_HOP_TTL seconds); max-age and no-store / no-cache are
+honoured as sent.
+
+Writes are buffered and committed in short batches, so no transaction stays
+open between calls: several re-checks can share one file, each waiting at
+most STORE_BUSY_TIMEOUT for another's batch. The calls block on disk I/O;
+the async engine runs them in a worker thread.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from seo_tools.redirect_checker import (
+    CACHE_CONTROL_MAX_AGE, PERMANENT_REDIRECTS, HopMemo, capture_headers
+)
+
+# How long a stored permanent redirect without Cache-Control is trusted (7 days)
+STORED_HOP_TTL = int(os.environ.get("TOOL_REDIRECT_STORE_HOP_TTL", 7 * 24 * 3600))
+# Writes are committed in batches of this many rows (and on flush / close)
+COMMIT_EVERY = 500
+# How long a write waits for another connection's batch before failing
+STORE_BUSY_TIMEOUT = float(os.environ.get("TOOL_REDIRECT_STORE_BUSY_TIMEOUT", 30))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chains (
+    url TEXT PRIMARY KEY,
+    signature TEXT NOT NULL,
+    final_url TEXT,
+    final_status INTEGER,
+    final_step TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    checked_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS hops (
+    url TEXT PRIMARY KEY,
+    status_code INTEGER NOT NULL,
+    reason TEXT,
+    headers TEXT,
+    location TEXT NOT NULL,
+    method TEXT,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class StoredChain:
+    url: str
+    signature: List[List[Any]]
+    final_url: Optional[str]
+    final_status: Optional[int]
+    final_step: Optional[Dict]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    checked_at: float
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since for re-requesting the final page"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+def chain_signature(result: Dict) -> List[List[Any]]:
+    """What a re-check compares: url, status, redirect target and error of every step"""
+    if not result.get('success'):
+        return [[None, None, None, result.get('error')]]
+    return [
+        [step.get('url'), step.get('status_code'), step.get('redirect_to'), step.get('error')]
+        for step in result.get('chain') or []
+    ]
+
+
+def stored_hop_ttl(status_code: int, headers) -> float:
+    """How long a redirect hop may be reused from the store (0: not stored)"""
+    if status_code not in PERMANENT_REDIRECTS:
+        return 0
+    cache_control = headers.get('cache-control', '').lower()
+    if 'no-store' in cache_control or 'no-cache' in cache_control:
+        return 0
+    max_age = CACHE_CONTROL_MAX_AGE.search(cache_control)
+    if max_age:
+        return int(max_age.group(1))
+    return STORED_HOP_TTL
+
+
+class ChainStore:
+    """Chain results and permanent hops of past audits in one SQLite file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        # Called from worker threads; the lock serializes them on the one connection
+        self._db = sqlite3.connect(path, timeout=STORE_BUSY_TIMEOUT, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        with self._db:
+            self._db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        # Rows not written yet, by table and url (a later put replaces an earlier one)
+        self._pending: Dict[str, Dict[str, tuple]] = {'chains': {}, 'hops': {}}
+
+    def _write(self, table: str, params: tuple):
+        with self._lock:
+            self._pending[table][params[0]] = params
+            if sum(len(rows) for rows in self._pending.values()) >= COMMIT_EVERY:
+                self._commit()
+
+    def _commit(self):
+        """Write the pending rows in one transaction (caller holds the lock)"""
+        chains, hops = self._pending['chains'], self._pending['hops']
+        if not chains and not hops:
+            return
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO chains"
+                " (url, signature, final_url, final_status, final_step, etag, last_modified, checked_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)", chains.values()
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO hops (url, status_code, reason, headers, location, method, expires_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)", hops.values()
+            )
+        self._pending = {'chains': {}, 'hops': {}}
+
+    def get(self, url: str) -> Optional[StoredChain]:
+        with self._lock:
+            row = self._pending['chains'].get(url)
+            if row is None:
+                row = self._db.execute(
+                    "SELECT url, signature, final_url, final_status, final_step, etag, last_modified, checked_at"
+                    " FROM chains WHERE url = ?", (url,)
+                ).fetchone()
+        if row is None:
+            return None
+        return StoredChain(
+            row[0], json.loads(row[1]), row[2], row[3], json.loads(row[4]) if row[4] else None, row[5], row[6], row[7]
+        )
+
+    def put(self, result: Dict):
+        """Store a chain result (keyed by its original_url) with its final page validators"""
+        url = result.get('original_url')
+        if not url:
+            return
+        chain = result.get('chain') or []
+        final_step = chain[-1] if chain and not chain[-1].get('redirect_to') else None
+        validators = result.get('validators') or {}
+        self._write(
+            'chains',
+            (
+                url, json.dumps(chain_signature(result)),
+                final_step.get('url') if final_step else None,
+                final_step.get('status_code') if final_step else None,
+                json.dumps(final_step) if final_step else None,
+                validators.get('etag'), validators.get('last_modified'), time.time()
+            )
+        )
+
+    def put_hop(self, url: str, status_code: int, reason: Optional[str], headers, method: str, profile: str):
+        """Remember a permanent redirect hop for later audits, unless it may not be reused"""
+        location = headers.get('location', '')
+        ttl = stored_hop_ttl(status_code, headers)
+        if not location or ttl <= 0:
+            return
+        kept = capture_headers(headers, profile) or {}
+        self._write(
+            'hops',
+            (url, status_code, reason or '', json.dumps(kept), location, method, time.time() + ttl)
+        )
+
+    def load_hops(self, memo: HopMemo) -> int:
+        """Seed a hop memo with every stored hop that is still fresh; returns the count"""
+        now = time.time()
+        with self._lock:
+            with self._db:
+                self._db.execute("DELETE FROM hops WHERE expires_at <= ?", (now,))
+            rows = self._db.execute(
+                "SELECT url, status_code, reason, headers, location, method, expires_at FROM hops"
+            ).fetchall()
+        for url, status_code, reason, headers, location, method, expires_at in rows:
+            memo.restore(url, status_code, reason, json.loads(headers), location, method, expires_at - now)
+        return len(rows)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._commit()
+            chains = self._db.execute("SELECT COUNT(*) FROM chains").fetchone()[0]
+            hops = self._db.execute("SELECT COUNT(*) FROM hops").fetchone()[0]
+        return {'chains': chains, 'hops': hops}
+
+    def flush(self):
+        with self._lock:
+            self._commit()
+
+    def close(self):
+        self.flush()
+        self._db.close()
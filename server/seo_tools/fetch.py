@@ -0,0 +1,663 @@
+"""
+Shared fetching plumbing for the URL tools - a process-wide DNS cache
+
+Every URL tool used to resolve hostnames from scratch on every request (and
+the adsense checker resolved each domain twice). dns_cache keeps one answer
+per hostname for as long as its DNS TTL allows, caches NXDOMAIN / no-address
+answers for NEGATIVE_TTL, and shares one in-flight lookup between concurrent
+async callers. Connections race the resolved IPv6 and IPv4 addresses
+happy-eyeballs style (RFC 8305): the next address is tried when the previous
+one has not connected within HAPPY_EYEBALLS_DELAY, and the first to connect
+wins.
+
+The cache is plugged into each HTTP stack the tools use:
+
+    new_session()          requests.Session (redirect, schema and adsense checkers)
+    urlopen(request)       urllib (safe browsing and IP geolocation)
+    CachedDNSTransport()   httpx.AsyncHTTPTransport (bulk redirect engine)
+
+TLS still verifies and sends SNI for the hostname; only the address lookup
+is shared.
+
+The same hooks time each request's network phases. Inside `with fetch_trace()
+as trace:` the DNS lookup, TCP connect and TLS handshake of any connection
+opened are recorded (none at all means a pooled connection was reused);
+callers mark when response headers arrived and when the body was read:
+
+    with fetch_trace() as trace:
+        response = session.get(url, stream=True)
+        trace.response_started()
+        body = response.content
+        trace.body_done()
+    step['timing'] = trace.report()
+"""
+
+import os
+import time
+import errno
+import socket
+import asyncio
+import selectors
+import ipaddress
+import contextlib
+import contextvars
+import threading
+import http.client
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import dns.resolver
+import dns.asyncresolver
+import dns.exception
+import httpcore
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+
+# TTL bounds: very short TTLs would make the cache useless under bulk load,
+# very long ones would outlive a DNS change by hours
+MIN_TTL = 5
+MAX_TTL = 3600
+# How long a name that does not exist (or has no A/AAAA records) stays cached
+NEGATIVE_TTL = 60
+MAX_ENTRIES = 10000
+# RFC 8305 connection attempt delay
+HAPPY_EYEBALLS_DELAY = 0.25
+# Threads that run the AAAA query of blocking lookups next to the caller's A query
+DNS_THREADS = 16
+
+Address = Tuple[int, str]
+
+
+@dataclass
+class DNSEntry:
+    addresses: Tuple[Address, ...]
+    expires: float
+    # Set for negative entries
+    error: Optional[str] = None
+
+
+# Connection setup phases, then the request phases callers mark, in waterfall order
+SETUP_PHASES = ("dns", "connect", "tls")
+WATERFALL_PHASES = SETUP_PHASES + ("head_fallback", "ttfb", "transfer")
+
+
+class FetchTrace:
+    """Network phase timings of one fetch, filled in by the connection hooks"""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.new_connections = 0
+        self.dns_cached: Optional[bool] = None
+        self.tls_resumed: Optional[bool] = None
+        self.tls_version: Optional[str] = None
+        self._request_start = time.perf_counter()
+        self._setup_at_request_start = 0.0
+        self._started: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def setup_seconds(self) -> float:
+        return sum(self.phases.get(phase, 0.0) for phase in SETUP_PHASES)
+
+    def tls_done(self, ssl_object: Any):
+        """Record the negotiated session of a finished handshake"""
+        if ssl_object is not None:
+            self.tls_resumed = ssl_object.session_reused
+            self.tls_version = ssl_object.version()
+
+    def response_started(self, phase: str = "ttfb"):
+        """Response headers arrived: the request time not spent on connection setup is server wait
+
+        A HEAD answer that is thrown away for a GET is recorded as "head_fallback".
+        """
+        now = time.perf_counter()
+        setup = self.setup_seconds()
+        self.add(phase, now - self._request_start - (setup - self._setup_at_request_start))
+        self._request_start = now
+        self._setup_at_request_start = setup
+
+    def body_done(self):
+        """The part of the body the caller needs has been read"""
+        now = time.perf_counter()
+        self.add("transfer", now - self._request_start)
+        self._request_start = now
+
+    async def httpcore_event(self, name: str, info: Dict[str, Any]):
+        """httpx "trace" extension callback: times TLS handshakes (DNS and connect come from CachedDNSBackend)"""
+        if name == "connection.start_tls.started":
+            self._started[name] = time.perf_counter()
+        elif name == "connection.start_tls.complete" and "connection.start_tls.started" in self._started:
+            self.add("tls", time.perf_counter() - self._started.pop("connection.start_tls.started"))
+            stream = info.get("return_value")
+            self.tls_done(stream.get_extra_info("ssl_object") if stream is not None else None)
+
+    def report(self) -> Dict[str, Any]:
+        """Phase durations and a waterfall (start offsets) in milliseconds"""
+        waterfall = []
+        offset = 0.0
+        for phase in WATERFALL_PHASES:
+            if phase in self.phases:
+                duration = round(self.phases[phase] * 1000, 2)
+                waterfall.append({"phase": phase, "start": round(offset, 2), "duration": duration})
+                offset += duration
+        return {
+            "phases": {entry["phase"]: entry["duration"] for entry in waterfall},
+            "waterfall": waterfall,
+            "connection_reused": self.new_connections == 0,
+            "dns_cached": self.dns_cached,
+            "tls_resumed": self.tls_resumed,
+            "tls_version": self.tls_version
+        }
+
+
+_trace: contextvars.ContextVar = contextvars.ContextVar("fetch_trace", default=None)
+
+
+@contextlib.contextmanager
+def fetch_trace() -> Iterator[FetchTrace]:
+    """Record the network phases of the fetches made inside the block"""
+    trace = FetchTrace()
+    token = _trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _trace.reset(token)
+
+
+def _literal(host: str) -> Optional[List[Address]]:
+    """The address itself when host is an IP literal"""
+    try:
+        ip = ipaddress.ip_address(host.strip("[]"))
+    except ValueError:
+        return None
+    return [(socket.AF_INET6 if ip.version == 6 else socket.AF_INET, str(ip))]
+
+
+def interleave(addresses: List[Address]) -> List[Address]:
+    """Alternate address families, IPv6 first (RFC 8305 section 4)"""
+    v6 = [a for a in addresses if a[0] == socket.AF_INET6]
+    v4 = [a for a in addresses if a[0] != socket.AF_INET6]
+    ordered = []
+    for pair in zip(v6, v4):
+        ordered.extend(pair)
+    return ordered + v6[len(v4):] + v4[len(v6):]
+
+
+class DNSCache:
+    """TTL-aware hostname -> addresses cache with negative caching"""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, negative_ttl: float = NEGATIVE_TTL):
+        self.max_entries = max_entries
+        self.negative_ttl = negative_ttl
+        self._entries: "OrderedDict[str, DNSEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        # host -> (loop, future) of the async lookup in flight
+        self._inflight: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    def _cached(self, host: str) -> Optional[List[Address]]:
+        """Cached addresses, raising for a negative entry; None on a miss"""
+        with self._lock:
+            entry = self._entries.get(host)
+            if entry is not None and entry.expires <= time.monotonic():
+                del self._entries[host]
+                entry = None
+            trace = _trace.get()
+            if trace is not None:
+                trace.dns_cached = entry is not None
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.error is not None:
+                self.negative_hits += 1
+                raise socket.gaierror(socket.EAI_NONAME, entry.error)
+            self.hits += 1
+            return list(entry.addresses)
+
+    def _store(self, host: str, entry: DNSEntry) -> DNSEntry:
+        with self._lock:
+            self._entries[host] = entry
+            self._entries.move_to_end(host)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _entry(self, answers: List[Any]) -> Optional[DNSEntry]:
+        """Entry from the AAAA and A answers (or their exceptions); None when nothing is cacheable"""
+        addresses = []
+        expiration = None
+        negative = True
+        for family, answer in zip((socket.AF_INET6, socket.AF_INET), answers):
+            if isinstance(answer, (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer)):
+                continue
+            if isinstance(answer, BaseException):
+                # Timeouts and SERVFAIL are transient and never cached
+                negative = False
+                continue
+            addresses.extend((family, rdata.address) for rdata in answer)
+            # Answer.expiration already accounts for every CNAME in the chain
+            expiration = answer.expiration if expiration is None else min(expiration, answer.expiration)
+        if addresses:
+            ttl = min(max(expiration - time.time(), MIN_TTL), MAX_TTL)
+            return DNSEntry(tuple(addresses), time.monotonic() + ttl)
+        if negative:
+            return DNSEntry((), time.monotonic() + self.negative_ttl, "Name or service not known")
+        return None
+
+    def _system_entry(self, infos: List[Tuple]) -> DNSEntry:
+        """Entry from getaddrinfo results (names only the hosts file knows); no TTL, so MIN_TTL"""
+        addresses = list(dict.fromkeys((family, sockaddr[0]) for family, _, _, _, sockaddr in infos))
+        return DNSEntry(tuple(addresses), time.monotonic() + MIN_TTL)
+
+    def _needs_system(self, entry: Optional[DNSEntry]) -> bool:
+        """Whether getaddrinfo should be asked: dnspython found nothing or failed
+
+        Besides names only the hosts file knows, this covers resolvers
+        dnspython cannot use (no usable resolv.conf, all nameservers failing).
+        """
+        return entry is None or entry.error is not None
+
+    def _result(self, host: str, entry: Optional[DNSEntry], error: Optional[BaseException]) -> List[Address]:
+        if entry is None:
+            raise socket.gaierror(socket.EAI_AGAIN, f"Temporary failure resolving {host}: {error}")
+        self._store(host, entry)
+        if entry.error is not None:
+            raise socket.gaierror(socket.EAI_NONAME, entry.error)
+        return list(entry.addresses)
+
+    def lookup(self, host: str, timeout: Optional[float] = None) -> List[Address]:
+        """Addresses for host (blocking); raises socket.gaierror like getaddrinfo
+
+        timeout bounds the DNS queries (the resolver's own lifetime when None).
+        """
+        literal = _literal(host)
+        if literal is not None:
+            return literal
+        host = host.lower().rstrip(".")
+        cached = self._cached(host)
+        if cached is not None:
+            return cached
+
+        # Both families at once, as alookup does
+        aaaa = _dns_threads.submit(_query, host, "AAAA", timeout)
+        a = _query(host, "A", timeout)
+        answers = [aaaa.result(), a]
+        entry = self._entry(answers)
+        if self._needs_system(entry):
+            try:
+                entry = self._system_entry(socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP))
+            except socket.gaierror:
+                pass
+        return self._result(host, entry, answers[-1])
+
+    async def alookup(self, host: str, timeout: Optional[float] = None) -> List[Address]:
+        """Addresses for host without blocking the loop; concurrent lookups of a host share one query
+
+        timeout bounds the DNS queries (the resolver's own lifetime when None).
+        """
+        literal = _literal(host)
+        if literal is not None:
+            return literal
+        host = host.lower().rstrip(".")
+        cached = self._cached(host)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(host)
+        if inflight is not None and inflight[0] is loop:
+            return list(await asyncio.shield(inflight[1]))
+
+        future = loop.create_future()
+        self._inflight[host] = (loop, future)
+        try:
+            answers = await asyncio.gather(
+                dns.asyncresolver.resolve(host, "AAAA", lifetime=timeout),
+                dns.asyncresolver.resolve(host, "A", lifetime=timeout),
+                return_exceptions=True
+            )
+            entry = self._entry(answers)
+            if self._needs_system(entry):
+                try:
+                    entry = self._system_entry(await loop.getaddrinfo(host, None, proto=socket.IPPROTO_TCP))
+                except socket.gaierror:
+                    pass
+            addresses = self._result(host, entry, answers[-1])
+            future.set_result(addresses)
+            return addresses
+        except BaseException as e:
+            future.set_exception(e)
+            # Followers get the exception; nobody else needs to retrieve it
+            future.exception()
+            raise
+        finally:
+            if self._inflight.get(host, (None, None))[1] is future:
+                del self._inflight[host]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses
+            }
+
+    def metric_lines(self) -> List[str]:
+        """Prometheus exposition lines (registered with timing.metrics by the service)"""
+        stats = self.stats()
+        return [
+            "# TYPE seo_tool_dns_cache_entries gauge",
+            f"seo_tool_dns_cache_entries {stats['entries']}",
+            "# TYPE seo_tool_dns_cache_lookups_total counter",
+            f'seo_tool_dns_cache_lookups_total{{result="hit"}} {stats["hits"]}',
+            f'seo_tool_dns_cache_lookups_total{{result="negative_hit"}} {stats["negative_hits"]}',
+            f'seo_tool_dns_cache_lookups_total{{result="miss"}} {stats["misses"]}',
+        ]
+
+
+def _query(host: str, rdtype: str, lifetime: Optional[float]) -> Any:
+    """A blocking dnspython query; its answer, or the DNSException it raised"""
+    try:
+        return dns.resolver.resolve(host, rdtype, lifetime=lifetime)
+    except dns.exception.DNSException as e:
+        return e
+
+
+_dns_threads = ThreadPoolExecutor(max_workers=DNS_THREADS, thread_name_prefix="dns")
+dns_cache = DNSCache()
+
+
+def _connect_timeout(timeout: Any) -> Optional[float]:
+    """Seconds from a socket-style timeout (the stdlib and urllib3 pass a sentinel for 'default')"""
+    if timeout is None or isinstance(timeout, (int, float)):
+        return timeout
+    return socket.getdefaulttimeout()
+
+
+def create_connection(address: Tuple[str, int], timeout: Any = None, source_address: Optional[Tuple] = None,
+                      socket_options: Optional[List[Tuple]] = None) -> socket.socket:
+    """socket.create_connection through dns_cache, racing addresses happy-eyeballs style"""
+    host, port = address
+    timeout = _connect_timeout(timeout)
+    trace = _trace.get()
+    started = time.perf_counter()
+    queue = interleave(dns_cache.lookup(host, timeout))
+    resolved = time.perf_counter()
+    if trace is not None:
+        trace.add("dns", resolved - started)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    selector = selectors.DefaultSelector()
+    attempts = set()
+    errors = []
+    next_attempt = 0.0
+    try:
+        while queue or attempts:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                raise socket.timeout("timed out")
+
+            if queue and now >= next_attempt:
+                family, ip = queue.pop(0)
+                sock = socket.socket(family, socket.SOCK_STREAM)
+                try:
+                    for option in socket_options or ():
+                        sock.setsockopt(*option)
+                    if source_address:
+                        sock.bind(source_address)
+                    sock.setblocking(False)
+                    code = sock.connect_ex((ip, port))
+                except OSError as e:
+                    sock.close()
+                    errors.append(e)
+                    continue
+                if code not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    sock.close()
+                    errors.append(OSError(code, os.strerror(code)))
+                    continue
+                attempts.add(sock)
+                selector.register(sock, selectors.EVENT_WRITE)
+                next_attempt = now + HAPPY_EYEBALLS_DELAY
+
+            wait = [t - now for t in (next_attempt if queue else None, deadline) if t is not None]
+            for key, _ in selector.select(max(min(wait), 0) if wait else None):
+                sock = key.fileobj
+                selector.unregister(sock)
+                attempts.discard(sock)
+                code = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if code == 0:
+                    # Back to blocking mode with the caller's timeout
+                    sock.settimeout(timeout)
+                    if trace is not None:
+                        trace.add("connect", time.perf_counter() - resolved)
+                        trace.new_connections += 1
+                    return sock
+                sock.close()
+                errors.append(OSError(code, os.strerror(code)))
+                # A failed attempt starts the next one right away
+                next_attempt = 0.0
+        raise errors[-1] if errors else OSError(f"No addresses for {host}")
+    finally:
+        for sock in attempts:
+            sock.close()
+        selector.close()
+
+
+class _CachedDNSConnectionMixin:
+    """urllib3 connection whose _new_conn connects through create_connection"""
+
+    def _new_conn(self) -> socket.socket:
+        try:
+            return create_connection(
+                (self._dns_host, self.port),
+                self.timeout,
+                source_address=self.source_address,
+                socket_options=self.socket_options
+            )
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        except socket.timeout as e:
+            raise ConnectTimeoutError(self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})") from e
+        except OSError as e:
+            raise NewConnectionError(self, f"Failed to establish a new connection: {e}") from e
+
+
+def _traced_tls_connect(connection, connect):
+    """Run a TLS connection's connect(), recording the handshake time and session"""
+    trace = _trace.get()
+    if trace is None:
+        return connect()
+    started = time.perf_counter()
+    setup = trace.setup_seconds()
+    connect()
+    trace.add("tls", time.perf_counter() - started - (trace.setup_seconds() - setup))
+    trace.tls_done(connection.sock if hasattr(connection.sock, "session_reused") else None)
+
+
+class _CachedDNSHTTPConnection(_CachedDNSConnectionMixin, HTTPConnection):
+    pass
+
+
+class _CachedDNSHTTPSConnection(_CachedDNSConnectionMixin, HTTPSConnection):
+    def connect(self):
+        _traced_tls_connect(self, super().connect)
+
+
+class _CachedDNSHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CachedDNSHTTPConnection
+
+
+class _CachedDNSHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedDNSHTTPSConnection
+
+
+class CachedDNSAdapter(HTTPAdapter):
+    """requests adapter whose connections resolve through dns_cache"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CachedDNSHTTPConnectionPool,
+            "https": _CachedDNSHTTPSConnectionPool
+        }
+
+
+def new_session() -> requests.Session:
+    """requests.Session resolving through dns_cache"""
+    session = requests.Session()
+    adapter = CachedDNSAdapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def traced_get(session: requests.Session, url: str, **kwargs) -> requests.Response:
+    """session.get with the body read eagerly, marking header and body times on the active fetch_trace"""
+    trace = _trace.get()
+    response = session.get(url, stream=True, **kwargs)
+    if trace is not None:
+        trace.response_started()
+    response.content
+    if trace is not None:
+        trace.body_done()
+    return response
+
+
+class _CachedDNSHTTPClientConnection(http.client.HTTPConnection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._create_connection = create_connection
+
+
+class _CachedDNSHTTPSClientConnection(http.client.HTTPSConnection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._create_connection = create_connection
+
+    def connect(self):
+        _traced_tls_connect(self, super().connect)
+
+
+class _CachedDNSHTTPHandler(urllib.request.HTTPHandler):
+    def http_open(self, req):
+        return self.do_open(_CachedDNSHTTPClientConnection, req)
+
+
+class _CachedDNSHTTPSHandler(urllib.request.HTTPSHandler):
+    def https_open(self, req):
+        return self.do_open(_CachedDNSHTTPSClientConnection, req, context=self._context)
+
+
+def urlopen(request, timeout: float = socket._GLOBAL_DEFAULT_TIMEOUT, context=None):
+    """urllib.request.urlopen resolving through dns_cache"""
+    opener = urllib.request.build_opener(_CachedDNSHTTPHandler(), _CachedDNSHTTPSHandler(context=context))
+    return opener.open(request, timeout=timeout)
+
+
+class CachedDNSBackend(httpcore.AsyncNetworkBackend):
+    """httpcore network backend resolving through dns_cache and racing addresses"""
+
+    def __init__(self, backend: httpcore.AsyncNetworkBackend):
+        self._backend = backend
+
+    async def connect_tcp(self, host: str, port: int, timeout: Optional[float] = None,
+                          local_address: Optional[str] = None, socket_options=None):
+        trace = _trace.get()
+        started = time.perf_counter()
+        try:
+            addresses = await dns_cache.alookup(host, timeout)
+        except socket.gaierror as e:
+            raise httpcore.ConnectError(str(e)) from e
+        resolved = time.perf_counter()
+        if trace is not None:
+            trace.add("dns", resolved - started)
+
+        queue = interleave(addresses)
+        pending = set()
+        errors = []
+        try:
+            while queue or pending:
+                if queue:
+                    _, ip = queue.pop(0)
+                    pending.add(asyncio.ensure_future(self._backend.connect_tcp(
+                        ip, port, timeout=timeout, local_address=local_address, socket_options=socket_options
+                    )))
+                done, pending = await asyncio.wait(
+                    pending, timeout=HAPPY_EYEBALLS_DELAY if queue else None, return_when=asyncio.FIRST_COMPLETED
+                )
+                streams = []
+                for task in done:
+                    if task.exception() is None:
+                        streams.append(task.result())
+                    else:
+                        errors.append(task.exception())
+                if streams:
+                    for extra in streams[1:]:
+                        await extra.aclose()
+                    if trace is not None:
+                        trace.add("connect", time.perf_counter() - resolved)
+                        trace.new_connections += 1
+                    return streams[0]
+            raise errors[-1] if errors else httpcore.ConnectError(f"No addresses for {host}")
+        finally:
+            for task in pending:
+                task.cancel()
+            # An attempt may have connected while being cancelled; close it
+            for outcome in await asyncio.gather(*pending, return_exceptions=True):
+                if not isinstance(outcome, BaseException):
+                    await outcome.aclose()
+
+    async def connect_unix_socket(self, path: str, timeout: Optional[float] = None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds: float):
+        await self._backend.sleep(seconds)
+
+
+class CachedDNSTransport(httpx.AsyncHTTPTransport):
+    """httpx.AsyncHTTPTransport whose connections resolve through dns_cache
+
+    httpx takes no network backend, so the httpcore pool is built here, with
+    the same settings httpx would use, on CachedDNSBackend. It replaces the
+    transport's pool (httpcore is pinned in server-requirements.txt; a
+    transport without one fails at construction rather than bypassing the
+    cache).
+    """
+
+    def __init__(self, verify: Any = True, cert: Any = None, trust_env: bool = True, http1: bool = True,
+                 http2: bool = False, limits: httpx.Limits = httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                 local_address: Optional[str] = None, retries: int = 0, socket_options: Any = None):
+        super().__init__(
+            verify=verify, cert=cert, trust_env=trust_env, http1=http1, http2=http2, limits=limits,
+            local_address=local_address, retries=retries, socket_options=socket_options
+        )
+        if not isinstance(getattr(self, "_pool", None), httpcore.AsyncConnectionPool):
+            raise RuntimeError(
+                f"httpx {httpx.__version__} keeps no httpcore pool on its transport; CachedDNSTransport needs updating"
+            )
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(verify=verify, cert=cert, trust_env=trust_env),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=http1,
+            http2=http2,
+            retries=retries,
+            local_address=local_address,
+            socket_options=socket_options,
+            network_backend=CachedDNSBackend(httpcore.AnyIOBackend())
+        )
@@ -0,0 +1,191 @@
+"""
+Binary framed payload transport for tool inputs and outputs
+
+Large payloads (PDFs, images) used to travel as base64 inside JSON, which adds
+a third to their size and costs several copies per hop. A frame carries the
+JSON fields and the raw binary blobs side by side:
+
+    magic        4 bytes   b"STF1"
+    header_len   uint32    big endian
+    header       JSON      {"fields": {...}, "blobs": [{"size": n, "mime": "..."}]}
+    blob 0..n    raw bytes, sizes taken from the header
+
+Inside "fields" every binary value is replaced by {"$blob": index}. Tools put
+binary output in a Blob; JSON callers still get base64 (a data URL by default),
+framed callers get the raw bytes.
+"""
+
+import base64
+import json
+import struct
+from typing import Any, BinaryIO, Dict, List, Tuple, Union
+
+FRAME_MAGIC = b"STF1"
+FRAME_CONTENT_TYPE = "application/x-seo-tools-frame"
+
+_PREFIX = struct.Struct(">4sI")
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class FrameError(ValueError):
+    """Raised when a frame is truncated or malformed"""
+
+
+class Blob:
+    """Binary value inside a tool result"""
+
+    __slots__ = ("data", "mime", "data_url")
+
+    def __init__(self, data: BytesLike, mime: str = "application/octet-stream", data_url: bool = True):
+        self.data = data
+        self.mime = mime
+        # JSON form: "data:<mime>;base64,..." when True, bare base64 otherwise
+        self.data_url = data_url
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __reduce__(self):
+        # memoryview data cannot be pickled (process pool results)
+        return (Blob, (bytes(self.data), self.mime, self.data_url))
+
+    def to_json(self) -> str:
+        """Base64 form used when the result is serialized as JSON"""
+        encoded = base64.b64encode(self.data).decode()
+        if self.data_url:
+            return f"data:{self.mime};base64,{encoded}"
+        return encoded
+
+
+def json_default(value: Any) -> Any:
+    """json.dumps default hook that encodes Blob values as base64"""
+    if isinstance(value, Blob):
+        return value.to_json()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def to_jsonable(value: Any) -> Any:
+    """Return a copy of a result with every Blob replaced by its base64 form"""
+    if isinstance(value, Blob):
+        return value.to_json()
+    if isinstance(value, dict):
+        return {key: to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    return value
+
+
+def split_blobs(value: Any) -> Tuple[Any, List[Blob]]:
+    """Replace Blob values with {"$blob": index} references"""
+    blobs: List[Blob] = []
+
+    def walk(item: Any) -> Any:
+        if isinstance(item, Blob):
+            blobs.append(item)
+            return {"$blob": len(blobs) - 1}
+        if isinstance(item, (bytes, bytearray, memoryview)):
+            blobs.append(Blob(item))
+            return {"$blob": len(blobs) - 1}
+        if isinstance(item, dict):
+            return {key: walk(child) for key, child in item.items()}
+        if isinstance(item, (list, tuple)):
+            return [walk(child) for child in item]
+        return item
+
+    return walk(value), blobs
+
+
+def join_blobs(fields: Any, blobs: List[Blob]) -> Any:
+    """Resolve {"$blob": index} references back into Blob values"""
+    if isinstance(fields, dict):
+        if len(fields) == 1 and "$blob" in fields:
+            return blobs[fields["$blob"]]
+        return {key: join_blobs(item, blobs) for key, item in fields.items()}
+    if isinstance(fields, list):
+        return [join_blobs(item, blobs) for item in fields]
+    return fields
+
+
+def encode_frame(message: Dict[str, Any]) -> List[BytesLike]:
+    """Encode a message as a list of chunks (blob data is not copied)"""
+    fields, blobs = split_blobs(message)
+    header = json.dumps({
+        "fields": fields,
+        "blobs": [{"size": len(blob), "mime": blob.mime} for blob in blobs]
+    }, separators=(",", ":")).encode()
+
+    chunks: List[BytesLike] = [_PREFIX.pack(FRAME_MAGIC, len(header)), header]
+    chunks.extend(blob.data for blob in blobs)
+    return chunks
+
+
+def write_frame(stream: BinaryIO, message: Dict[str, Any]):
+    """Write a framed message to a binary stream"""
+    for chunk in encode_frame(message):
+        stream.write(chunk)
+    stream.flush()
+
+
+def _parse_header(prefix: BytesLike) -> int:
+    if len(prefix) < _PREFIX.size:
+        raise FrameError("Truncated frame prefix")
+    magic, header_len = _PREFIX.unpack(prefix[:_PREFIX.size])
+    if magic != FRAME_MAGIC:
+        raise FrameError("Not a framed payload")
+    return header_len
+
+
+def _build_message(header: Dict[str, Any], blobs: List[Blob]) -> Dict[str, Any]:
+    return join_blobs(header.get("fields", {}), blobs)
+
+
+def decode_frame(buffer: BytesLike) -> Dict[str, Any]:
+    """Decode a frame held in memory; blob data are zero-copy memoryview slices"""
+    view = memoryview(buffer)
+    header_len = _parse_header(view)
+    offset = _PREFIX.size + header_len
+    if len(view) < offset:
+        raise FrameError("Truncated frame header")
+    header = json.loads(bytes(view[_PREFIX.size:offset]))
+
+    blobs = []
+    for entry in header.get("blobs", []):
+        size = entry["size"]
+        if len(view) < offset + size:
+            raise FrameError("Truncated frame blob")
+        blobs.append(Blob(view[offset:offset + size], entry.get("mime", "application/octet-stream")))
+        offset += size
+    return _build_message(header, blobs)
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytearray:
+    """Read exactly size bytes into a preallocated buffer"""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = stream.readinto(view[received:])
+        if not count:
+            raise FrameError("Unexpected end of frame")
+        received += count
+    return buffer
+
+
+def read_frame(stream: BinaryIO) -> Dict[str, Any]:
+    """Read one framed message from a binary stream"""
+    header_len = _parse_header(_read_exact(stream, _PREFIX.size))
+    header = json.loads(bytes(_read_exact(stream, header_len)))
+
+    blobs = []
+    for entry in header.get("blobs", []):
+        blobs.append(Blob(_read_exact(stream, entry["size"]), entry.get("mime", "application/octet-stream")))
+    return _build_message(header, blobs)
+
+
+def is_framed(stream: BinaryIO) -> bool:
+    """Check (without consuming) whether a buffered stream starts with a frame"""
+    peek = getattr(stream, "peek", None)
+    if peek is None:
+        return False
+    return peek(len(FRAME_MAGIC))[:len(FRAME_MAGIC)] == FRAME_MAGIC
@@ -0,0 +1,282 @@
+"""
+Per-job process isolation for tools that parse untrusted files in native code
+
+PDF and image parsing runs in qpdf, MuPDF and libjpeg; one malicious file can
+crash or wedge the process it runs in. IsolatedExecutor runs every job in its
+own child forked from a multiprocessing forkserver that has already imported
+pikepdf, fitz, PIL, numpy, bs4 and the cpu tool modules, so a job costs a
+copy-on-write fork instead of an interpreter start plus imports, and a crash
+only takes down that child. Children start from this module alone: they never
+re-run the parent's main script (for the tool service, FastAPI and the whole
+app), which multiprocessing would otherwise do before every job. That launcher
+mirrors popen_forkserver internals, so it is only used on the interpreter
+versions in JOB_LAUNCHER_VERSIONS (tests/test_isolation.py checks it); other
+versions use the stock forkserver Process and pay for the main import.
+
+Each child is watched by the parent and killed when it exceeds
+
+    TOOL_ISOLATION_TIMEOUT      wall-clock seconds per job (default 120)
+    TOOL_ISOLATION_MAX_RSS_MB   resident memory (default 1024, 0 disables)
+
+The child also caps its own CPU time (RLIMIT_CPU) at the job's timeout, so a
+busy job dies even if its watcher does not.
+
+Crashes and kills surface as IsolatedJobFailed and are counted in
+isolation_stats, which the tool service exposes on /metrics.
+"""
+
+import io
+import os
+import sys
+import math
+import time
+import signal
+import resource
+import threading
+import multiprocessing
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from multiprocessing import context, forkserver, popen_forkserver, reduction, spawn, util
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+# Native parsing stacks imported once in the forkserver and shared by every child
+PRELOAD_MODULES = ("pikepdf", "fitz", "PIL.Image", "numpy", "bs4")
+
+# How often the parent checks a running child's RSS and deadline
+POLL_INTERVAL = 0.05
+
+# Interpreters whose popen_forkserver.Popen._launch _JobPopen mirrors
+JOB_LAUNCHER_VERSIONS = {(3, 11), (3, 12), (3, 13)}
+
+
+@dataclass
+class IsolationLimits:
+    timeout: float = 120.0
+    max_rss_bytes: int = 1024 * 1024 * 1024
+
+    @classmethod
+    def from_env(cls) -> "IsolationLimits":
+        """Limits from TOOL_ISOLATION_TIMEOUT / TOOL_ISOLATION_MAX_RSS_MB"""
+        return cls(
+            timeout=float(os.environ.get("TOOL_ISOLATION_TIMEOUT", 120)),
+            max_rss_bytes=int(os.environ.get("TOOL_ISOLATION_MAX_RSS_MB", 1024)) * 1024 * 1024
+        )
+
+
+class IsolatedJobFailed(Exception):
+    """Raised when an isolated job crashed or was killed for exceeding a limit"""
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+class IsolationStats:
+    """Job, crash and kill counters shared by every IsolatedExecutor"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.jobs = 0
+        self.running = 0
+        self.crashes = 0
+        self.kills: Dict[str, int] = {"timeout": 0, "memory": 0}
+
+    def started(self):
+        with self._lock:
+            self.jobs += 1
+            self.running += 1
+
+    def finished(self, failure: Optional[str] = None):
+        with self._lock:
+            self.running -= 1
+            if failure == "crash":
+                self.crashes += 1
+            elif failure is not None:
+                self.kills[failure] = self.kills.get(failure, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"jobs": self.jobs, "running": self.running, "crashes": self.crashes, "kills": dict(self.kills)}
+
+    def metric_lines(self) -> List[str]:
+        """Prometheus exposition lines (registered with timing.metrics by the service)"""
+        stats = self.stats()
+        lines = [
+            "# TYPE seo_tool_isolated_jobs_total counter",
+            f"seo_tool_isolated_jobs_total {stats['jobs']}",
+            "# TYPE seo_tool_isolated_running gauge",
+            f"seo_tool_isolated_running {stats['running']}",
+            "# TYPE seo_tool_isolated_crashes_total counter",
+            f"seo_tool_isolated_crashes_total {stats['crashes']}",
+            "# TYPE seo_tool_isolated_kills_total counter",
+        ]
+        for reason, count in sorted(stats["kills"].items()):
+            lines.append(f'seo_tool_isolated_kills_total{{reason="{reason}"}} {count}')
+        return lines
+
+
+isolation_stats = IsolationStats()
+
+
+def _rss_bytes(pid: int) -> int:
+    """Resident set size of a process from /proc (0 when unavailable)"""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class _JobPopen(popen_forkserver.Popen):
+    """forkserver launcher that leaves the parent's __main__ out of the child
+
+    The stock launcher sends the main script's path (or module name) with
+    every job and the child imports it before unpickling the job. Jobs are
+    module-level functions of preloaded modules, so those keys are dropped;
+    the rest mirrors popen_forkserver.Popen._launch.
+    """
+
+    def _launch(self, process_obj):
+        prep_data = spawn.get_preparation_data(process_obj._name)
+        prep_data.pop("init_main_from_path", None)
+        prep_data.pop("init_main_from_name", None)
+        buf = io.BytesIO()
+        context.set_spawning_popen(self)
+        try:
+            reduction.dump(prep_data, buf)
+            reduction.dump(process_obj, buf)
+        finally:
+            context.set_spawning_popen(None)
+
+        self.sentinel, w = forkserver.connect_to_new_process(self._fds)
+        # Kept open as the child's parent sentinel, as the stock launcher does
+        parent_w = os.dup(w)
+        self.finalizer = util.Finalize(self, util.close_fds, (parent_w, self.sentinel))
+        with open(w, "wb", closefd=True) as f:
+            f.write(buf.getbuffer())
+        self.pid = forkserver.read_signed(self.sentinel)
+
+
+class _JobProcess(context.ForkServerProcess):
+    """forkserver Process started through _JobPopen"""
+
+    @staticmethod
+    def _Popen(process_obj):
+        return _JobPopen(process_obj)
+
+
+def _limit_cpu(seconds: float):
+    """Cap this process's CPU time; past it the kernel sends SIGXCPU"""
+    soft = math.ceil(seconds) + 1
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    try:
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def _child(connection, func: Callable, args: tuple, timeout: float):
+    """Job body in the forked child: run func and send back ("ok"|"error", value)"""
+    _limit_cpu(timeout)
+    try:
+        message = ("ok", func(*args))
+    except BaseException as e:
+        message = ("error", e)
+    try:
+        connection.send(message)
+    except Exception as e:
+        # Unpicklable result or exception: report it as text instead
+        connection.send(("error", RuntimeError(f"{type(e).__name__}: {e}")))
+    connection.close()
+
+
+class IsolatedExecutor(Executor):
+    """Executor that runs each job in a fresh child of a preloaded forkserver"""
+
+    def __init__(self, max_workers: int, limits: Optional[IsolationLimits] = None,
+                 preload: Optional[List[str]] = None):
+        self.limits = limits or IsolationLimits.from_env()
+        self._context = multiprocessing.get_context("forkserver")
+        # Missing preload modules are skipped by the forkserver; this module holds the job body
+        modules = list(preload if preload is not None else PRELOAD_MODULES)
+        self._context.set_forkserver_preload(modules + [__name__])
+        # One watcher thread per running child
+        self._watchers = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tools-isolated")
+        self._processes = set()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the forkserver now so the first job does not pay for the preload"""
+        from multiprocessing import forkserver
+        forkserver.ensure_running()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        if kwargs:
+            raise TypeError("IsolatedExecutor jobs take positional arguments only")
+        return self._watchers.submit(self._run, fn, args)
+
+    def submit_with_timeout(self, timeout: float, fn: Callable, *args) -> Future:
+        """Like submit, with a wall-clock limit for this job instead of limits.timeout"""
+        return self._watchers.submit(self._run, fn, args, timeout)
+
+    def _run(self, func: Callable, args: tuple, timeout: Optional[float] = None) -> Any:
+        timeout = self.limits.timeout if timeout is None else timeout
+        receiver, sender = self._context.Pipe(duplex=False)
+        process_class = _JobProcess if sys.version_info[:2] in JOB_LAUNCHER_VERSIONS else self._context.Process
+        process = process_class(target=_child, args=(sender, func, args, timeout), daemon=True)
+        isolation_stats.started()
+        failure = None
+        try:
+            process.start()
+            sender.close()
+            with self._lock:
+                self._processes.add(process)
+
+            deadline = time.monotonic() + timeout
+            message = None
+            while message is None:
+                if receiver.poll(POLL_INTERVAL):
+                    try:
+                        message = receiver.recv()
+                    except EOFError:
+                        break
+                elif not process.is_alive():
+                    break
+                elif time.monotonic() > deadline:
+                    failure = "timeout"
+                elif self.limits.max_rss_bytes and _rss_bytes(process.pid) > self.limits.max_rss_bytes:
+                    failure = "memory"
+                if failure is not None:
+                    process.kill()
+                    break
+
+            process.join()
+            if failure is None and message is None and process.exitcode == -signal.SIGXCPU:
+                failure = "timeout"
+            if failure == "timeout":
+                raise IsolatedJobFailed(failure, f"Processing took longer than {timeout:g}s and was stopped")
+            if failure == "memory":
+                limit_mb = self.limits.max_rss_bytes // (1024 * 1024)
+                raise IsolatedJobFailed(failure, f"Processing used more than {limit_mb} MB of memory and was stopped")
+            if message is None:
+                failure = "crash"
+                raise IsolatedJobFailed(failure, f"Processing crashed (exit code {process.exitcode})")
+
+            status, value = message
+            if status == "error":
+                raise value
+            return value
+        finally:
+            with self._lock:
+                self._processes.discard(process)
+            receiver.close()
+            isolation_stats.finished(failure)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        if cancel_futures:
+            with self._lock:
+                for process in list(self._processes):
+                    process.kill()
+        self._watchers.shutdown(wait=wait, cancel_futures=cancel_futures)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+JS Obfuscator Tool - Obfuscate JavaScript source with identifier renaming and string encoding
+"""
+
+import sys
+import json
+import base64
+import re
+
+from seo_tools.timing import Timer
+
+def obfuscate_js(code, level="basic"):
+    """Obfuscate JavaScript code at the requested level (basic, medium, advanced)"""
+    try:
+        if level == "basic":
+            # Simple variable name obfuscation
+            var_names = re.findall(r'\bvar\s+(\w+)', code)
+            func_names = re.findall(r'\bfunction\s+(\w+)', code)
+            
+            obfuscated = code
+            counter = 0
+            for var in set(var_names + func_names):
+                if var not in ['console', 'document', 'window', 'alert']:
+                    obfuscated = re.sub(r'\b' + var + r'\b', f'_{hex(counter)[2:]}', obfuscated)
+                    counter += 1
+            
+            return obfuscated
+            
+        elif level == "medium":
+            # Variable obfuscation + string encoding
+            obfuscated = obfuscate_js(code, "basic")
+            
+            # Encode strings
+            strings = re.findall(r'"([^"]*)"', obfuscated)
+            for s in strings:
+                if s:
+                    encoded = base64.b64encode(s.encode()).decode()
+                    obfuscated = obfuscated.replace(f'"{s}"', f'atob("{encoded}")')
+            
+            return obfuscated
+            
+        elif level == "advanced":
+            # Full obfuscation with encoding
+            obfuscated = obfuscate_js(code, "medium")
+            
+            # Add extra layer of base64 encoding for the entire code
+            encoded_full = base64.b64encode(obfuscated.encode()).decode()
+            return f'eval(atob("{encoded_full}"))'
+            
+        return code
+        
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+def process_obfuscation(code, level="basic"):
+    """Obfuscate JavaScript code and return the tool result"""
+    timer = Timer()
+    with timer.span("transform"):
+        obfuscated = obfuscate_js(code, level)
+    return timer.attach({"success": True, "obfuscated": obfuscated})
+
+def main():
+    """Main function for command line usage"""
+    if len(sys.argv) < 2:
+        print("Usage: python js-obfuscator.py '<code>' [level]")
+        sys.exit(1)
+    
+    code = sys.argv[1]
+    level = sys.argv[2] if len(sys.argv) > 2 else "basic"
+    
+    result = obfuscate_js(code, level)
+    print(json.dumps({"success": True, "obfuscated": result}))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+JWT Decoder Tool - Decode JWT header and payload without verifying the signature
+"""
+
+import sys
+import json
+import jwt
+
+from seo_tools.timing import Timer
+
+def decode_jwt(token):
+    """Decode JWT header and payload (signature is not verified)"""
+    timer = Timer()
+    try:
+        with timer.span("decode"):
+            # Decode header
+            header = jwt.get_unverified_header(token)
+            
+            # Decode payload (without verification)
+            payload = jwt.decode(token, options={"verify_signature": False})
+        
+        return timer.attach({
+            "success": True,
+            "header": header,
+            "payload": payload
+        })
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+def main():
+    """Main function for command line usage"""
+    if len(sys.argv) != 2:
+        print("Usage: python jwt-decoder.py <token>")
+        sys.exit(1)
+    
+    result = decode_jwt(sys.argv[1])
+    print(json.dumps(result))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,657 @@
+import requests
+import sys
+import time
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import urlparse, urljoin
+from typing import Any, Iterable, List, Dict, Optional, Tuple
+import re
+
+from seo_tools.fetch import FetchTrace, fetch_trace, new_session
+from seo_tools.timing import Timer
+
+# Final pages are read only up to </head> or this many bytes to find a meta refresh
+SNIFF_MAX_BYTES = 32 * 1024
+HEAD_END = re.compile(rb'</head\s*>', re.IGNORECASE)
+# HEAD answers that mean the server does not implement HEAD; the host then gets GETs
+HEAD_UNSUPPORTED_STATUSES = (405, 501)
+
+
+def needs_sniff(headers) -> bool:
+    """Whether a 200 response may carry a meta refresh (HTML or unlabeled)"""
+    content_type = headers.get('content-type', '').lower()
+    return not content_type or 'html' in content_type
+
+
+def sniff_limit(buffer: bytes) -> int:
+    """Bytes of a partial body worth keeping: through </head>, else up to the cap (-1 while neither is reached)"""
+    match = HEAD_END.search(buffer)
+    if match:
+        return match.end()
+    return SNIFF_MAX_BYTES if len(buffer) >= SNIFF_MAX_BYTES else -1
+
+
+# Response headers kept on each step. "seo" keeps what matters for redirects,
+# caching and indexing; "none" drops the headers entirely. Audits of many
+# URLs use "seo" so repeated Server/Date/Set-Cookie values are not stored.
+HEADER_PROFILES = {
+    'none': frozenset(),
+    'seo': frozenset((
+        'location', 'content-type', 'content-language', 'cache-control', 'expires', 'last-modified',
+        'vary', 'link', 'refresh', 'x-robots-tag', 'strict-transport-security'
+    )),
+    'all': None,
+}
+# Headers whose values repeat across a site; interned so a large audit holds each value once
+INTERNED_HEADER_VALUES = frozenset((
+    'content-type', 'content-language', 'cache-control', 'vary', 'server', 'x-robots-tag',
+    'strict-transport-security', 'connection', 'content-encoding', 'transfer-encoding', 'via', 'x-powered-by'
+))
+
+
+def capture_headers(headers, profile: str) -> Optional[Dict[str, str]]:
+    """The headers a step keeps under a capture profile (None for "none")"""
+    keep = HEADER_PROFILES[profile]
+    if keep is not None and not keep:
+        return None
+    captured = {}
+    for name, value in headers.items():
+        lower = name.lower()
+        if keep is not None and lower not in keep:
+            continue
+        captured[sys.intern(name)] = sys.intern(value) if lower in INTERNED_HEADER_VALUES else value
+    return captured
+
+
+# Hop memo lifetimes in seconds. Permanent redirects are shared for the whole
+# audit; temporary ones (geo, A/B, login) only briefly. Cache-Control max-age
+# overrides both, up to PERMANENT_HOP_TTL.
+PERMANENT_REDIRECTS = (301, 308)
+PERMANENT_HOP_TTL = 24 * 3600
+TEMPORARY_HOP_TTL = 60
+# Default hop memo size (entries) of a checker
+HOP_MEMO_MAX_ENTRIES = 100000
+# Width in characters of the waterfall bars in the text report
+WATERFALL_WIDTH = 40
+CACHE_CONTROL_MAX_AGE = re.compile(r'(?:^|,)\s*max-age\s*=\s*"?(\d+)', re.IGNORECASE)
+
+
+def hop_ttl(status_code: int, headers) -> float:
+    """How long a redirect response may be reused (0: never)"""
+    cache_control = headers.get('cache-control', '').lower()
+    if 'no-store' in cache_control or 'no-cache' in cache_control:
+        return 0
+    max_age = CACHE_CONTROL_MAX_AGE.search(cache_control)
+    if max_age:
+        return min(int(max_age.group(1)), PERMANENT_HOP_TTL)
+    return PERMANENT_HOP_TTL if status_code in PERMANENT_REDIRECTS else TEMPORARY_HOP_TTL
+
+
+@dataclass
+class MemoHop:
+    status_code: int
+    reason: str
+    headers: Dict[str, str]
+    location: str
+    method: str
+    expires: float
+
+
+class HopMemo:
+    """url -> redirect response memo, so hops shared by many chains are fetched once"""
+
+    def __init__(self, max_entries: int = HOP_MEMO_MAX_ENTRIES, header_profile: str = 'all'):
+        self.max_entries = max_entries
+        self.header_profile = header_profile
+        self._entries: "OrderedDict[str, MemoHop]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url: str) -> Optional[MemoHop]:
+        with self._lock:
+            hop = self._entries.get(url)
+            if hop is not None and hop.expires <= time.monotonic():
+                del self._entries[url]
+                hop = None
+            if hop is None:
+                self.misses += 1
+            else:
+                # Least recently used first out, so hops shared by many chains stay
+                self._entries.move_to_end(url)
+                self.hits += 1
+            return hop
+
+    def put(self, url: str, status_code: int, reason: Optional[str], headers, method: str):
+        """Remember a redirect response unless it has no Location or may not be reused"""
+        location = headers.get('location', '')
+        ttl = hop_ttl(status_code, headers)
+        if not location or ttl <= 0:
+            return
+        kept = capture_headers(headers, self.header_profile) or {}
+        hop = MemoHop(status_code, reason or '', kept, location, method, time.monotonic() + ttl)
+        with self._lock:
+            self._entries[url] = hop
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def restore(self, url: str, status_code: int, reason: str, headers: Dict[str, str], location: str,
+                method: str, ttl: float):
+        """Add a hop remembered elsewhere (a ChainStore) with its remaining lifetime"""
+        hop = MemoHop(status_code, reason, headers, location, method, time.monotonic() + ttl)
+        with self._lock:
+            self._entries[url] = hop
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+class RedirectGraph:
+    """Deduplicated redirect graph of an audit: every redirecting URL and hop once
+
+    With max_nodes the graph stops taking new nodes and edges at that size
+    (the counters keep going) and its stats say it was truncated.
+    """
+
+    def __init__(self, max_nodes: Optional[int] = None):
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.edges: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.max_nodes = max_nodes
+        self.truncated = False
+        self.chains = 0
+        self.redirect_steps = 0
+        self.memoized_steps = 0
+
+    def _full(self, collection: Dict) -> bool:
+        if self.max_nodes is not None and len(collection) >= self.max_nodes:
+            self.truncated = True
+            return True
+        return False
+
+    def add(self, result: Dict):
+        """Merge one check_redirect_chain result; chains without redirects add no nodes"""
+        self.chains += 1
+        chain = result.get('chain') or []
+        if not any(step.get('redirect_to') for step in chain):
+            return
+        for step in chain:
+            url = step.get('url')
+            if not url:
+                continue
+            node = self.nodes.get(url)
+            if node is None and not self._full(self.nodes):
+                node = {'url': url, 'status_code': step.get('status_code'), 'chains': 0}
+                if step.get('error'):
+                    node['error'] = step['error']
+                self.nodes[url] = node
+            if node is not None:
+                node['chains'] += 1
+            target = step.get('redirect_to')
+            if target:
+                self.redirect_steps += 1
+                if step.get('memoized'):
+                    self.memoized_steps += 1
+                edge = self.edges.get((url, target))
+                if edge is None and not self._full(self.edges):
+                    edge = {'from': url, 'to': target, 'status_code': step.get('status_code'), 'chains': 0}
+                    self.edges[(url, target)] = edge
+                if edge is not None:
+                    edge['chains'] += 1
+
+    def report(self, memo: Optional[HopMemo] = None) -> Dict:
+        stats = {
+            'chains': self.chains,
+            'redirect_steps': self.redirect_steps,
+            'unique_redirects': len(self.edges),
+            'shared_redirects': sum(1 for edge in self.edges.values() if edge['chains'] > 1),
+            'memoized_steps': self.memoized_steps,
+            'truncated': self.truncated
+        }
+        if memo is not None:
+            stats['hop_memo'] = memo.stats()
+        return {
+            'nodes': list(self.nodes.values()),
+            'edges': list(self.edges.values()),
+            'stats': stats
+        }
+
+
+class RedirectChainChecker:
+    def __init__(self, timeout: int = 10, max_redirects: int = 15, header_profile: str = 'all',
+                 hop_memo_size: int = HOP_MEMO_MAX_ENTRIES, meta_refresh: bool = True):
+        if header_profile not in HEADER_PROFILES:
+            raise ValueError(f"Unknown header profile: {header_profile} (use {', '.join(HEADER_PROFILES)})")
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.header_profile = header_profile
+        # Whether final HTML pages are sniffed for a meta refresh (needs their <head>)
+        self.meta_refresh = meta_refresh
+        self.session = new_session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        })
+        # Hosts that answered HEAD with 405/501; their hops go straight to GET
+        self.head_unsupported = set()
+        # Redirect hops seen by this checker, reused across its chains
+        self.hop_memo = HopMemo(hop_memo_size, header_profile)
+
+    def validate_url(self, url: str) -> Tuple[bool, str]:
+        """Validate and normalize URL"""
+        if not url:
+            return False, "URL cannot be empty"
+        
+        # Add protocol if missing
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+        
+        # Basic URL validation
+        try:
+            parsed = urlparse(url)
+            if not parsed.netloc:
+                return False, "Invalid URL format"
+            return True, url
+        except Exception:
+            return False, "Invalid URL format"
+
+    def check_redirect_chain(self, url: str) -> Dict:
+        """Check complete redirect chain for a URL"""
+        is_valid, normalized_url = self.validate_url(url)
+        if not is_valid:
+            return {
+                'success': False,
+                'error': normalized_url,
+                'chain': [],
+                'summary': {}
+            }
+
+        chain = []
+        current_url = normalized_url
+        start_time = time.time()
+        timer = Timer()
+        
+        try:
+            for step in range(self.max_redirects + 1):
+                step_start = time.time()
+                
+                try:
+                    hop = self.hop_memo.get(current_url)
+                    if hop is not None:
+                        next_url = self._redirect_target(chain, self._memo_step(step, current_url, hop), hop.location)
+                        if next_url is None:
+                            break
+                        current_url = next_url
+                        continue
+
+                    with timer.span("network", hop=step + 1), fetch_trace() as trace:
+                        response = self._probe(current_url, trace)
+                    
+                    # Streamed GET bodies are only read as far as needed; close releases them
+                    with response:
+                        step_time = round((time.time() - step_start) * 1000, 2)
+                        step_info = self._build_step(
+                            step, current_url, response.status_code, response.reason, response.headers, step_time
+                        )
+                        step_info['method'] = response.request.method
+                        step_info['timing'] = trace.report()
+                    
+                        # Check for redirect
+                        if 300 <= response.status_code < 400:
+                            self.hop_memo.put(
+                                current_url, response.status_code, response.reason, response.headers, step_info['method']
+                            )
+                            next_url = self._redirect_target(chain, step_info, response.headers.get('location', ''))
+                            if next_url is None:
+                                break
+                            current_url = next_url
+                        
+                        else:
+                            # Final response (200, 404, etc.)
+                            if self.meta_refresh and response.status_code == 200 and needs_sniff(response.headers):
+                                # Check for meta refresh redirects in the <head> only
+                                try:
+                                    with timer.span("network", hop=step + 1, step="head"):
+                                        content = self._read_head_section(response)
+                                    trace.body_done()
+                                    step_info['timing'] = trace.report()
+                                    with timer.span("analyze", hop=step + 1):
+                                        meta_refresh = self._check_meta_refresh(content)
+                                    if meta_refresh:
+                                        step_info['meta_refresh'] = meta_refresh
+                                except:
+                                    pass
+                        
+                            chain.append(step_info)
+                            break
+                        
+                except requests.exceptions.Timeout:
+                    chain.append({
+                        'step': step + 1,
+                        'url': current_url,
+                        'error': 'Request timeout',
+                        'response_time': self.timeout * 1000
+                    })
+                    break
+                except requests.exceptions.ConnectionError:
+                    chain.append({
+                        'step': step + 1,
+                        'url': current_url,
+                        'error': 'Connection failed',
+                        'response_time': round((time.time() - step_start) * 1000, 2)
+                    })
+                    break
+                except Exception as e:
+                    chain.append({
+                        'step': step + 1,
+                        'url': current_url,
+                        'error': f'Request failed: {str(e)}',
+                        'response_time': round((time.time() - step_start) * 1000, 2)
+                    })
+                    break
+            
+            else:
+                # Max redirects exceeded
+                chain.append({
+                    'step': len(chain) + 1,
+                    'error': f'Too many redirects (>{self.max_redirects})',
+                    'url': current_url
+                })
+            
+            total_time = round((time.time() - start_time) * 1000, 2)
+            with timer.span("analyze", step="summary"):
+                summary = self._generate_summary(chain, total_time, normalized_url)
+            
+            return timer.attach({
+                'success': True,
+                'chain': chain,
+                'summary': summary,
+                'original_url': normalized_url,
+                'total_time': total_time
+            })
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Analysis failed: {str(e)}',
+                'chain': [],
+                'summary': {}
+            }
+
+    def _probe(self, url: str, trace: FetchTrace) -> requests.Response:
+        """Request one hop without reading its body
+
+        With meta refresh sniffing the hop is a streamed GET, so a final HTML
+        page needs no second request for its <head>. Otherwise it is a HEAD,
+        repeated as a GET only when the host answers 405/501.
+        """
+        host = urlparse(url).netloc.lower()
+        if not self.meta_refresh and host not in self.head_unsupported:
+            response = self.session.head(url, allow_redirects=False, timeout=self.timeout, verify=True)
+            if response.status_code not in HEAD_UNSUPPORTED_STATUSES:
+                trace.response_started()
+                return response
+            self.head_unsupported.add(host)
+            trace.response_started('head_fallback')
+            response.close()
+        response = self.session.get(url, allow_redirects=False, timeout=self.timeout, verify=True, stream=True)
+        trace.response_started()
+        return response
+
+    def _read_head_section(self, response: requests.Response) -> str:
+        """Read a streamed body up to </head> or SNIFF_MAX_BYTES and decode it"""
+        buffer = b''
+        limit = -1
+        for chunk in response.iter_content(chunk_size=4096):
+            buffer += chunk
+            limit = sniff_limit(buffer)
+            if limit >= 0:
+                break
+        if limit >= 0:
+            buffer = buffer[:limit]
+        return buffer.decode(response.encoding or 'utf-8', errors='replace')
+
+    def _build_step(self, step: int, url: str, status_code: int, reason: Optional[str],
+                    headers, response_time: float) -> Dict:
+        """Chain entry for one response (shared with the async bulk engine)
+
+        Domains, schemes and status texts repeat across an audit and are
+        interned; headers are kept according to the checker's header profile.
+        """
+        parsed_url = urlparse(url)
+        step_info = {
+            'step': step + 1,
+            'url': url,
+            'status_code': status_code,
+            'status_text': sys.intern(reason or ''),
+            'domain': sys.intern(parsed_url.netloc),
+            'protocol': sys.intern(parsed_url.scheme),
+            'response_time': response_time,
+            'is_redirect': 300 <= status_code < 400,
+            'is_final': status_code == 200,
+            'is_error': status_code >= 400
+        }
+        captured = capture_headers(headers, self.header_profile)
+        if captured is not None:
+            step_info['headers'] = captured
+        return step_info
+
+    def _memo_step(self, step: int, url: str, hop: MemoHop) -> Dict:
+        """Chain entry for a hop answered from the memo"""
+        step_info = self._build_step(step, url, hop.status_code, hop.reason, hop.headers, 0.0)
+        step_info['method'] = hop.method
+        step_info['memoized'] = True
+        return step_info
+
+    def _redirect_target(self, chain: List[Dict], step_info: Dict, location: str) -> Optional[str]:
+        """Append a redirect step to the chain; the URL to follow, or None when the chain ends here"""
+        if not location:
+            step_info['error'] = 'Redirect without location header'
+            chain.append(step_info)
+            return None
+
+        # Handle relative URLs
+        next_url = urljoin(step_info['url'], location)
+        step_info['redirect_to'] = next_url
+
+        # Check for redirect loop
+        if next_url in [entry['url'] for entry in chain]:
+            step_info['error'] = 'Redirect loop detected'
+            chain.append(step_info)
+            return None
+
+        chain.append(step_info)
+        return next_url
+
+    def audit(self, urls: Iterable[str]) -> Dict:
+        """Check many URLs, sharing hops between chains, and report the redirect graph"""
+        graph = RedirectGraph()
+        results = []
+        for url in urls:
+            result = self.check_redirect_chain(url)
+            graph.add(result)
+            results.append(result)
+        return {
+            'success': True,
+            'results': results,
+            'graph': graph.report(self.hop_memo)
+        }
+
+    def _check_meta_refresh(self, content: str) -> Optional[str]:
+        """Check for meta refresh redirects in HTML content"""
+        try:
+            meta_refresh_pattern = r'<meta[^>]*http-equiv=["\']refresh["\'][^>]*content=["\']([^"\']*)["\']'
+            match = re.search(meta_refresh_pattern, content, re.IGNORECASE)
+            if match:
+                content_attr = match.group(1)
+                url_match = re.search(r'url=([^;]+)', content_attr, re.IGNORECASE)
+                if url_match:
+                    return url_match.group(1).strip()
+        except:
+            pass
+        return None
+
+    def _generate_summary(self, chain: List[Dict], total_time: float, original_url: str) -> Dict:
+        """Generate summary of redirect chain analysis"""
+        if not chain:
+            return {}
+        
+        final_step = chain[-1]
+        redirect_count = len([step for step in chain if step.get('is_redirect', False)])
+        
+        # Determine status
+        if any(step.get('error') for step in chain):
+            status = 'error'
+            status_text = 'Error in redirect chain'
+        elif 'redirect loop' in str(chain).lower():
+            status = 'loop'
+            status_text = 'Redirect loop detected'
+        elif redirect_count == 0:
+            status = 'direct'
+            status_text = 'Direct response (no redirects)'
+        elif final_step.get('is_final'):
+            status = 'success'
+            status_text = 'Redirect chain completed successfully'
+        else:
+            status = 'incomplete'
+            status_text = 'Redirect chain incomplete'
+        
+        # Check for protocol downgrades
+        protocol_warning = False
+        for i, step in enumerate(chain[:-1]):
+            if step.get('protocol') == 'https' and chain[i+1].get('protocol') == 'http':
+                protocol_warning = True
+                break
+        
+        # Final URL
+        final_url = final_step.get('url', '')
+        final_status = final_step.get('status_code')
+        
+        return {
+            'status': status,
+            'status_text': status_text,
+            'redirect_count': redirect_count,
+            'total_steps': len(chain),
+            'final_url': final_url,
+            'final_status_code': final_status,
+            'total_time': total_time,
+            'protocol_warning': protocol_warning,
+            'has_errors': any(step.get('error') for step in chain),
+            'original_url': original_url,
+            'url_changed': original_url.rstrip('/') != final_url.rstrip('/') if final_url else True
+        }
+
+    def generate_report(self, result: Dict, format_type: str = 'text') -> str:
+        """Generate downloadable report"""
+        if not result.get('success'):
+            return f"Error: {result.get('error', 'Unknown error')}"
+        
+        if format_type == 'json':
+            return json.dumps(result, indent=2)
+        
+        # Text format
+        report = []
+        report.append("=== REDIRECT CHAIN ANALYSIS REPORT ===")
+        report.append(f"Original URL: {result['original_url']}")
+        report.append(f"Analysis Time: {result['total_time']}ms")
+        report.append("")
+        
+        summary = result['summary']
+        report.append("=== SUMMARY ===")
+        report.append(f"Status: {summary['status_text']}")
+        report.append(f"Total Redirects: {summary['redirect_count']}")
+        report.append(f"Final URL: {summary['final_url']}")
+        report.append(f"Final Status: {summary['final_status_code']}")
+        if summary['protocol_warning']:
+            report.append("⚠️  WARNING: HTTPS to HTTP downgrade detected")
+        report.append("")
+        
+        report.append("=== REDIRECT CHAIN ===")
+        # One time scale for every hop so the waterfalls are comparable
+        scale = max([self._waterfall_end(step.get('timing')) for step in result['chain']] + [1.0])
+        for step in result['chain']:
+            step_num = step['step']
+            url = step['url']
+            status = step.get('status_code', 'N/A')
+            time_ms = step.get('response_time', 0)
+            
+            if step.get('error'):
+                report.append(f"Step {step_num}: ERROR - {step['error']}")
+            else:
+                redirect_to = step.get('redirect_to', '')
+                arrow = f" → {redirect_to}" if redirect_to else ""
+                memoized = " (memoized)" if step.get('memoized') else ""
+                report.append(f"Step {step_num}: {url} [{status}] ({time_ms}ms){arrow}{memoized}")
+            if step.get('timing'):
+                report.extend(self._waterfall_lines(step['timing'], scale))
+        
+        return "\n".join(report)
+
+    def _waterfall_end(self, timing: Optional[Dict]) -> float:
+        """Milliseconds from the start of a hop to the end of its last phase"""
+        if not timing or not timing.get('waterfall'):
+            return 0.0
+        last = timing['waterfall'][-1]
+        return last['start'] + last['duration']
+
+    def _waterfall_lines(self, timing: Dict, scale: float) -> List[str]:
+        """Text waterfall of one hop's network phases, bars scaled to `scale` ms"""
+        lines = []
+        for entry in timing['waterfall']:
+            start = int(entry['start'] / scale * WATERFALL_WIDTH)
+            length = max(1, round(entry['duration'] / scale * WATERFALL_WIDTH))
+            bar = (' ' * start + '█' * length)[:WATERFALL_WIDTH]
+            lines.append(f"    {entry['phase']:<13} |{bar:<{WATERFALL_WIDTH}}| {entry['duration']}ms")
+        notes = ['reused connection' if timing.get('connection_reused') else 'new connection']
+        if timing.get('dns_cached'):
+            notes.append('cached DNS')
+        if timing.get('tls_resumed') is not None:
+            notes.append(f"TLS resumed ({timing['tls_version']})" if timing['tls_resumed'] else f"full TLS handshake ({timing['tls_version']})")
+        lines.append("    " + ", ".join(notes))
+        return lines
+
+
+# Test function
+def test_redirect_checker():
+    checker = RedirectChainChecker()
+    
+    test_urls = [
+        "google.com",
+        "httpbin.org/redirect/3",
+        "httpbin.org/status/404",
+    ]
+    
+    for url in test_urls:
+        print(f"\nTesting: {url}")
+        result = checker.check_redirect_chain(url)
+        print(f"Success: {result['success']}")
+        if result['success']:
+            print(f"Steps: {len(result['chain'])}")
+            print(f"Final URL: {result['summary']['final_url']}")
+        else:
+            print(f"Error: {result['error']}")
+
+
+def main():
+    """Main function for command line usage"""
+    import sys
+    
+    if len(sys.argv) >= 3 and sys.argv[1] == "check-url":
+        url = sys.argv[2]
+        checker = RedirectChainChecker()
+        result = checker.check_redirect_chain(url)
+        print(json.dumps(result))
+    elif len(sys.argv) >= 3 and sys.argv[1] == "audit":
+        with open(sys.argv[2]) as f:
+            urls = [line.strip() for line in f if line.strip()]
+        print(json.dumps(RedirectChainChecker().audit(urls)))
+    else:
+        test_redirect_checker()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,196 @@
+"""
+Compact exports of bulk redirect audits
+
+A chain result is a nested dict per URL; stored as JSON a 50k-URL audit is
+mostly repeated keys. The exports here flatten chains to one row per step
+with a fixed set of fields:
+
+    csv        one CSV row per step (the header columns follow the capture profile)
+    ndjson.gz  gzip-compressed NDJSON of column blocks: each line holds per-field
+               arrays for up to BLOCK_ROWS steps, then a graph and a summary line
+    ndjson     the plain per-chain lines of BulkRedirectChecker.stream_ndjson
+
+Every format is produced by an encoder with the same incremental interface
+(start / encode / error / finish returning bytes), so the streaming endpoint
+and the list exports share one implementation.
+"""
+
+import io
+import csv
+import json
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from seo_tools.fetch import WATERFALL_PHASES
+from seo_tools.redirect_checker import HEADER_PROFILES
+
+# Step fields, in column order
+STEP_FIELDS = (
+    'chain', 'source_url', 'step', 'url', 'status_code', 'status_text', 'method', 'response_time',
+    'redirect_to', 'memoized', 'meta_refresh', 'error'
+)
+# Network phase columns (milliseconds) from each step's timing
+TIMING_FIELDS = tuple(f'{phase}_ms' for phase in WATERFALL_PHASES) + ('connection_reused',)
+# Steps per column block in ndjson.gz
+BLOCK_ROWS = 1000
+
+
+def step_rows(index: int, result: Dict) -> Iterator[Dict[str, Any]]:
+    """Flat rows for one chain result: one per step, or a single error row"""
+    source_url = result.get('original_url', '')
+    if not result.get('success'):
+        yield {'chain': index, 'source_url': source_url, 'error': result.get('error', 'Unknown error')}
+        return
+    for step in result.get('chain') or []:
+        row = {'chain': index, 'source_url': source_url}
+        for field in STEP_FIELDS[2:]:
+            if field in step:
+                row[field] = step[field]
+        timing = step.get('timing')
+        if timing:
+            for phase, duration in timing['phases'].items():
+                row[f'{phase}_ms'] = duration
+            row['connection_reused'] = timing['connection_reused']
+        for name, value in (step.get('headers') or {}).items():
+            row[f'header:{name.lower()}'] = value
+        yield row
+
+
+class NDJSONEncoder:
+    """One JSON line per chain, then graph and summary lines"""
+
+    media_type = 'application/x-ndjson'
+    extension = 'ndjson'
+
+    def __init__(self, header_profile: str = 'seo'):
+        self.header_profile = header_profile
+
+    def start(self) -> bytes:
+        return b''
+
+    def encode(self, index: int, result: Dict) -> bytes:
+        result['index'] = index
+        return json.dumps(result).encode() + b'\n'
+
+    def error(self, message: str) -> bytes:
+        return json.dumps({'success': False, 'error': f'URL source failed: {message}'}).encode() + b'\n'
+
+    def finish(self, graph: Dict, summary: Dict) -> bytes:
+        return json.dumps({'graph': graph}).encode() + b'\n' + json.dumps({'summary': summary}).encode() + b'\n'
+
+
+class CSVEncoder:
+    """One CSV row per step; "all" headers go into a single JSON column"""
+
+    media_type = 'text/csv'
+    extension = 'csv'
+
+    def __init__(self, header_profile: str = 'seo'):
+        self.header_profile = header_profile
+        keep = HEADER_PROFILES[header_profile]
+        if keep is None:
+            header_columns = ['headers']
+        else:
+            header_columns = [f'header:{name}' for name in sorted(keep)]
+        self.columns = list(STEP_FIELDS + TIMING_FIELDS) + header_columns
+
+    def _rows(self, rows: Iterable[Dict[str, Any]]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            if self.columns[-1] == 'headers':
+                headers = {key[7:]: row.pop(key) for key in list(row) if key.startswith('header:')}
+                row['headers'] = json.dumps(headers) if headers else ''
+            writer.writerow(['' if row.get(column) is None else row[column] for column in self.columns])
+        return buffer.getvalue().encode()
+
+    def start(self) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(self.columns)
+        return buffer.getvalue().encode()
+
+    def encode(self, index: int, result: Dict) -> bytes:
+        return self._rows(step_rows(index, result))
+
+    def error(self, message: str) -> bytes:
+        # A failed URL source ends the audit with a row that has only the error set
+        return self._rows([{'error': f'URL source failed: {message}'}])
+
+    def finish(self, graph: Dict, summary: Dict) -> bytes:
+        return b''
+
+
+class ColumnarNDJSONEncoder:
+    """gzip NDJSON of column blocks ({"rows": n, "columns": {field: [...]}})"""
+
+    media_type = 'application/gzip'
+    extension = 'ndjson.gz'
+
+    def __init__(self, header_profile: str = 'seo', block_rows: int = BLOCK_ROWS):
+        self.header_profile = header_profile
+        self.block_rows = block_rows
+        self._columns: Dict[str, List[Any]] = {}
+        self._rows = 0
+        # wbits 31: gzip container, so the output opens with gunzip / zcat
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+
+    def _add(self, row: Dict[str, Any]):
+        for column, values in self._columns.items():
+            values.append(row.get(column))
+        for column, value in row.items():
+            if column not in self._columns:
+                # Columns first seen mid-block are back-filled with nulls
+                self._columns[column] = [None] * self._rows + [value]
+        self._rows += 1
+
+    def _flush_block(self) -> bytes:
+        if not self._rows:
+            return b''
+        line = json.dumps({'rows': self._rows, 'columns': self._columns}).encode() + b'\n'
+        self._columns = {}
+        self._rows = 0
+        return self._compressor.compress(line)
+
+    def start(self) -> bytes:
+        return b''
+
+    def encode(self, index: int, result: Dict) -> bytes:
+        for row in step_rows(index, result):
+            self._add(row)
+        if self._rows >= self.block_rows:
+            return self._flush_block()
+        return b''
+
+    def error(self, message: str) -> bytes:
+        line = json.dumps({'success': False, 'error': f'URL source failed: {message}'}).encode() + b'\n'
+        return self._flush_block() + self._compressor.compress(line)
+
+    def finish(self, graph: Dict, summary: Dict) -> bytes:
+        trailer = json.dumps({'graph': graph}).encode() + b'\n' + json.dumps({'summary': summary}).encode() + b'\n'
+        return self._flush_block() + self._compressor.compress(trailer) + self._compressor.flush()
+
+
+EXPORT_FORMATS = {
+    'ndjson': NDJSONEncoder,
+    'csv': CSVEncoder,
+    'ndjson.gz': ColumnarNDJSONEncoder,
+}
+
+
+def get_encoder(export_format: str, header_profile: str = 'seo'):
+    """Encoder for an export format name"""
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {export_format} (use {', '.join(EXPORT_FORMATS)})")
+    return EXPORT_FORMATS[export_format](header_profile)
+
+
+def export_results(results: Iterable[Dict], export_format: str, header_profile: str = 'seo',
+                   graph: Optional[Dict] = None, summary: Optional[Dict] = None) -> bytes:
+    """Encode already collected chain results (in input order) in one go"""
+    encoder = get_encoder(export_format, header_profile)
+    parts = [encoder.start()]
+    for index, result in enumerate(results):
+        parts.append(encoder.encode(index, result))
+    parts.append(encoder.finish(graph or {}, summary or {}))
+    return b''.join(parts)
+
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Regex Generator Tool - Build common regular expressions and test them against sample text
+"""
+
+import sys
+import json
+import re
+
+def generate_regex(pattern, options, test_string=""):
+    """Resolve a preset or custom pattern and test it against a sample string"""
+    try:
+        regex_map = {
+            "email": r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
+            "phone": r"\+?1?\d{9,15}",
+            "url": r"https?://(?:[-\w.])+(?:\.[a-zA-Z]{2,5})+/?.*",
+            "ipv4": r"\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\b",
+            "date": r"\d{4}-\d{2}-\d{2}",
+            "time": r"\d{2}:\d{2}(?::\d{2})?",
+            "number": r"\d+",
+            "word": r"\w+",
+            "custom": pattern
+        }
+        
+        regex_pattern = regex_map.get(pattern, pattern)
+        
+        # Apply options
+        flags = 0
+        if options.get("case_insensitive", False):
+            flags |= re.IGNORECASE
+        if options.get("multiline", False):
+            flags |= re.MULTILINE
+        
+        # Test the regex if test string provided
+        matches = []
+        if test_string:
+            try:
+                compiled_regex = re.compile(regex_pattern, flags)
+                matches = compiled_regex.findall(test_string)
+            except Exception as e:
+                pass
+        
+        return {
+            "success": True,
+            "regex": regex_pattern,
+            "matches": matches,
+            "test_string": test_string
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+def main():
+    """Main function for command line usage"""
+    if len(sys.argv) < 2:
+        print("Usage: python regex-generator.py <pattern> ['<options_json>'] [test_string]")
+        sys.exit(1)
+    
+    pattern = sys.argv[1]
+    options = json.loads(sys.argv[2]) if len(sys.argv) > 2 else {}
+    test_string = sys.argv[3] if len(sys.argv) > 3 else ""
+    
+    result = generate_regex(pattern, options, test_string)
+    print(json.dumps(result))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Tool registry - lazy, per-tool module loading for the seo_tools package
+
+Tool modules pull in heavy native dependencies (pikepdf, fitz, pytesseract,
+numpy, PIL) at import time. The registry only imports a tool module the first
+time that tool is used and records what the import cost, so a worker that
+serves a subset of tools never pays for the rest.
+"""
+
+import os
+import sys
+import time
+import importlib
+import threading
+from dataclasses import dataclass, asdict
+from types import ModuleType
+from typing import Dict, List, Optional, Iterable
+
+TOOL_GROUPS = ("url", "text", "image", "pdf")
+
+# Scheduler concurrency classes: "cpu" runs in a process pool sized to the
+# cores, "io" in a wide pool for network-bound tools, "light" for cheap text tools
+CONCURRENCY_CLASSES = ("cpu", "io", "light")
+
+# Seconds a text tool job may run before its caller gets an error
+TEXT_TIMEOUT = float(os.environ.get("TOOL_TEXT_TIMEOUT", 10))
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    name: str
+    module: str
+    group: str
+    concurrency: str = "light"
+    # Max jobs of this tool running at once (None: only the class limit applies)
+    limit: Optional[int] = None
+    # Seconds before a job is abandoned (None: no limit beyond the isolation timeout)
+    timeout: Optional[float] = None
+    # Run jobs of a thread class in isolated children, which can be killed at the timeout
+    isolated: bool = False
+
+
+@dataclass
+class ImportStat:
+    module: str
+    seconds: float
+    modules_added: int
+    packages_added: List[str]
+    error: Optional[str] = None
+
+
+class UnknownTool(KeyError):
+    """Raised when a tool name is not registered"""
+
+
+class ToolUnavailable(Exception):
+    """Raised when a tool module cannot be imported (missing dependency)"""
+
+    def __init__(self, name: str, reason: str):
+        super().__init__(f"{name} is unavailable: {reason}")
+        self.name = name
+        self.reason = reason
+
+
+TOOL_SPECS = [
+    # URL tools (network bound)
+    ToolSpec("redirect-checker", "seo_tools.redirect_checker", "url", "io"),
+    # Runs its own asyncio engine on the service loop rather than in a pool
+    ToolSpec("bulk-redirect-checker", "seo_tools.bulk_redirect_checker", "url", "io"),
+    ToolSpec("schema-validator", "seo_tools.schema_validator", "url", "io"),
+    ToolSpec("safe-browsing-checker", "seo_tools.safe_browsing_checker", "url", "io"),
+    ToolSpec("ip-geolocation-finder", "seo_tools.ip_geolocation_finder", "url", "io"),
+    ToolSpec("domain-age-checker", "seo_tools.domain_age_checker", "url", "io"),
+    ToolSpec("adsense-ban-checker", "seo_tools.adsense_ban_checker", "url", "io", limit=8),
+    # Text and coding tools
+    ToolSpec("jwt-decoder", "seo_tools.jwt_decoder", "text", timeout=TEXT_TIMEOUT),
+    # User-supplied patterns can backtrack for ages while holding the GIL, which
+    # a thread cannot contain; they run in a child that is killed at the timeout
+    ToolSpec("regex-generator", "seo_tools.regex_generator", "text", timeout=TEXT_TIMEOUT, isolated=True),
+    ToolSpec("js-obfuscator", "seo_tools.js_obfuscator", "text", timeout=TEXT_TIMEOUT),
+    ToolSpec("html-to-markdown-converter", "seo_tools.html_to_markdown_converter", "text"),
+    ToolSpec("csv-to-json-converter", "seo_tools.csv_to_json_converter", "text"),
+    # Image tools (PIL, numpy, pytesseract)
+    ToolSpec("image-to-text-ocr", "seo_tools.image_to_text_ocr", "image", "cpu"),
+    ToolSpec("background-remover", "seo_tools.background_remover", "image", "cpu"),
+    ToolSpec("image-dpi-converter", "seo_tools.image_dpi_converter", "image", "cpu"),
+    ToolSpec("webp-to-jpg-converter", "seo_tools.webp_to_jpg_converter", "image", "cpu"),
+    ToolSpec("profile-picture-maker", "seo_tools.profile_picture_maker", "image", "cpu"),
+    # PDF tools (pikepdf, PyPDF2, fitz); crackers run for up to 90s, so they
+    # never get more than half the CPU pool
+    ToolSpec("enhanced-pdf-cracker", "seo_tools.enhanced_pdf_cracker", "pdf", "cpu", limit=max(1, (os.cpu_count() or 2) // 2)),
+    ToolSpec("pdf-password-remover", "seo_tools.pdf_password_remover", "pdf", "cpu", limit=max(1, (os.cpu_count() or 2) // 2)),
+]
+
+
+class ToolRegistry:
+    """Registry of tool modules, imported on first use"""
+
+    def __init__(self, specs: Iterable[ToolSpec]):
+        self._specs: Dict[str, ToolSpec] = {spec.name: spec for spec in specs}
+        self._modules: Dict[str, ModuleType] = {}
+        self._stats: Dict[str, ImportStat] = {}
+        self._lock = threading.RLock()
+
+    def spec(self, name: str) -> ToolSpec:
+        """Return the spec for a tool name"""
+        try:
+            return self._specs[name]
+        except KeyError:
+            raise UnknownTool(name) from None
+
+    def names(self, groups: Optional[Iterable[str]] = None) -> List[str]:
+        """List registered tool names, optionally restricted to groups"""
+        if groups is None:
+            return list(self._specs)
+        groups = set(groups)
+        return [name for name, spec in self._specs.items() if spec.group in groups]
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._modules
+
+    def load(self, name: str) -> ModuleType:
+        """Import a tool module on first use and record its import cost"""
+        module = self._modules.get(name)
+        if module is not None:
+            return module
+
+        with self._lock:
+            module = self._modules.get(name)
+            if module is not None:
+                return module
+
+            spec = self.spec(name)
+            modules_before = set(sys.modules)
+            start_time = time.perf_counter()
+            try:
+                module = importlib.import_module(spec.module)
+            except ImportError as e:
+                self._stats[name] = ImportStat(
+                    module=spec.module,
+                    seconds=round(time.perf_counter() - start_time, 4),
+                    modules_added=0,
+                    packages_added=[],
+                    error=str(e)
+                )
+                raise ToolUnavailable(name, str(e)) from e
+
+            elapsed = time.perf_counter() - start_time
+            added = set(sys.modules) - modules_before
+            packages = sorted({m.split('.')[0] for m in added} - {'seo_tools'})
+
+            self._stats[name] = ImportStat(
+                module=spec.module,
+                seconds=round(elapsed, 4),
+                modules_added=len(added),
+                packages_added=packages
+            )
+            self._modules[name] = module
+            return module
+
+    def preload(self, groups: Optional[Iterable[str]] = None) -> Dict[str, ImportStat]:
+        """Import every tool in the given groups; unavailable tools are skipped"""
+        for name in self.names(groups):
+            try:
+                self.load(name)
+            except ToolUnavailable:
+                pass
+        return dict(self._stats)
+
+    def import_stats(self) -> Dict[str, Dict]:
+        """Per-tool import cost for every tool loaded (or attempted) so far"""
+        return {name: asdict(stat) for name, stat in self._stats.items()}
+
+
+registry = ToolRegistry(TOOL_SPECS)
+
@@ -0,0 +1,281 @@
+"""
+Tool scheduler - per-tool concurrency limits, concurrency classes and backpressure
+
+Every job runs in the pool of its tool's concurrency class (see ToolSpec):
+
+    cpu     one isolated child per job, forked from a preloaded forkserver
+            (OCR, image transforms, PDF crackers; see isolation.py).
+            TOOL_ISOLATION=0 falls back to a plain process pool
+    io      wide thread pool for network-bound tools (redirect, schema, adsense)
+    light   small thread pool for cheap text tools
+
+A tool spec can also set a timeout: the caller then gets ToolTimeout when a
+thread job runs longer (the thread finishes in the background and holds its
+slots until it does), and an isolated job is killed. Thread-class tools marked isolated (regex-generator)
+keep their class's slots but run in isolated children, so they can be killed.
+
+Each class admits at most workers + queue_size jobs and each tool with a
+limit at most limit + queue_size; anything beyond that is rejected at once with
+Saturated (HTTP 429 + Retry-After in the tool service) instead of queueing
+behind a burst of heavy jobs, so cheap tools keep a flat latency.
+"""
+
+import os
+import math
+import time
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from seo_tools.isolation import PRELOAD_MODULES, IsolatedExecutor, isolation_stats
+from seo_tools.registry import CONCURRENCY_CLASSES, ToolRegistry, registry
+
+
+class ToolTimeout(Exception):
+    """Raised when a job with a timeout did not finish in time"""
+
+    def __init__(self, name: str, timeout: float):
+        super().__init__(f"Processing took longer than {timeout:g}s")
+        self.name = name
+        self.timeout = timeout
+
+
+class Saturated(Exception):
+    """Raised when a concurrency class or tool has no free slot or queue space"""
+
+    def __init__(self, name: str, retry_after: int):
+        super().__init__(f"{name} is saturated, retry after {retry_after}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+@dataclass
+class ClassConfig:
+    workers: int
+    queue_size: int
+
+
+def default_class_configs() -> Dict[str, ClassConfig]:
+    """Pool sizes from TOOL_SCHEDULER_<CLASS>_WORKERS / _QUEUE environment variables"""
+    cores = os.cpu_count() or 2
+    defaults = {
+        "cpu": (cores, cores * 2),
+        "io": (32, 128),
+        "light": (4, 64),
+    }
+    configs = {}
+    for name, (workers, queue_size) in defaults.items():
+        prefix = f"TOOL_SCHEDULER_{name.upper()}"
+        configs[name] = ClassConfig(
+            workers=max(1, int(os.environ.get(f"{prefix}_WORKERS", workers))),
+            queue_size=max(0, int(os.environ.get(f"{prefix}_QUEUE", queue_size)))
+        )
+    return configs
+
+
+@dataclass
+class _Slots:
+    """Admission state for a concurrency class or a limited tool"""
+    name: str
+    capacity: int
+    queue_size: int
+    semaphore: asyncio.Semaphore = None
+    admitted: int = 0
+    running: int = 0
+    completed: int = 0
+    rejected: int = 0
+    # Exponentially weighted average job duration, for Retry-After
+    avg_seconds: float = 1.0
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def admit(self):
+        with self._lock:
+            if self.admitted >= self.capacity + self.queue_size:
+                self.rejected += 1
+                raise Saturated(self.name, self.retry_after())
+            self.admitted += 1
+
+    def release(self, seconds: Optional[float] = None):
+        with self._lock:
+            self.admitted -= 1
+            if seconds is not None:
+                self.completed += 1
+                self.avg_seconds = 0.8 * self.avg_seconds + 0.2 * seconds
+
+    def retry_after(self) -> int:
+        waves = (self.admitted - self.capacity) / self.capacity + 1
+        return max(1, math.ceil(waves * self.avg_seconds))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "queue_size": self.queue_size,
+            "running": self.running,
+            "queued": max(0, self.admitted - self.running),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_seconds": round(self.avg_seconds, 3)
+        }
+
+
+class ToolScheduler:
+    """Runs tool functions in per-class pools with per-tool limits"""
+
+    def __init__(self, configs: Optional[Dict[str, ClassConfig]] = None, tool_registry: ToolRegistry = registry,
+                 isolate: Optional[bool] = None, groups: Optional[List[str]] = None):
+        self.configs = configs or default_class_configs()
+        self.registry = tool_registry
+        # Tool groups served by this process (None: all); only their modules are preloaded
+        self.groups = groups
+        self.isolate = os.environ.get("TOOL_ISOLATION", "1") != "0" if isolate is None else isolate
+        self._executors: Dict[str, Executor] = {}
+        self._classes: Dict[str, _Slots] = {}
+        self._tools: Dict[str, _Slots] = {}
+
+    def _executor(self, name: str, isolated: bool = False) -> Executor:
+        isolated = self.isolate and (isolated or name == "cpu")
+        key = f"{name}-isolated" if isolated and name != "cpu" else name
+        executor = self._executors.get(key)
+        if executor is None:
+            workers = self.configs[name].workers
+            if isolated:
+                # Every isolated executor shares the one forkserver, which preloads the
+                # modules of every tool run in isolation (and the native stacks for cpu tools)
+                specs = [self.registry.spec(tool) for tool in self.isolated_tools()]
+                preload = list(PRELOAD_MODULES) if any(spec.concurrency == "cpu" for spec in specs) else []
+                executor = IsolatedExecutor(workers, preload=preload + [spec.module for spec in specs])
+            elif name == "cpu":
+                executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"tools-{name}")
+            self._executors[key] = executor
+        return executor
+
+    def isolated_tools(self) -> List[str]:
+        """Served tools whose jobs run in isolated children"""
+        return [tool for tool in self.registry.names(self.groups)
+                if self.registry.spec(tool).concurrency == "cpu" or self.registry.spec(tool).isolated]
+
+    def warm(self):
+        """Start the cpu forkserver ahead of the first job"""
+        executor = self._executor("cpu")
+        if isinstance(executor, IsolatedExecutor):
+            executor.start()
+
+    def _class_slots(self, name: str) -> _Slots:
+        slots = self._classes.get(name)
+        if slots is None:
+            config = self.configs[name]
+            slots = _Slots(name, config.workers, config.queue_size, asyncio.Semaphore(config.workers))
+            self._classes[name] = slots
+        return slots
+
+    def _tool_slots(self, tool: str) -> Optional[_Slots]:
+        spec = self.registry.spec(tool)
+        if spec.limit is None:
+            return None
+        slots = self._tools.get(tool)
+        if slots is None:
+            queue_size = self.configs[spec.concurrency].queue_size
+            slots = _Slots(tool, spec.limit, queue_size, asyncio.Semaphore(spec.limit))
+            self._tools[tool] = slots
+        return slots
+
+    async def run(self, tool: str, func: Callable, *args) -> Any:
+        """Run func(*args) for a tool, or raise Saturated when it cannot be queued
+
+        Functions for "cpu" and isolated tools run in another process, so func
+        must be a module-level function and its arguments and result must be
+        picklable. An isolated job that crashes or hits a limit raises
+        IsolatedJobFailed; a thread job past the tool's timeout raises ToolTimeout.
+        """
+        spec = self.registry.spec(tool)
+        if spec.concurrency not in CONCURRENCY_CLASSES:
+            raise ValueError(f"Unknown concurrency class: {spec.concurrency}")
+
+        tool_slots = self._tool_slots(tool)
+        class_slots = self._class_slots(spec.concurrency)
+
+        # Admission is checked before waiting so a saturated class fails fast
+        if tool_slots is not None:
+            tool_slots.admit()
+        try:
+            class_slots.admit()
+        except Saturated:
+            if tool_slots is not None:
+                tool_slots.release()
+            raise
+
+        admitted = [slots for slots in (tool_slots, class_slots) if slots is not None]
+        acquired: List[_Slots] = []
+        started = False
+        elapsed = None
+
+        def finish(seconds: Optional[float] = None):
+            for slots in acquired:
+                if started:
+                    slots.running -= 1
+                slots.semaphore.release()
+            for slots in admitted:
+                slots.release(seconds)
+
+        def finish_late(job: asyncio.Future):
+            # Retrieve the abandoned job's outcome so it is not logged as unhandled
+            if not job.cancelled():
+                job.exception()
+            finish()
+
+        handed_off = False
+        try:
+            for slots in admitted:
+                await slots.semaphore.acquire()
+                acquired.append(slots)
+            started = True
+            for slots in acquired:
+                slots.running += 1
+            start_time = time.perf_counter()
+            executor = self._executor(spec.concurrency, spec.isolated)
+            try:
+                if spec.timeout is not None and isinstance(executor, IsolatedExecutor):
+                    # The child is killed at the deadline
+                    result = await asyncio.wrap_future(executor.submit_with_timeout(spec.timeout, func, *args))
+                else:
+                    job = asyncio.get_running_loop().run_in_executor(executor, func, *args)
+                    try:
+                        result = await asyncio.wait_for(asyncio.shield(job), spec.timeout)
+                    except (asyncio.TimeoutError, asyncio.CancelledError):
+                        if not job.done():
+                            # A thread cannot be stopped: its slots stay taken until it
+                            # returns, so stuck jobs cannot pile up behind the pool
+                            handed_off = True
+                            job.add_done_callback(finish_late)
+                        raise
+            except asyncio.TimeoutError:
+                raise ToolTimeout(tool, spec.timeout) from None
+            except BrokenProcessPool:
+                # A crashed worker poisons the pool; replace it for later jobs
+                if self._executors.get(spec.concurrency) is executor:
+                    del self._executors[spec.concurrency]
+                    executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            elapsed = time.perf_counter() - start_time
+            return result
+        finally:
+            if not handed_off:
+                finish(elapsed)
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-class and per-tool slot usage"""
+        return {
+            "classes": {name: slots.stats() for name, slots in self._classes.items()},
+            "tools": {name: slots.stats() for name, slots in self._tools.items()},
+            "isolation": isolation_stats.stats() if self.isolate else None
+        }
+
+    def shutdown(self):
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors.clear()
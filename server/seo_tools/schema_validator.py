@@ -0,0 +1,1015 @@
+#!/usr/bin/env python3
+"""
+Schema Markup Tester - Extract and validate structured data from web pages
+
+Entities are validated against the compiled schema.org vocabulary
+(schema_vocab): rules follow the type hierarchy and nested entities such as
+offers or author are validated as well.
+
+Each document is parsed once (parse_html: lxml when installed, html.parser
+as the fallback) and the page title and every extractor read that one tree;
+Microdata and RDFa Lite are extracted together in a single walk of it.
+When only JSON-LD is requested no tree is built at all: iter_json_ld_blocks
+finds the script blocks in the raw HTML and they are decoded with orjson
+when it is installed.
+"""
+
+import json
+import re
+import html
+import requests
+from bs4 import BeautifulSoup, Tag
+from urllib.parse import urljoin, urlparse
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+
+from seo_tools.fetch import fetch_trace, new_session, traced_get
+from seo_tools.schema_vocab import SCHEMA_PREFIXES, load_vocabulary, term
+from seo_tools.timing import Timer
+
+# schema.org index (type hierarchy, property ranges, rule tables), loaded once at import
+VOCABULARY = load_vocabulary()
+# Nesting depth past which entities are not validated
+MAX_VALIDATION_DEPTH = 32
+
+# lxml is BeautifulSoup's fastest tree builder; without it html.parser is used
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+# orjson decodes JSON-LD several times faster than json; its errors subclass json.JSONDecodeError
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Structured data formats an extraction can be limited to
+SCHEMA_FORMATS = ("json-ld", "microdata", "rdfa")
+
+# <script> blocks and comments (scripts inside comments are not data) in raw HTML
+SCRIPT_OR_COMMENT = re.compile(r'<!--.*?-->|<script\b([^>]*)>(.*?)</script\s*>', re.IGNORECASE | re.DOTALL)
+JSON_LD_TYPE = re.compile(r"(?:^|\s)type\s*=\s*[\"']?\s*application/ld\+json\b", re.IGNORECASE)
+TITLE_TAG = re.compile(r'<title\b[^>]*>(.*?)</title\s*>', re.IGNORECASE | re.DOTALL)
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _add_value(data: Dict[str, Any], name: str, value: Any):
+    """Add a property value, turning repeated properties into lists"""
+    if name in data:
+        if not isinstance(data[name], list):
+            data[name] = [data[name]]
+        data[name].append(value)
+    else:
+        data[name] = value
+
+
+def _has_any(node: Dict[str, Any], names: Tuple[str, ...]) -> bool:
+    """Whether the node has a non-empty value for any of the property names"""
+    return any(node.get(name) not in (None, '', [], {}) for name in names)
+
+
+def _quoted(names: Tuple[str, ...]) -> str:
+    return ' or '.join(f"'{name}'" for name in names)
+
+
+def json_ld_index(nodes: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+    """@id -> node for every node that defines an @id (not bare references), in one pass
+
+    Nested definitions are indexed too; the first definition of an @id wins.
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    # Reversed onto the stack so nodes are visited in document order
+    pending = list(nodes)[::-1]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, dict):
+            node_id = value.get('@id')
+            if isinstance(node_id, str) and len(value) > 1:
+                index.setdefault(node_id, value)
+            pending.extend(list(value.values())[::-1])
+        elif isinstance(value, list):
+            pending.extend(value[::-1])
+    return index
+
+
+def parse_formats(formats: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Requested structured data formats (all when none are given)
+
+    formats is a list of names; a bare string or non-string names raise
+    ValueError, like unknown names do.
+    """
+    if not formats:
+        return SCHEMA_FORMATS
+    if not isinstance(formats, (list, tuple)) or not all(isinstance(name, str) for name in formats):
+        raise ValueError(f"Structured data formats must be a list of names (use {', '.join(SCHEMA_FORMATS)})")
+    requested = tuple(dict.fromkeys(name.strip().lower() for name in formats))
+    unknown = [name for name in requested if name not in SCHEMA_FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown structured data format: {', '.join(unknown)} (use {', '.join(SCHEMA_FORMATS)})")
+    return requested
+
+
+def iter_json_ld_blocks(html_content: str) -> Iterator[Tuple[int, str]]:
+    """(line number, content) of every JSON-LD script in raw HTML, without building a tree
+
+    Attribute order, case and quoting do not matter; scripts inside HTML
+    comments are skipped.
+    """
+    line = 1
+    position = 0
+    for match in SCRIPT_OR_COMMENT.finditer(html_content):
+        attributes = match.group(1)
+        if attributes is None or not JSON_LD_TYPE.search(attributes):
+            continue
+        line += html_content.count('\n', position, match.start())
+        position = match.start()
+        yield line, match.group(2)
+
+
+def raw_page_title(html_content: str) -> str:
+    """<title> text of raw HTML"""
+    match = TITLE_TAG.search(html_content)
+    return html.unescape(match.group(1)).strip() if match else ""
+
+
+# Elements whose microdata value is an attribute rather than their text
+MICRODATA_VALUE_ATTRIBUTES = {
+    'meta': 'content',
+    'a': 'href', 'link': 'href', 'area': 'href',
+    'img': 'src', 'audio': 'src', 'video': 'src', 'source': 'src', 'track': 'src',
+    'embed': 'src', 'iframe': 'src',
+    'object': 'data',
+    'data': 'value', 'meter': 'value',
+}
+
+
+# RDFa Lite: attributes that change the walk's RDFa state, prefixes known without a
+# prefix="" declaration (from the RDFa initial context) and prefix="" pairs
+RDFA_ATTRIBUTES = frozenset(('vocab', 'typeof', 'property', 'resource', 'prefix'))
+RDFA_INITIAL_PREFIXES = {
+    'schema': 'https://schema.org/',
+    'og': 'http://ogp.me/ns#',
+    'dc': 'http://purl.org/dc/terms/',
+    'foaf': 'http://xmlns.com/foaf/0.1/',
+}
+RDFA_PREFIX = re.compile(r'(\S+):\s+(\S+)')
+
+
+def expand_rdfa_term(value: str, vocab: Optional[str], prefixes: Dict[str, str]) -> str:
+    """IRI of an RDFa term: prefix:name through the prefixes, a bare name through vocab"""
+    prefix, separator, rest = value.partition(':')
+    if separator:
+        if prefix in prefixes and not rest.startswith('//'):
+            return prefixes[prefix] + rest
+        return value
+    return (vocab or '') + value
+
+
+def parse_html(html_content: str) -> Tuple[BeautifulSoup, str]:
+    """Parse a document once; returns the tree and the parser that built it
+
+    lxml is tried first. Markup it fails on, or turns into an empty tree,
+    is parsed again with html.parser, which is slower but more forgiving.
+    """
+    if LXML_AVAILABLE:
+        try:
+            soup = BeautifulSoup(html_content, 'lxml')
+            if soup.find() is not None or '<' not in html_content:
+                return soup, 'lxml'
+        except Exception:
+            pass
+    return BeautifulSoup(html_content, 'html.parser'), 'html.parser'
+
+
+class SchemaType(Enum):
+    JSON_LD = "JSON-LD"
+    MICRODATA = "Microdata"
+    RDFA = "RDFa"
+
+@dataclass
+class SchemaItem:
+    type: str
+    schema_type: SchemaType
+    content: Dict[str, Any]
+    errors: List[str]
+    warnings: List[str]
+    line_number: Optional[int] = None
+
+@dataclass
+class ValidationResult:
+    success: bool
+    schemas_found: List[SchemaItem]
+    total_schemas: int
+    total_errors: int
+    total_warnings: int
+    page_title: str = ""
+    url: str = ""
+    processing_time: float = 0.0
+    timings: List[Dict[str, Any]] = field(default_factory=list)
+    # DNS / connect / TLS / TTFB / transfer breakdown of the page fetch
+    network_timing: Optional[Dict[str, Any]] = None
+    # Why the page could not be validated (success=False)
+    error: str = ""
+
+class SchemaMarkupTester:
+    def __init__(self, timeout: int = 10):
+        self.timeout = timeout
+        self.session = new_session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
+
+    def validate_url(self, url: str) -> Tuple[bool, str]:
+        """Validate and normalize URL"""
+        if not url:
+            return False, "URL is required"
+        
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+        
+        try:
+            parsed = urlparse(url)
+            if not parsed.netloc:
+                return False, "Invalid URL format"
+            return True, url
+        except Exception as e:
+            return False, f"Invalid URL: {str(e)}"
+
+    def fetch_page_content(self, url: str, timer: Optional[Timer] = None) -> Tuple[bool, str]:
+        """Fetch HTML content from URL (the title is read when the page is processed)"""
+        timer = timer or Timer()
+        try:
+            with timer.span("network"):
+                response = traced_get(self.session, url, timeout=self.timeout, allow_redirects=True)
+                response.raise_for_status()
+            
+            return True, response.text
+        except requests.RequestException as e:
+            return False, f"Failed to fetch page: {str(e)}"
+        except Exception as e:
+            return False, f"Error processing page: {str(e)}"
+
+    def extract_json_ld(self, soup: BeautifulSoup) -> List[SchemaItem]:
+        """Extract JSON-LD structured data from a parsed tree
+
+        Line numbers are only known with html.parser (the lxml builder sets
+        no sourceline); process_html_content scans the raw HTML instead.
+        """
+        scripts = soup.find_all(
+            'script', type=lambda value: bool(value) and value.strip().lower().startswith('application/ld+json')
+        )
+        return self._json_ld_schemas((script.sourceline, script.string) for script in scripts)
+
+    def extract_json_ld_from_html(self, html_content: str) -> List[SchemaItem]:
+        """Extract JSON-LD structured data straight from raw HTML (no tree)"""
+        return self._json_ld_schemas(iter_json_ld_blocks(html_content))
+
+    def _json_ld_schemas(self, blocks: Iterable[Tuple[Optional[int], Optional[str]]]) -> List[SchemaItem]:
+        """Decode and validate (line number, content) script blocks
+
+        Every block is decoded before anything is validated, so one @id index
+        covers the whole page; @graph containers are flattened and each of
+        their nodes is reported as its own item.
+        """
+        # In page order: SchemaItems for blocks that failed, or
+        # (node, identifier, line number, whether its container has @context)
+        entries: List[Any] = []
+        
+        for i, (line_number, raw) in enumerate(blocks):
+            if not raw:
+                continue
+                
+            try:
+                # Clean up the JSON content
+                content = raw.strip()
+                if not content:
+                    continue
+                
+                # Parse JSON
+                data = json_loads(content)
+                
+                # Handle arrays of schemas and @graph containers
+                items = data if isinstance(data, list) else [data]
+                for j, item in enumerate(items):
+                    identifier = f"JSON-LD Script {i+1}, Item {j+1}" if isinstance(data, list) else f"JSON-LD Script {i+1}"
+                    if isinstance(item, dict) and isinstance(item.get('@graph'), list):
+                        has_context = '@context' in item
+                        for k, node in enumerate(item['@graph']):
+                            entries.append((node, f"{identifier}, Node {k+1}", line_number, has_context))
+                    else:
+                        entries.append((item, identifier, line_number, None))
+                        
+            except json.JSONDecodeError as e:
+                errors = [f"Invalid JSON syntax: {str(e)}"]
+                entries.append(SchemaItem(
+                    type="Invalid JSON-LD",
+                    schema_type=SchemaType.JSON_LD,
+                    content={"raw": raw},
+                    errors=errors,
+                    warnings=[],
+                    line_number=line_number
+                ))
+            except Exception as e:
+                errors = [f"Error processing JSON-LD: {str(e)}"]
+                entries.append(SchemaItem(
+                    type="Error",
+                    schema_type=SchemaType.JSON_LD,
+                    content={"raw": raw},
+                    errors=errors,
+                    warnings=[],
+                    line_number=line_number
+                ))
+        
+        references = json_ld_index(entry[0] for entry in entries if isinstance(entry, tuple))
+        
+        schemas = []
+        for entry in entries:
+            if isinstance(entry, SchemaItem):
+                schemas.append(entry)
+                continue
+            node, identifier, line_number, has_context = entry
+            try:
+                schema_item = self._process_json_ld_item(node, identifier, references, has_context)
+            except Exception as e:
+                schema_item = SchemaItem(
+                    type="Error",
+                    schema_type=SchemaType.JSON_LD,
+                    content={"error": str(e)},
+                    errors=[f"Error processing JSON-LD: {str(e)}"],
+                    warnings=[]
+                )
+            if schema_item:
+                schema_item.line_number = line_number
+                schemas.append(schema_item)
+        
+        return schemas
+
+    def _process_json_ld_item(self, data: Dict[str, Any], identifier: str,
+                              references: Optional[Dict[str, Dict[str, Any]]] = None,
+                              has_context: Optional[bool] = None) -> Optional[SchemaItem]:
+        """Process individual JSON-LD item (has_context: whether its @graph container has @context)"""
+        if not isinstance(data, dict) or set(data) == {'@id'}:
+            # Bare {"@id": ...} references are not entities of their own
+            return None
+        
+        # Get schema type
+        schema_type = data.get('@type', 'Unknown')
+        if isinstance(schema_type, list):
+            schema_type = ', '.join(schema_type)
+        
+        # Validate schema
+        errors, warnings = self._validate_schema(data, schema_type, references, has_context)
+        
+        return SchemaItem(
+            type=schema_type,
+            schema_type=SchemaType.JSON_LD,
+            content=data,
+            errors=errors,
+            warnings=warnings
+        )
+
+    def extract_microdata(self, soup: BeautifulSoup) -> List[SchemaItem]:
+        """Extract Microdata structured data (top-level items, nested items inline)"""
+        return self.extract_tree_items(soup, ("microdata",))
+
+    def extract_rdfa(self, soup: BeautifulSoup) -> List[SchemaItem]:
+        """Extract RDFa Lite structured data (top-level resources, nested ones inline)"""
+        return self.extract_tree_items(soup, ("rdfa",))
+
+    def extract_tree_items(self, soup: BeautifulSoup, formats: Iterable[str] = ("microdata", "rdfa")) -> List[SchemaItem]:
+        """Extract the attribute-based formats (Microdata, RDFa) in a single walk of the tree"""
+        formats = tuple(formats)
+        microdata_items, rdfa_items = self._tree_items(soup, "microdata" in formats, "rdfa" in formats)
+        schemas = []
+        
+        for element, schema_data in microdata_items:
+            item_type = _as_list(schema_data.get('@type'))
+            schemas.append(self._tree_schema_item(
+                item_type[0] if item_type else 'Unknown', schema_data, SchemaType.MICRODATA, None
+            ))
+        
+        # RDFa resources refer to each other through resource="..." (@id)
+        references = json_ld_index(item for _, item in rdfa_items)
+        for element, schema_data in rdfa_items:
+            item_type = _as_list(schema_data.get('@type'))
+            schemas.append(self._tree_schema_item(
+                item_type[0] if item_type else 'Unknown', schema_data, SchemaType.RDFA, references
+            ))
+        
+        return schemas
+
+    def _tree_schema_item(self, item_type: str, schema_data: Dict[str, Any], schema_type: SchemaType,
+                          references: Optional[Dict[str, Dict[str, Any]]]) -> SchemaItem:
+        """Validated SchemaItem for a Microdata or RDFa item"""
+        label = "microdata" if schema_type == SchemaType.MICRODATA else "RDFa"
+        try:
+            if item_type.startswith('http'):
+                # Extract schema name from URL
+                type_name = item_type.rstrip('/').split('/')[-1]
+            else:
+                type_name = term(item_type)
+            
+            if schema_type == SchemaType.MICRODATA:
+                errors, warnings = self._validate_microdata(schema_data, type_name)
+            else:
+                errors, warnings = self._validate_rdfa(schema_data, type_name, references)
+            
+            return SchemaItem(
+                type=type_name,
+                schema_type=schema_type,
+                content=schema_data,
+                errors=errors,
+                warnings=warnings
+            )
+        except Exception as e:
+            return SchemaItem(
+                type="Error",
+                schema_type=schema_type,
+                content={"error": str(e)},
+                errors=[f"Error extracting {label}: {str(e)}"],
+                warnings=[]
+            )
+
+    def _tree_items(self, soup: BeautifulSoup, microdata: bool = True, rdfa: bool = True
+                    ) -> Tuple[List[Tuple[Any, Dict[str, Any]]], List[Tuple[Any, Dict[str, Any]]]]:
+        """Build the Microdata and RDFa item graphs in one walk of the tree
+
+        A stack of (element, enclosing microdata item, RDFa state) entries
+        stands in for recursion, so every element is visited once and each
+        itemprop / property is added only to its nearest itemscope / typeof.
+        Microdata items with an itemref then collect the properties under the
+        referenced elements. Returns the top-level (element, item) pairs of
+        each format in document order.
+        """
+        items: Dict[int, Dict[str, Any]] = {}
+        ids: Dict[str, Any] = {}
+        top_level: List[Tuple[Any, Dict[str, Any]]] = []
+        rdfa_top_level: List[Tuple[Any, Dict[str, Any]]] = []
+        with_refs: List[Tuple[Any, Dict[str, Any]]] = []
+        
+        # RDFa state: (vocab, prefix mappings, current subject)
+        rdfa_state = (None, RDFA_INITIAL_PREFIXES, None) if rdfa else None
+        stack = [(child, None, rdfa_state) for child in reversed(soup.contents)]
+        while stack:
+            element, scope, rdfa_state = stack.pop()
+            if not isinstance(element, Tag):
+                continue
+            attrs = element.attrs
+            
+            item = None
+            if microdata:
+                if 'id' in attrs:
+                    ids.setdefault(attrs['id'], element)
+                if 'itemscope' in attrs:
+                    item = self._new_microdata_item(element, items)
+                    if attrs.get('itemref'):
+                        with_refs.append((element, item))
+                    if scope is None:
+                        top_level.append((element, item))
+                if scope is not None and attrs.get('itemprop'):
+                    self._add_microdata_property(scope, element, item)
+            
+            if rdfa_state is not None and not RDFA_ATTRIBUTES.isdisjoint(attrs):
+                rdfa_state = self._rdfa_element(element, rdfa_state, rdfa_top_level)
+            
+            child_scope = item if item is not None else scope
+            stack.extend((child, child_scope, rdfa_state) for child in reversed(element.contents))
+        
+        # itemref: properties under the referenced elements belong to the referencing item.
+        # Nested items were already filled by the walk, so only their roots are added.
+        referenced = set()
+        for element, item in with_refs:
+            for ref_id in element['itemref'].split():
+                ref = ids.get(ref_id)
+                if ref is None:
+                    continue
+                pending = [ref]
+                while pending:
+                    current = pending.pop()
+                    if not isinstance(current, Tag):
+                        continue
+                    nested = items.get(id(current))
+                    if current.get('itemprop'):
+                        if nested is not None and (nested is item or self._contains_item(nested, item)):
+                            # A reference cycle would make the item graph infinite
+                            continue
+                        self._add_microdata_property(item, current, nested)
+                        if nested is not None:
+                            referenced.add(id(nested))
+                    if nested is None:
+                        pending.extend(reversed(current.contents))
+        
+        microdata_items = [(element, item) for element, item in top_level if id(item) not in referenced]
+        return microdata_items, rdfa_top_level
+
+    def _rdfa_element(self, element, state: Tuple, top_level: List[Tuple[Any, Dict[str, Any]]]) -> Tuple:
+        """Apply one element's RDFa Lite attributes; returns the state for its children
+
+        typeof starts a new resource (@type, and @id from resource); property
+        adds the element's value, or the new resource, to the current subject.
+        A resource without typeof becomes the subject of the element's
+        children. Resources not attached to a subject are top-level items.
+        """
+        vocab, prefixes, subject = state
+        attrs = element.attrs
+        if 'vocab' in attrs:
+            vocab = attrs['vocab'].strip() or None
+        if attrs.get('prefix'):
+            prefixes = dict(prefixes)
+            prefixes.update(RDFA_PREFIX.findall(attrs['prefix']))
+        
+        node = None
+        if 'typeof' in attrs:
+            node = {}
+            types = [expand_rdfa_term(value, vocab, prefixes) for value in attrs['typeof'].split()]
+            if types:
+                node['@type'] = types[0] if len(types) == 1 else types
+            if attrs.get('resource'):
+                node['@id'] = attrs['resource']
+        elif attrs.get('resource'):
+            node = {'@id': attrs['resource']}
+        
+        if attrs.get('property') and subject is not None:
+            value = node if node is not None else self._rdfa_value(element)
+            for name in attrs['property'].split():
+                _add_value(subject, term(expand_rdfa_term(name, vocab, prefixes)), value)
+        elif node is not None and 'typeof' in attrs:
+            top_level.append((element, node))
+        
+        return vocab, prefixes, node if node is not None else subject
+
+    def _rdfa_value(self, element) -> str:
+        """Property value of an RDFa property element without typeof or resource"""
+        attrs = element.attrs
+        if 'content' in attrs:
+            return attrs['content']
+        for attribute in ('href', 'src'):
+            if attrs.get(attribute):
+                return attrs[attribute]
+        if element.name == 'time':
+            return attrs.get('datetime', element.get_text(strip=True))
+        return element.get_text(strip=True)
+
+    def _new_microdata_item(self, element, items: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        data = {}
+        # itemtype is a space-separated list of type URLs
+        types = element.get('itemtype', '').split()
+        if types:
+            data['@type'] = types[0] if len(types) == 1 else types
+        if element.get('itemid'):
+            data['@id'] = element['itemid']
+        items[id(element)] = data
+        return data
+
+    def _add_microdata_property(self, data: Dict[str, Any], element, nested: Optional[Dict[str, Any]]):
+        """Add an itemprop element's value (or its nested item) under each of its names"""
+        value = nested if nested is not None else self._microdata_value(element)
+        for prop_name in element['itemprop'].split():
+            _add_value(data, prop_name, value)
+
+    def _microdata_value(self, element) -> str:
+        """Property value of a non-item itemprop element"""
+        if element.name in MICRODATA_VALUE_ATTRIBUTES:
+            return element.get(MICRODATA_VALUE_ATTRIBUTES[element.name], '')
+        if element.name == 'time':
+            return element.get('datetime', element.get_text(strip=True))
+        return element.get_text(strip=True)
+
+    def _contains_item(self, data: Any, target: Dict[str, Any]) -> bool:
+        """Whether target is data or nested anywhere inside it"""
+        pending = [data]
+        seen = set()
+        while pending:
+            current = pending.pop()
+            if current is target:
+                return True
+            if isinstance(current, dict) and id(current) not in seen:
+                seen.add(id(current))
+                pending.extend(current.values())
+            elif isinstance(current, list):
+                pending.extend(current)
+        return False
+
+    def _validate_schema(self, data: Dict[str, Any], schema_type: str,
+                         references: Optional[Dict[str, Dict[str, Any]]] = None,
+                         has_context: Optional[bool] = None) -> Tuple[List[str], List[str]]:
+        """Validate a JSON-LD node, and every entity nested in it, against the vocabulary
+
+        references is the page's @id index (json_ld_index); has_context
+        overrides the @context check for nodes of a @graph.
+        """
+        errors = []
+        warnings = []
+        
+        # Basic validation rules
+        if not data.get('@type'):
+            warnings.append("Missing @type property")
+        
+        self._validate_node(data, "", errors, warnings, 0, references)
+        
+        # Check for common issues
+        if not (has_context if has_context is not None else '@context' in data):
+            warnings.append("Missing @context property (recommended for JSON-LD)")
+        
+        return errors, warnings
+
+    def _validate_microdata(self, data: Dict[str, Any], schema_type: str) -> Tuple[List[str], List[str]]:
+        """Validate a Microdata item, and every item nested in it, against the vocabulary"""
+        errors = []
+        warnings = []
+        self._validate_node(data, "", errors, warnings, 0)
+        return errors, warnings
+
+    def _validate_rdfa(self, data: Dict[str, Any], schema_type: str,
+                       references: Optional[Dict[str, Dict[str, Any]]] = None) -> Tuple[List[str], List[str]]:
+        """Validate an RDFa resource, and every resource nested in it, against the vocabulary"""
+        errors = []
+        warnings = []
+        self._validate_node(data, "", errors, warnings, 0, references)
+        return errors, warnings
+
+    def _validate_node(self, node: Dict[str, Any], path: str, errors: List[str], warnings: List[str], depth: int,
+                       references: Optional[Dict[str, Dict[str, Any]]] = None):
+        """Check one entity's type rules and property values, then recurse into nested entities
+
+        Messages about nested entities are prefixed with their property path
+        (e.g. "offers[1].priceSpecification: ..."). {"@id": ...} references
+        are looked up in references only to check the referenced node's
+        type; the node itself is validated where it is defined.
+        """
+        if depth > MAX_VALIDATION_DEPTH:
+            return
+        prefix = f"{path}: " if path else ""
+        
+        types = []
+        for value in _as_list(node.get('@type')):
+            if not isinstance(value, str):
+                continue
+            type_name = VOCABULARY.resolve_type(value)
+            if type_name is None:
+                warnings.append(f"{prefix}Unknown schema.org type '{value}'")
+                continue
+            if term(value) != type_name:
+                warnings.append(f"{prefix}Type '{value}' should be written '{type_name}'")
+            types.append(type_name)
+        
+        # Required / recommended properties, inherited from every supertype
+        checked = set()
+        for type_name in types:
+            required, recommended = VOCABULARY.rules_for(type_name)
+            for alternatives, declared_on in required:
+                if alternatives not in checked:
+                    checked.add(alternatives)
+                    if not _has_any(node, alternatives):
+                        errors.append(f"{prefix}Missing required {_quoted(alternatives)} property for {declared_on} schema")
+            for alternatives, declared_on in recommended:
+                if alternatives not in checked:
+                    checked.add(alternatives)
+                    if not _has_any(node, alternatives):
+                        warnings.append(f"{prefix}Missing recommended {_quoted(alternatives)} property")
+        
+        for key, value in node.items():
+            if key.startswith('@'):
+                continue
+            prop = term(key)
+            if ':' in prop:
+                # Absolute IRI of another vocabulary (og:, dc: ...)
+                continue
+            expected = VOCABULARY.ranges.get(prop)
+            if types:
+                if expected is None:
+                    warnings.append(f"{prefix}Unknown property '{key}'")
+                elif VOCABULARY.domains[prop] and not any(
+                    VOCABULARY.is_a(type_name, VOCABULARY.domains[prop]) for type_name in types
+                ):
+                    warnings.append(f"{prefix}'{key}' is not a property of {' / '.join(types)}")
+            if prop in VOCABULARY.superseded:
+                warnings.append(f"{prefix}'{key}' is superseded by '{VOCABULARY.superseded[prop]}'")
+            
+            values = value if isinstance(value, list) else [value]
+            for index, item in enumerate(values):
+                item_path = f"{path}.{key}" if path else key
+                if isinstance(value, list):
+                    item_path += f"[{index + 1}]"
+                if isinstance(item, dict):
+                    if references is not None and set(item) == {'@id'}:
+                        target = references.get(item['@id']) if isinstance(item['@id'], str) else None
+                        if target is not None:
+                            self._check_value_type(target, item_path, expected, warnings)
+                        continue
+                    self._check_value_type(item, item_path, expected, warnings)
+                    self._validate_node(item, item_path, errors, warnings, depth + 1, references)
+                elif isinstance(item, str) and expected and item.startswith(SCHEMA_PREFIXES[:2]):
+                    # Enumeration values such as https://schema.org/InStock
+                    member = term(item)
+                    enumeration = VOCABULARY.members.get(member)
+                    if enumeration is None or not VOCABULARY.is_a(enumeration, expected):
+                        warnings.append(f"{item_path}: '{item}' is not a valid {' or '.join(expected)} value")
+
+    def _check_value_type(self, item: Dict[str, Any], path: str, expected: Optional[Tuple[str, ...]],
+                          warnings: List[str]):
+        """Warn when a nested entity's @type is not one the property expects"""
+        if not expected:
+            return
+        nested_types = [VOCABULARY.resolve_type(value) for value in _as_list(item.get('@type')) if isinstance(value, str)]
+        nested_types = [type_name for type_name in nested_types if type_name]
+        if nested_types and not any(VOCABULARY.is_a(type_name, expected) for type_name in nested_types):
+            warnings.append(f"{path}: expected {' or '.join(expected)}, got {' / '.join(nested_types)}")
+
+    def process_html_content(self, html_content: str, url: str = "", timer: Optional[Timer] = None,
+                             formats: Optional[Iterable[str]] = None) -> ValidationResult:
+        """Process HTML content and extract schemas
+
+        formats limits the extraction (see SCHEMA_FORMATS). JSON-LD is always
+        scanned from the raw HTML, so its items carry line numbers whichever
+        parser builds the tree, and JSON-LD alone builds no tree at all.
+        """
+        start_time = time.time()
+        timer = timer or Timer()
+        
+        try:
+            formats = parse_formats(formats)
+            all_schemas = []
+            
+            # Extract JSON-LD from the raw HTML (no tree needed)
+            if "json-ld" in formats:
+                with timer.span("analyze", step="json-ld", parser="scan"):
+                    all_schemas.extend(self.extract_json_ld_from_html(html_content))
+            
+            if formats == ("json-ld",):
+                # Fast path: no tree at all
+                page_title = raw_page_title(html_content)
+            else:
+                parse_start = time.perf_counter()
+                soup, parser = parse_html(html_content)
+                timer.add("decode", time.perf_counter() - parse_start, parser=parser)
+                
+                # Get page title from the same tree
+                title_tag = soup.title
+                page_title = title_tag.get_text(strip=True) if title_tag else ""
+                
+                # Extract Microdata and RDFa in one walk of the tree
+                tree_formats = tuple(name for name in formats if name in ("microdata", "rdfa"))
+                if tree_formats:
+                    with timer.span("analyze", step="+".join(tree_formats)):
+                        all_schemas.extend(self.extract_tree_items(soup, tree_formats))
+            
+            if not page_title:
+                page_title = "Untitled" if url else "HTML Content"
+            
+            # Calculate totals
+            total_errors = sum(len(schema.errors) for schema in all_schemas)
+            total_warnings = sum(len(schema.warnings) for schema in all_schemas)
+            
+            processing_time = time.time() - start_time
+            
+            return ValidationResult(
+                success=True,
+                schemas_found=all_schemas,
+                total_schemas=len(all_schemas),
+                total_errors=total_errors,
+                total_warnings=total_warnings,
+                page_title=page_title,
+                url=url,
+                processing_time=processing_time,
+                timings=timer.spans
+            )
+            
+        except Exception as e:
+            return ValidationResult(
+                success=False,
+                schemas_found=[],
+                total_schemas=0,
+                total_errors=1,
+                total_warnings=0,
+                page_title="Error",
+                url=url,
+                processing_time=time.time() - start_time,
+                timings=timer.spans,
+                error=str(e)
+            )
+
+    def validate_from_url(self, url: str, formats: Optional[Iterable[str]] = None) -> ValidationResult:
+        """Validate schema markup from URL (formats as for process_html_content)"""
+        # Validate URL
+        is_valid, processed_url = self.validate_url(url)
+        if not is_valid:
+            return ValidationResult(
+                success=False,
+                schemas_found=[],
+                total_schemas=0,
+                total_errors=1,
+                total_warnings=0,
+                page_title="Invalid URL",
+                url=url,
+                processing_time=0.0,
+                error=processed_url
+            )
+        
+        # Fetch content
+        timer = Timer()
+        with fetch_trace() as trace:
+            success, content = self.fetch_page_content(processed_url, timer)
+        if not success:
+            return ValidationResult(
+                success=False,
+                schemas_found=[],
+                total_schemas=0,
+                total_errors=1,
+                total_warnings=0,
+                page_title="Fetch Error",
+                url=processed_url,
+                processing_time=0.0,
+                timings=timer.spans,
+                network_timing=trace.report(),
+                error=content
+            )
+        
+        # Process content
+        result = self.process_html_content(content, processed_url, timer, formats)
+        result.url = processed_url
+        result.network_timing = trace.report()
+        
+        return result
+
+    def generate_report(self, result: ValidationResult, format_type: str = 'text') -> str:
+        """Generate validation report"""
+        if format_type == 'json':
+            return json.dumps(validation_result_to_dict(result), indent=2)
+        
+        else:  # text format
+            lines = []
+            lines.append("=" * 60)
+            lines.append("SCHEMA MARKUP VALIDATION REPORT")
+            lines.append("=" * 60)
+            lines.append(f"URL: {result.url}")
+            lines.append(f"Page Title: {result.page_title}")
+            lines.append(f"Processing Time: {result.processing_time:.2f}s")
+            lines.append("")
+            lines.append("SUMMARY:")
+            lines.append(f"• Total Schemas Found: {result.total_schemas}")
+            lines.append(f"• Total Errors: {result.total_errors}")
+            lines.append(f"• Total Warnings: {result.total_warnings}")
+            lines.append(f"• Validation Status: {'PASS' if result.total_errors == 0 else 'FAIL'}")
+            lines.append("")
+            
+            if result.schemas_found:
+                lines.append("SCHEMAS DETECTED:")
+                lines.append("-" * 40)
+                
+                for i, schema in enumerate(result.schemas_found, 1):
+                    location = f" - line {schema.line_number}" if schema.line_number else ""
+                    lines.append(f"\n{i}. {schema.type} ({schema.schema_type.value}){location}")
+                    
+                    if schema.errors:
+                        lines.append("   ERRORS:")
+                        for error in schema.errors:
+                            lines.append(f"   ❌ {error}")
+                    
+                    if schema.warnings:
+                        lines.append("   WARNINGS:")
+                        for warning in schema.warnings:
+                            lines.append(f"   ⚠️  {warning}")
+                    
+                    if not schema.errors and not schema.warnings:
+                        lines.append("   ✅ Valid schema markup")
+                    
+                    # Show schema content (truncated)
+                    lines.append("   CONTENT:")
+                    content_str = json.dumps(schema.content, indent=4)
+                    if len(content_str) > 500:
+                        content_str = content_str[:500] + "..."
+                    lines.append("   " + content_str.replace("\n", "\n   "))
+            else:
+                lines.append("No schema markup found on this page.")
+            
+            lines.append("\n" + "=" * 60)
+            lines.append("Report generated by Schema Markup Tester")
+            lines.append("=" * 60)
+            
+            return "\n".join(lines)
+
+
+def validation_result_to_dict(result: ValidationResult) -> Dict[str, Any]:
+    """Convert a ValidationResult into a JSON-serializable dict"""
+    result_data = {
+        'success': result.success,
+        'url': result.url,
+        'page_title': result.page_title,
+        'total_schemas': result.total_schemas,
+        'total_errors': result.total_errors,
+        'total_warnings': result.total_warnings,
+        'processing_time': result.processing_time,
+        'timings': result.timings,
+        'network_timing': result.network_timing,
+        'schemas': []
+    }
+    if result.error:
+        result_data['error'] = result.error
+    
+    for schema in result.schemas_found:
+        schema_data = {
+            'type': schema.type,
+            'schema_type': schema.schema_type.value,
+            'content': schema.content,
+            'errors': schema.errors,
+            'warnings': schema.warnings,
+            'line_number': schema.line_number
+        }
+        result_data['schemas'].append(schema_data)
+    
+    return result_data
+
+
+def validation_result_from_dict(data: Dict[str, Any]) -> ValidationResult:
+    """Rebuild a ValidationResult from its serialized dict form"""
+    schemas_found = []
+    for schema_data in data.get('schemas') or []:
+        schemas_found.append(SchemaItem(
+            type=schema_data['type'],
+            schema_type=SchemaType(schema_data['schema_type']),
+            content=schema_data['content'],
+            errors=schema_data['errors'],
+            warnings=schema_data['warnings'],
+            line_number=schema_data.get('line_number')
+        ))
+    
+    return ValidationResult(
+        success=bool(data.get('success', False)),
+        schemas_found=schemas_found,
+        total_schemas=data.get('total_schemas', 0),
+        total_errors=data.get('total_errors', 0),
+        total_warnings=data.get('total_warnings', 0),
+        page_title=data.get('page_title') or '',
+        url=data.get('url') or '',
+        processing_time=data.get('processing_time') or 0.0,
+        timings=data.get('timings') or [],
+        network_timing=data.get('network_timing'),
+        error=data.get('error') or ''
+    )
+
+
+def test_schema_validator():
+    """Test the schema validator"""
+    tester = SchemaMarkupTester()
+    
+    # Test with a few URLs
+    test_urls = [
+        "https://schema.org/Recipe",
+        "https://developers.google.com/search/docs/data-types/article",
+        "https://jsonld.com/product/"
+    ]
+    
+    for url in test_urls:
+        print(f"Testing: {url}")
+        result = tester.validate_from_url(url)
+        print(f"Success: {result.success}")
+        print(f"Schemas: {result.total_schemas}")
+        print(f"Errors: {result.total_errors}")
+        print(f"Warnings: {result.total_warnings}")
+        print("-" * 40)
+
+
+def main():
+    """Main function for command line usage"""
+    import sys
+    
+    if len(sys.argv) >= 3 and sys.argv[1] == "validate-url":
+        url = sys.argv[2]
+        # Optional comma-separated formats, e.g. "json-ld" for the tree-free fast path
+        formats = sys.argv[3].split(',') if len(sys.argv) > 3 else None
+        
+        try:
+            tester = SchemaMarkupTester()
+            result = tester.validate_from_url(url, formats)
+            
+            result_data = validation_result_to_dict(result)
+            print(json.dumps(result_data))
+            
+        except Exception as e:
+            error_result = {
+                'success': False,
+                'error': str(e),
+                'schemas': [],
+                'total_schemas': 0,
+                'total_errors': 1,
+                'total_warnings': 0
+            }
+            print(json.dumps(error_result))
+    else:
+        test_schema_validator()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
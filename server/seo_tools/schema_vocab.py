@@ -0,0 +1,273 @@
+"""
+Compiled schema.org vocabulary for type-aware structured data validation
+
+data/schemaorg-current-https.jsonld is the schema.org 12.0 vocabulary
+(CC BY-SA 3.0) reduced to what validation reads: the class hierarchy,
+property domains and ranges, enumeration members and superseded terms.
+data/schema_rules.json lists the required and recommended properties per
+type. compile_vocabulary turns both into a Vocabulary index:
+
+    ancestors    type -> the type and every superclass
+    ranges       property -> expected value types
+    domains      property -> types the property is defined on
+    rules        type -> required / recommended properties, inherited ones included
+
+so checking a node is a few dict lookups however deep its type sits in
+the hierarchy. load_vocabulary saves the index as JSON under
+SEO_TOOLS_CACHE_DIR and reuses it while both source files are unchanged;
+`python3 -m seo_tools.schema_vocab` rebuilds it. The cache directory may be
+shared (the default lives in the system temp directory), so the saved index
+is plain data, only read when it belongs to this user, and its first line
+(the source key) is checked before the rest is parsed.
+"""
+
+import os
+import json
+import tempfile
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from seo_tools.cache import DEFAULT_CACHE_DIR
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+VOCABULARY_SOURCE = os.path.join(DATA_DIR, "schemaorg-current-https.jsonld")
+RULES_SOURCE = os.path.join(DATA_DIR, "schema_rules.json")
+# Bumped whenever the index layout changes so older saved indexes are rebuilt
+INDEX_VERSION = 2
+
+# Ways a schema.org term is written in @type values, keys and enumeration values
+SCHEMA_PREFIXES = ("https://schema.org/", "http://schema.org/", "schema:")
+
+# (alternative property names, type the rule is declared on)
+Rule = Tuple[Tuple[str, ...], str]
+NO_RULES: Tuple[Tuple[Rule, ...], Tuple[Rule, ...]] = ((), ())
+
+
+def term(value: str) -> str:
+    """schema.org term without its prefix ("https://schema.org/Article" -> "Article")"""
+    for prefix in SCHEMA_PREFIXES:
+        if value.startswith(prefix):
+            return value[len(prefix):]
+    return value
+
+
+def _ids(value: Any) -> List[str]:
+    """schema: terms referenced by a JSON-LD {"@id": ...} value or list of them"""
+    items = value if isinstance(value, list) else [value] if value is not None else []
+    return [item["@id"][7:] for item in items if isinstance(item, dict) and item.get("@id", "").startswith("schema:")]
+
+
+class Vocabulary:
+    """Precomputed schema.org lookups (see the module docstring)"""
+
+    def __init__(self, ancestors: Dict[str, FrozenSet[str]], ranges: Dict[str, Tuple[str, ...]],
+                 domains: Dict[str, FrozenSet[str]], members: Dict[str, str], superseded: Dict[str, str],
+                 rules: Dict[str, Tuple[Tuple[Rule, ...], Tuple[Rule, ...]]], source_key: Tuple):
+        self.ancestors = ancestors
+        self.ranges = ranges
+        self.domains = domains
+        # Enumeration member -> its enumeration (InStock -> ItemAvailability)
+        self.members = members
+        self.superseded = superseded
+        self.rules = rules
+        self.source_key = source_key
+        self.type_names = {name.lower(): name for name in ancestors}
+
+    def resolve_type(self, value: str) -> Optional[str]:
+        """Canonical type name for an @type value, matching case-insensitively; None if unknown"""
+        name = term(value)
+        if name in self.ancestors:
+            return name
+        return self.type_names.get(name.lower())
+
+    def is_a(self, type_name: str, expected: Iterable[str]) -> bool:
+        """Whether type_name is, or inherits from, any of the expected types"""
+        ancestors = self.ancestors.get(type_name, frozenset())
+        return any(name in ancestors for name in expected)
+
+    def rules_for(self, type_name: str) -> Tuple[Tuple[Rule, ...], Tuple[Rule, ...]]:
+        """(required, recommended) rules of a type, including those of its superclasses"""
+        return self.rules.get(type_name, NO_RULES)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The index as JSON-serializable data (without the source key)"""
+        return {
+            "ancestors": {name: sorted(names) for name, names in self.ancestors.items()},
+            "ranges": {name: list(types) for name, types in self.ranges.items()},
+            "domains": {name: sorted(types) for name, types in self.domains.items()},
+            "members": self.members,
+            "superseded": self.superseded,
+            "rules": {name: [[[list(alternatives), declared_on] for alternatives, declared_on in kind] for kind in rules]
+                      for name, rules in self.rules.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], source_key: Tuple) -> "Vocabulary":
+        """Rebuild an index saved with to_dict"""
+        return cls(
+            {name: frozenset(names) for name, names in data["ancestors"].items()},
+            {name: tuple(types) for name, types in data["ranges"].items()},
+            {name: frozenset(types) for name, types in data["domains"].items()},
+            data["members"],
+            data["superseded"],
+            {name: tuple(tuple((tuple(alternatives), declared_on) for alternatives, declared_on in kind) for kind in rules)
+             for name, rules in data["rules"].items()},
+            source_key
+        )
+
+
+def compile_vocabulary(vocabulary_path: str = VOCABULARY_SOURCE, rules_path: str = RULES_SOURCE) -> Vocabulary:
+    """Build the index from a schema.org JSON-LD vocabulary and a rules table"""
+    with open(vocabulary_path, encoding="utf-8") as f:
+        graph = json.load(f)["@graph"]
+    with open(rules_path, encoding="utf-8") as f:
+        rule_table = json.load(f)
+
+    parents: Dict[str, List[str]] = {}
+    ranges: Dict[str, Tuple[str, ...]] = {}
+    domains: Dict[str, FrozenSet[str]] = {}
+    members: Dict[str, str] = {}
+    superseded: Dict[str, str] = {}
+    for node in graph:
+        node_id = node.get("@id", "")
+        if not node_id.startswith("schema:"):
+            continue
+        name = node_id[7:]
+        node_types = node.get("@type")
+        node_types = node_types if isinstance(node_types, list) else [node_types]
+        if "rdfs:Class" in node_types or "schema:DataType" in node_types:
+            parents[name] = _ids(node.get("rdfs:subClassOf"))
+            if "schema:DataType" in node_types:
+                # Text, Number, Date...: DataType is declared through @type, not subClassOf
+                parents[name].append("DataType")
+        elif "rdf:Property" in node_types:
+            ranges[name] = tuple(_ids(node.get("schema:rangeIncludes")))
+            domains[name] = frozenset(_ids(node.get("schema:domainIncludes")))
+        else:
+            enumerations = [value[7:] for value in node_types if isinstance(value, str) and value.startswith("schema:")]
+            if enumerations:
+                members[name] = enumerations[0]
+        replacement = _ids(node.get("schema:supersededBy"))
+        if replacement:
+            superseded[name] = replacement[0]
+
+    ancestors: Dict[str, FrozenSet[str]] = {}
+
+    def closure(name: str, visiting: FrozenSet[str] = frozenset()) -> FrozenSet[str]:
+        if name not in ancestors:
+            found = {name}
+            for parent in parents.get(name, ()):
+                if parent not in visiting:
+                    found |= closure(parent, visiting | {name})
+            ancestors[name] = frozenset(found)
+        return ancestors[name]
+
+    for name in parents:
+        closure(name)
+
+    declared: Dict[str, Tuple[Tuple[Rule, ...], Tuple[Rule, ...]]] = {}
+    for type_name, table in rule_table.items():
+        if type_name not in ancestors:
+            raise ValueError(f"{rules_path}: unknown schema.org type {type_name}")
+        declared[type_name] = tuple(
+            tuple((tuple(entry.split("|")), type_name) for entry in table.get(kind, ()))
+            for kind in ("required", "recommended")
+        )
+
+    # Every type inherits the rules of its superclasses, most general first
+    rules: Dict[str, Tuple[Tuple[Rule, ...], Tuple[Rule, ...]]] = {}
+    for name, names in ancestors.items():
+        sources = sorted((ancestor for ancestor in names if ancestor in declared), key=lambda a: len(ancestors[a]))
+        if not sources:
+            continue
+        merged = ([], [])
+        seen = set()
+        for ancestor in sources:
+            for kind in (0, 1):
+                for alternatives, declared_on in declared[ancestor][kind]:
+                    if alternatives not in seen:
+                        seen.add(alternatives)
+                        merged[kind].append((alternatives, declared_on))
+        rules[name] = (tuple(merged[0]), tuple(merged[1]))
+
+    return Vocabulary(ancestors, ranges, domains, members, superseded, rules, _source_key(vocabulary_path, rules_path))
+
+
+def _source_key(vocabulary_path: str, rules_path: str) -> Tuple:
+    """Identifies the sources a saved index was built from"""
+    stats = [os.stat(path) for path in (vocabulary_path, rules_path)]
+    return (INDEX_VERSION,) + tuple((path, stat.st_size, stat.st_mtime_ns) for path, stat in zip(
+        (vocabulary_path, rules_path), stats
+    ))
+
+
+def index_path() -> str:
+    return os.path.join(os.environ.get("SEO_TOOLS_CACHE_DIR", DEFAULT_CACHE_DIR), "schema-vocabulary.json")
+
+
+def _key_line(source_key: Tuple) -> bytes:
+    return json.dumps(source_key).encode("utf-8") + b"\n"
+
+
+def save_vocabulary(vocabulary: Vocabulary, path: Optional[str] = None):
+    """Save an index atomically (readers never see a partial file): key line, then the index"""
+    path = path or index_path()
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    # mkstemp creates the file readable by this user only
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_key_line(vocabulary.source_key))
+            f.write(json.dumps(vocabulary.to_dict(), separators=(",", ":")).encode("utf-8"))
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _read_index(path: str, key: Tuple) -> Optional[Vocabulary]:
+    """The saved index at path if this user wrote it for these sources, else None"""
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_uid != os.getuid():
+                return None
+            if f.readline() != _key_line(key):
+                return None
+            return Vocabulary.from_dict(json.loads(f.read()), key)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # Unreadable, truncated or from another layout: rebuilt by the caller
+        return None
+
+
+def load_vocabulary(vocabulary_path: str = VOCABULARY_SOURCE, rules_path: str = RULES_SOURCE) -> Vocabulary:
+    """The saved index when it matches the sources, else a freshly compiled (and saved) one"""
+    path = index_path()
+    key = _source_key(vocabulary_path, rules_path)
+    vocabulary = _read_index(path, key)
+    if vocabulary is not None:
+        return vocabulary
+
+    vocabulary = compile_vocabulary(vocabulary_path, rules_path)
+    try:
+        save_vocabulary(vocabulary, path)
+    except OSError:
+        # A read-only cache directory only costs the compile on the next start
+        pass
+    return vocabulary
+
+
+def main():
+    """Main function for command line usage: rebuild the saved index"""
+    vocabulary = compile_vocabulary()
+    save_vocabulary(vocabulary)
+    print(json.dumps({
+        "success": True,
+        "path": index_path(),
+        "types": len(vocabulary.ancestors),
+        "properties": len(vocabulary.ranges),
+        "types_with_rules": len(vocabulary.rules)
+    }))
+
+
+if __name__ == "__main__":
+    main()
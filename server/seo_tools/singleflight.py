@@ -0,0 +1,117 @@
+"""
+Single-flight coalescing of identical in-flight tool calls
+
+When many users check the same URL within seconds, only the first call does
+the work; concurrent identical calls attach to it and share its result:
+
+    result = await single_flight.run(tool, func, args, lambda: scheduler.run(tool, func, *args))
+
+Which calls count as identical is decided per tool function by COALESCE_RULES:
+each rule maps the call arguments to the parts of the key that matter, using
+only normalizations the tool itself treats as equivalent (a missing scheme,
+scheme and host case). Functions without a rule are never coalesced.
+Nothing is cached: once the computation finishes the key is released.
+"""
+
+import re
+import copy
+import asyncio
+import threading
+from urllib.parse import urlsplit, urlunsplit
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+def normalize_url(url: str) -> str:
+    """Add the https:// the URL tools default to and lowercase scheme and host"""
+    url = url or ""
+    if not url.startswith(("http://", "https://")):
+        url = "https://" + url
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, parts.fragment))
+
+
+def normalize_domain(domain: str) -> str:
+    """Domain the way the domain age checker cleans it (no scheme, path or www.)"""
+    domain = (domain or "").strip().lower()
+    domain = re.sub(r'^(https?://)?', '', domain)
+    domain = re.sub(r'/.*$', '', domain)
+    return re.sub(r'^www\.', '', domain)
+
+
+def _adsense_key(domain: str, publisher_id: Optional[str] = None) -> Tuple:
+    # The adsense checker keeps the scheme it is given, so only case is folded
+    return normalize_url(domain), (publisher_id or "").strip()
+
+
+# (tool, function name) -> argument normalizer returning the key parts
+COALESCE_RULES: Dict[Tuple[str, str], Callable[..., Tuple]] = {
+    ("redirect-checker", "check_redirect_chain"): lambda url: (normalize_url(url),),
+    ("schema-validator", "validate_from_url"): lambda url, formats=None: (normalize_url(url), tuple(formats or ())),
+    ("safe-browsing-checker", "check_safe_browsing"): lambda url: (normalize_url(url),),
+    ("ip-geolocation-finder", "get_ip_geolocation"): lambda ip: ((ip or "").lower(),),
+    ("domain-age-checker", "check_domain_age"): lambda domain: (normalize_domain(domain),),
+    ("adsense-ban-checker", "check_adsense_ban"): _adsense_key,
+}
+
+
+def coalesce_key(tool: str, func: Callable, args: tuple) -> Optional[Hashable]:
+    """Coalescing key for a call, or None when the call is never coalesced"""
+    name = getattr(func, "__name__", None)
+    rule = COALESCE_RULES.get((tool, name))
+    if rule is None:
+        return None
+    return (tool, name) + tuple(rule(*args))
+
+
+class SingleFlight:
+    """Shares one in-flight computation between concurrent identical calls"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.followers = 0
+
+    async def run(self, tool: str, func: Callable, args: tuple,
+                  compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Await compute(), or the identical computation already in flight"""
+        key = coalesce_key(tool, func, args)
+        if key is None:
+            return await compute()
+
+        task = self._inflight.get(key)
+        if task is not None:
+            with self._lock:
+                self.followers += 1
+            # shield: a follower disconnecting must not cancel the shared work
+            result = await asyncio.shield(task)
+            if isinstance(result, dict):
+                result = copy.copy(result)
+                result["coalesced"] = True
+            return result
+
+        task = asyncio.ensure_future(compute())
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        with self._lock:
+            self.leaders += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"in_flight": len(self._inflight), "leaders": self.leaders, "followers": self.followers}
+
+    def metric_lines(self):
+        """Prometheus exposition lines (registered with timing.metrics by the service)"""
+        stats = self.stats()
+        return [
+            "# TYPE seo_tool_coalesced_calls_total counter",
+            f'seo_tool_coalesced_calls_total{{role="leader"}} {stats["leaders"]}',
+            f'seo_tool_coalesced_calls_total{{role="follower"}} {stats["followers"]}',
+        ]
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,136 @@
+"""
+Stage-level timing spans for tool results, aggregated into Prometheus histograms
+
+Tool entry points wrap their work in spans:
+
+    timer = Timer()
+    with timer.span("decode"):
+        image = Image.open(BytesIO(image_data))
+        image.load()
+    ...
+    return timer.attach(result)
+
+attach() adds "timings": [{"stage": "decode", "ms": 12.5}, ...] to the result.
+Spans may carry extra labels (the redirect checker adds "hop" to network spans).
+Aggregation happens where results come back to the service (observe_result),
+so spans recorded inside process-pool workers are counted too.
+"""
+
+import time
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+STAGES = ("decode", "analyze", "transform", "encode", "serialize", "network", "cache")
+
+# Histogram buckets in seconds (Prometheus "le" upper bounds)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Timer:
+    """Records the spans of one tool call"""
+
+    __slots__ = ("spans",)
+
+    def __init__(self):
+        self.spans: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def span(self, stage: str, **labels):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start_time, **labels)
+
+    def add(self, stage: str, seconds: float, **labels):
+        """Record a span measured elsewhere"""
+        entry = {"stage": stage, "ms": round(seconds * 1000, 3)}
+        entry.update(labels)
+        self.spans.append(entry)
+
+    def attach(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the recorded spans to a result dict (extending any already there)"""
+        if isinstance(result, dict):
+            result.setdefault("timings", []).extend(self.spans)
+        return result
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a label tuple"""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...],
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple[str, ...], seconds: float):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # [bucket counts..., +Inf count, sum]
+                series = [0] * (len(self.buckets) + 1) + [0.0]
+                self._series[labels] = series
+            for index, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series[index] += 1
+            series[len(self.buckets)] += 1
+            series[-1] += seconds
+
+    def render(self) -> List[str]:
+        """Prometheus text exposition lines"""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted(self._series.items())
+            for labels, series in items:
+                pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, labels))
+                prefix = f"{pairs}," if pairs else ""
+                for index, bound in enumerate(self.buckets):
+                    lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {series[index]}')
+                lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {series[len(self.buckets)]}')
+                lines.append(f"{self.name}_sum{{{pairs}}} {series[-1]:.6f}")
+                lines.append(f"{self.name}_count{{{pairs}}} {series[len(self.buckets)]}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """Process-wide metric registry rendered by the service's /metrics endpoint"""
+
+    def __init__(self):
+        self.stage_seconds = Histogram(
+            "seo_tool_stage_seconds", "Time spent per tool stage", ("tool", "stage")
+        )
+        self.request_seconds = Histogram(
+            "seo_tool_request_seconds", "End-to-end tool call time in the service", ("tool", "outcome")
+        )
+        self._collectors = []
+
+    def observe_result(self, tool: str, result: Any, seconds: Optional[float] = None):
+        """Aggregate a result's spans (and optionally its total time) into histograms"""
+        if isinstance(result, dict):
+            for entry in result.get("timings") or ():
+                self.stage_seconds.observe((tool, entry.get("stage", "unknown")), entry.get("ms", 0) / 1000)
+        if seconds is not None:
+            outcome = "error" if isinstance(result, dict) and result.get("success") is False else "ok"
+            self.request_seconds.observe((tool, outcome), seconds)
+
+    def add_collector(self, collector):
+        """Register a callable returning extra exposition lines (gauges, counters)"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines = self.stage_seconds.render() + self.request_seconds.render()
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
@@ -0,0 +1,8 @@
+"""Make the seo_tools package importable however pytest is started"""
+
+import os
+import sys
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if SERVER_DIR not in sys.path:
+    sys.path.insert(0, SERVER_DIR)
@@ -0,0 +1,45 @@
+import os
+
+from seo_tools.cache import CACHE_RULES, ResultCache, cache_key, normalize_options
+
+
+def test_free_text_options_are_hashed_as_given():
+    assert cache_key("tool", b"data", {"code": "007"}) != cache_key("tool", b"data", {"code": "7"})
+    assert cache_key("tool", b"data", {"text": "A"}) != cache_key("tool", b"data", {"text": "a"})
+    assert cache_key("tool", b"data", {"text": " a"}) != cache_key("tool", b"data", {"text": "a"})
+
+
+def test_declared_options_are_read_like_the_tool():
+    types = {"quality": int}
+    assert cache_key("tool", b"data", {"quality": "85"}, types) == cache_key("tool", b"data", {"quality": 85}, types)
+    assert cache_key("tool", b"data", {"quality": "85"}) != cache_key("tool", b"data", {"quality": 85})
+    # A value the tool could not read is kept rather than guessed at
+    assert normalize_options({"quality": "high"}, types) == '{"quality":"high"}'
+
+
+def test_option_order_and_input_content():
+    assert normalize_options({"b": 1, "a": 2}) == normalize_options({"a": 2, "b": 1})
+    assert cache_key("tool", "text") == cache_key("tool", b"text")
+    assert cache_key("tool", b"one") != cache_key("tool", b"two")
+    assert cache_key("one", b"data") != cache_key("two", b"data")
+
+
+def test_profile_picture_rules_declare_numeric_options():
+    rule = CACHE_RULES[("profile-picture-maker", "process_profile_picture")]
+    data, options = rule.key(b"image", {"zoom": "1.5", "style_variant": "2", "background": "blue"})
+    assert cache_key("profile-picture-maker", data, options, rule.types) == cache_key(
+        "profile-picture-maker", data, {"zoom": 1.5, "style_variant": 2, "background": "blue"}, rule.types
+    )
+
+
+def test_results_survive_the_memory_tier(tmp_path):
+    directory = str(tmp_path)
+    cache = ResultCache(memory_bytes=0, disk_bytes=1024 * 1024, directory=directory)
+    key = cache_key("tool", b"data")
+    cache.put(key, {"success": True, "value": 1})
+    assert cache.get(key) == {"success": True, "value": 1}
+    reopened = ResultCache(memory_bytes=0, disk_bytes=1024 * 1024, directory=directory)
+    assert reopened.get(key) == {"success": True, "value": 1}
+    cache.clear()
+    assert cache.get(key) is None
+    assert not [files for _, _, files in os.walk(directory) if files]
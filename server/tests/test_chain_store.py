@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+
+from seo_tools import chain_store
+from seo_tools.chain_store import COMMIT_EVERY, ChainStore
+from seo_tools.redirect_checker import HopMemo
+
+
+def _result(url, status=200):
+    return {'success': True, 'original_url': url, 'chain': [{'url': url, 'status_code': status}]}
+
+
+@pytest.fixture
+def path(tmp_path, monkeypatch):
+    monkeypatch.setattr(chain_store, "STORE_BUSY_TIMEOUT", 5)
+    return str(tmp_path / "chains.db")
+
+
+def test_chains_and_hops_round_trip(path):
+    store = ChainStore(path)
+    store.put(_result("https://example.com/a", 404))
+    store.put_hop("https://example.com/old", 301, "Moved Permanently", {'location': 'https://example.com/new'},
+                  "HEAD", "none")
+    # Buffered writes are visible to the store that made them before they are committed
+    assert store.get("https://example.com/a").final_status == 404
+    store.close()
+
+    store = ChainStore(path)
+    stored = store.get("https://example.com/a")
+    assert stored.final_url == "https://example.com/a" and stored.final_status == 404
+    assert store.get("https://example.com/missing") is None
+    memo = HopMemo(100)
+    assert store.load_hops(memo) == 1
+    assert memo.get("https://example.com/old").location == 'https://example.com/new'
+    store.close()
+
+
+def test_two_stores_write_concurrently(path):
+    stores = [ChainStore(path), ChainStore(path)]
+    failures = []
+
+    def write(store, host):
+        try:
+            for i in range(COMMIT_EVERY + 100):
+                store.put(_result(f"https://{host}/{i}"))
+            store.flush()
+        except Exception as e:
+            failures.append(e)
+
+    threads = [threading.Thread(target=write, args=(store, f"site{n}.example")) for n, store in enumerate(stores)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for store in stores:
+        store.close()
+
+    assert failures == []
+    store = ChainStore(path)
+    assert store.stats()['chains'] == 2 * (COMMIT_EVERY + 100)
+    assert store.get(f"https://site1.example/{COMMIT_EVERY}").final_status == 200
+    store.close()
@@ -0,0 +1,47 @@
+import os
+import sys
+import time
+
+import pytest
+
+from seo_tools.isolation import JOB_LAUNCHER_VERSIONS, IsolatedExecutor, IsolatedJobFailed
+
+
+def _main_file():
+    return getattr(sys.modules["__main__"], "__file__", None)
+
+
+@pytest.fixture(scope="module")
+def executor():
+    executor = IsolatedExecutor(2, preload=[])
+    executor.start()
+    yield executor
+    executor.shutdown(cancel_futures=True)
+
+
+@pytest.mark.skipif(sys.version_info[:2] not in JOB_LAUNCHER_VERSIONS,
+                    reason="stock forkserver launcher on this interpreter")
+def test_child_does_not_import_parent_main(executor):
+    parent_main = _main_file()
+    assert parent_main is not None
+    assert executor.submit(_main_file).result() != parent_main
+
+
+def test_trivial_job_is_a_fork_not_a_start(executor):
+    executor.submit(os.getpid).result()
+    start = time.perf_counter()
+    pids = {executor.submit(os.getpid).result() for _ in range(5)}
+    per_job = (time.perf_counter() - start) / 5
+    assert len(pids) == 5 and os.getpid() not in pids
+    assert per_job < 0.25
+
+
+def test_job_past_its_timeout_is_killed(executor):
+    with pytest.raises(IsolatedJobFailed) as failure:
+        executor.submit_with_timeout(0.3, time.sleep, 5).result()
+    assert failure.value.reason == "timeout"
+
+
+def test_job_exception_is_raised_in_parent(executor):
+    with pytest.raises(FileNotFoundError):
+        executor.submit(os.stat, "/nonexistent/path").result()
@@ -0,0 +1,48 @@
+import pytest
+
+from seo_tools.bulk_redirect_checker import MigrationRow, migration_issues
+
+
+def _chain(*steps):
+    chain = []
+    for url, status in steps:
+        step = {'url': url, 'status_code': status}
+        if 300 <= status < 400:
+            step['is_redirect'] = True
+        chain.append(step)
+    return {'success': True, 'original_url': steps[0][0], 'chain': chain}
+
+
+MOVED = _chain(("https://old.example/a", 301), ("https://new.example/b", 200))
+
+
+@pytest.mark.parametrize("target", [
+    "https://new.example/b",
+    "new.example/b",
+    "https://NEW.Example/b",
+])
+def test_equivalent_targets_match(target):
+    assert migration_issues(MigrationRow(1, "https://old.example/a", target), MOVED) == []
+
+
+@pytest.mark.parametrize("target", [
+    "http://new.example/b",
+    "https://new.example/B",
+    "/b",
+])
+def test_other_targets_do_not_match(target):
+    assert migration_issues(MigrationRow(1, "https://old.example/a", target), MOVED) == ['wrong_target']
+
+
+def test_path_targets_resolve_on_the_source_site():
+    result = _chain(("https://old.example/a", 301), ("https://old.example/b", 200))
+    assert migration_issues(MigrationRow(1, "https://old.example/a", "/b"), result) == []
+
+
+def test_status_and_hops_are_checked():
+    result = _chain(("https://old.example/a", 302), ("https://old.example/c", 301), ("https://new.example/b", 404))
+    assert migration_issues(MigrationRow(1, "https://old.example/a", "new.example/b"), result) == [
+        'wrong_status', 'extra_hops', 'target_not_ok'
+    ]
+    assert migration_issues(MigrationRow(1, "https://old.example/a", "new.example/b", 301), MOVED) == []
+    assert migration_issues(MigrationRow(1, "https://old.example/a", "new.example/b", 308), MOVED) == ['wrong_status']
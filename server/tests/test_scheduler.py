@@ -0,0 +1,52 @@
+import asyncio
+import threading
+
+import pytest
+
+from seo_tools.registry import ToolRegistry, ToolSpec
+from seo_tools.scheduler import ClassConfig, Saturated, ToolScheduler, ToolTimeout
+
+
+@pytest.fixture
+def scheduler():
+    tools = ToolRegistry([
+        ToolSpec("slow", "x", "text", "light", timeout=0.2),
+        ToolSpec("fast", "x", "text", "light"),
+    ])
+    configs = {"cpu": ClassConfig(1, 0), "io": ClassConfig(1, 0), "light": ClassConfig(2, 1)}
+    scheduler = ToolScheduler(configs, tools, isolate=False)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_timed_out_jobs_keep_their_slots_until_they_finish(scheduler):
+    release = threading.Event()
+
+    async def main():
+        for _ in range(2):
+            with pytest.raises(ToolTimeout):
+                await scheduler.run("slow", release.wait, 5)
+        # Both workers are still blocked; one call fits in the queue, the next is refused
+        queued = asyncio.ensure_future(scheduler.run("fast", lambda: "ok"))
+        await asyncio.sleep(0.05)
+        with pytest.raises(Saturated) as refused:
+            await scheduler.run("fast", lambda: "ok")
+        assert refused.value.retry_after >= 1
+
+        release.set()
+        assert await queued == "ok"
+        await asyncio.sleep(0.05)
+        return scheduler.stats()["classes"]["light"]
+
+    try:
+        light = asyncio.run(main())
+    finally:
+        release.set()
+    assert light["running"] == 0 and light["queued"] == 0
+
+
+def test_fast_jobs_run_within_their_limits(scheduler):
+    async def main():
+        return await asyncio.gather(*(scheduler.run("fast", pow, 2, n) for n in range(3)))
+
+    assert asyncio.run(main()) == [1, 2, 4]
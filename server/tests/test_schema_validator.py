@@ -0,0 +1,45 @@
+import pytest
+
+from seo_tools.schema_validator import SCHEMA_FORMATS, SchemaMarkupTester, parse_formats
+
+GRAPH_PAGE = """<html><head>
+<script type="application/ld+json">{"@context": "https://schema.org", "@graph": [
+  {"@type": "Organization", "@id": "#org", "name": "Example", "url": "https://example.com", "logo": "https://example.com/l.png"},
+  {"@type": "WebSite", "name": "Example", "url": "https://example.com", "publisher": {"@id": "#org"}},
+  {"@id": "#org"}
+]}</script>
+<script type="application/ld+json">{"@graph": [{"@type": "Person", "name": "Author"}]}</script>
+<script type="application/ld+json">{not json</script>
+</head><body></body></html>"""
+
+
+def test_graph_nodes_are_reported_as_items():
+    items = SchemaMarkupTester().extract_json_ld_from_html(GRAPH_PAGE)
+    assert [item.type for item in items] == ['Organization', 'WebSite', 'Person', 'Invalid JSON-LD']
+    organization, website, person, invalid = items
+    assert organization.errors == [] and website.errors == []
+    # Nodes of a @graph without @context are flagged; nodes of one with it are not
+    assert not any('@context' in warning for warning in organization.warnings + website.warnings)
+    assert any('@context' in warning for warning in person.warnings)
+    assert [item.line_number for item in items] == [2, 2, 7, 8]
+    assert invalid.errors[0].startswith('Invalid JSON syntax')
+
+
+def test_formats_limit_extraction():
+    html = GRAPH_PAGE.replace("<body></body>", '<body><div itemscope itemtype="https://schema.org/Thing">'
+                                               '<span itemprop="name">Thing</span></div></body>')
+    tester = SchemaMarkupTester()
+    assert 'Thing' in [item.type for item in tester.process_html_content(html).schemas_found]
+    assert 'Thing' not in [item.type for item in tester.process_html_content(html, formats=('json-ld',)).schemas_found]
+
+
+def test_parse_formats():
+    assert parse_formats(None) == SCHEMA_FORMATS
+    assert parse_formats([]) == SCHEMA_FORMATS
+    assert parse_formats([" JSON-LD", "rdfa", "json-ld"]) == ("json-ld", "rdfa")
+
+
+@pytest.mark.parametrize("formats", ["json-ld", ["json-ld", 1], ["turtle"]])
+def test_parse_formats_rejects(formats):
+    with pytest.raises(ValueError):
+        parse_formats(formats)
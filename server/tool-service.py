@@ -0,0 +1,629 @@
+#!/usr/bin/env python3
+"""
+Tool Service - Long-lived ASGI service that keeps the Python tool modules warm
+
+The Node server proxies every Python-backed tool endpoint to this process instead
+of spawning a new interpreter per request. Tool modules come from the seo_tools
+registry: they are imported once (at startup for the served tool groups, or on
+first use) and blocking tool functions run in the scheduler's pools (a process
+pool for CPU-bound tools, thread pools for network and text tools) so the event
+loop stays free. A saturated pool answers 429 with Retry-After right away.
+Per-stage timings from every result are aggregated into histograms served on
+/metrics in the Prometheus text format.
+
+A worker can be restricted to some tool groups (TOOL_SERVICE_GROUPS=url,text or
+--groups url,text); it then never imports the image/PDF stacks and starts in a
+fraction of the time.
+"""
+
+import io
+import os
+import csv
+import json
+import time
+import asyncio
+import sqlite3
+from types import ModuleType
+from typing import Dict, Any, Optional, List, Tuple
+
+from fastapi import FastAPI, File, Form, Request, UploadFile
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from seo_tools import TOOL_GROUPS, ToolUnavailable, registry
+from seo_tools.cache import result_cache
+from seo_tools.framing import FRAME_CONTENT_TYPE, encode_frame, to_jsonable
+from seo_tools.isolation import IsolatedJobFailed, isolation_stats
+from seo_tools.scheduler import Saturated, ToolScheduler, ToolTimeout
+from seo_tools.singleflight import single_flight
+from seo_tools.fetch import dns_cache
+from seo_tools.timing import metrics
+
+
+def _parse_groups(value: Optional[str]) -> List[str]:
+    """Parse a comma separated tool group list ("all" or empty means every group)"""
+    if not value or value.strip() == "all":
+        return list(TOOL_GROUPS)
+    groups = [group.strip() for group in value.split(",") if group.strip()]
+    unknown = set(groups) - set(TOOL_GROUPS)
+    if unknown:
+        raise ValueError(f"Unknown tool groups: {', '.join(sorted(unknown))}")
+    return groups
+
+
+served_groups = _parse_groups(os.environ.get("TOOL_SERVICE_GROUPS"))
+preload_tools = os.environ.get("TOOL_SERVICE_PRELOAD", "1") != "0"
+
+# Bulk redirect audits: request size and engine limits (global / per host);
+# requests may lower the engine limits but never raise them
+BULK_MAX_URLS = int(os.environ.get("TOOL_SERVICE_BULK_MAX_URLS", 50000))
+BULK_CONCURRENCY = int(os.environ.get("TOOL_SERVICE_BULK_CONCURRENCY", 200))
+BULK_PER_HOST = int(os.environ.get("TOOL_SERVICE_BULK_PER_HOST", 6))
+# SQLite file with the chains of past audits, for /redirect-chain/recheck
+REDIRECT_STORE = os.environ.get("TOOL_SERVICE_REDIRECT_STORE", "redirect-chains.db")
+
+
+class ToolNotServed(Exception):
+    """Raised when a tool belongs to a group this worker does not serve"""
+
+
+def get_tool(name: str) -> ModuleType:
+    """Return a tool module, importing it on first use"""
+    if registry.spec(name).group not in served_groups:
+        raise ToolNotServed(f"{name} is not served by this worker")
+    return registry.load(name)
+
+
+app = FastAPI(title="SEO Tools Service", docs_url=None, redoc_url=None)
+scheduler = ToolScheduler()
+
+
+def _scheduler_metrics() -> List[str]:
+    """Scheduler slot usage as Prometheus gauges"""
+    lines = ["# TYPE seo_tool_scheduler_running gauge", "# TYPE seo_tool_scheduler_rejected_total counter"]
+    for name, stats in scheduler.stats()["classes"].items():
+        lines.append(f'seo_tool_scheduler_running{{class="{name}"}} {stats["running"]}')
+        lines.append(f'seo_tool_scheduler_rejected_total{{class="{name}"}} {stats["rejected"]}')
+    return lines
+
+
+metrics.add_collector(_scheduler_metrics)
+metrics.add_collector(isolation_stats.metric_lines)
+metrics.add_collector(single_flight.metric_lines)
+metrics.add_collector(dns_cache.metric_lines)
+
+
+@app.on_event("startup")
+async def startup():
+    scheduler.groups = served_groups
+    if preload_tools:
+        registry.preload(served_groups)
+        if scheduler.isolated_tools():
+            scheduler.warm()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    scheduler.shutdown()
+
+
+@app.exception_handler(Saturated)
+async def saturated_handler(request, exc: Saturated):
+    return JSONResponse(
+        status_code=429,
+        headers={"Retry-After": str(exc.retry_after)},
+        content={"success": False, "error": "Server is busy, please retry shortly", "retry_after": exc.retry_after}
+    )
+
+
+@app.exception_handler(IsolatedJobFailed)
+async def isolated_job_failed_handler(request, exc: IsolatedJobFailed):
+    return JSONResponse(status_code=422, content={"success": False, "error": str(exc), "reason": exc.reason})
+
+
+@app.exception_handler(ToolTimeout)
+async def tool_timeout_handler(request, exc: ToolTimeout):
+    return JSONResponse(status_code=422, content={"success": False, "error": str(exc), "reason": "timeout"})
+
+
+@app.exception_handler(ToolUnavailable)
+async def tool_unavailable_handler(request, exc: ToolUnavailable):
+    return JSONResponse(status_code=503, content={"success": False, "error": str(exc)})
+
+
+@app.exception_handler(ToolNotServed)
+async def tool_not_served_handler(request, exc: ToolNotServed):
+    return JSONResponse(status_code=404, content={"success": False, "error": str(exc)})
+
+
+@app.get("/health")
+async def health():
+    names = registry.names(served_groups)
+    return {
+        "status": "ok",
+        "pid": os.getpid(),
+        "groups": served_groups,
+        "tools_loaded": [name for name in names if registry.is_loaded(name)],
+        "import_stats": registry.import_stats(),
+        "result_cache": result_cache.stats(),
+        "scheduler": scheduler.stats(),
+        "single_flight": single_flight.stats(),
+        "dns_cache": dns_cache.stats()
+    }
+
+
+def _as_bool(value: Optional[str], default: bool = False) -> bool:
+    """Parse a form field boolean the way the CLI scripts do"""
+    if value is None:
+        return default
+    return str(value).lower() == "true"
+
+
+def _bulk_limits(options: Dict[str, Any]) -> Tuple[int, int]:
+    """concurrency and per_host of a bulk request, capped at the service maxima
+
+    Missing values default to the maxima; anything that is not a positive
+    integer raises ValueError.
+    """
+    limits = []
+    for name, maximum in (("concurrency", BULK_CONCURRENCY), ("per_host", BULK_PER_HOST)):
+        value = options.get(name)
+        if value is None or value == "":
+            limits.append(maximum)
+            continue
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            number = 0
+        if number < 1:
+            raise ValueError(f"{name} must be a positive integer, got {value!r}")
+        limits.append(min(number, maximum))
+    return limits[0], limits[1]
+
+
+def tool_response(request: Request, tool: str, result: Dict[str, Any]) -> Response:
+    """Send a tool result as a binary frame when the caller accepts it, else as JSON"""
+    start_time = time.perf_counter()
+    if FRAME_CONTENT_TYPE in request.headers.get("accept", ""):
+        response = Response(b"".join(encode_frame(result)), media_type=FRAME_CONTENT_TYPE)
+    else:
+        response = JSONResponse(to_jsonable(result))
+    metrics.stage_seconds.observe((tool, "serialize"), time.perf_counter() - start_time)
+    return response
+
+
+async def run_tool(tool: str, func, *args, convert=None) -> Dict[str, Any]:
+    """Run a tool through the scheduler and record its spans and end-to-end time
+
+    Deterministic tools are answered from the result cache in this process
+    (cache.py); identical concurrent calls to URL tools share one
+    computation (singleflight.py).
+    """
+    start_time = time.perf_counter()
+    result = await result_cache.run(
+        tool, func, args,
+        lambda target: single_flight.run(tool, target, args, lambda: scheduler.run(tool, target, *args))
+    )
+    if convert is not None:
+        result = convert(result)
+    metrics.observe_result(tool, result, time.perf_counter() - start_time)
+    return result
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    return Response(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+# URL tools
+
+@app.post("/redirect-chain/check")
+async def redirect_chain_check(request: Request, payload: Dict[str, Any]):
+    module = get_tool("redirect-checker")
+    checker = module.RedirectChainChecker()
+    result = await run_tool("redirect-checker", checker.check_redirect_chain, payload.get("url", ""))
+    return tool_response(request, "redirect-checker", result)
+
+
+@app.post("/redirect-chain/bulk")
+async def redirect_chain_bulk(request: Request, payload: Dict[str, Any]):
+    module = get_tool("bulk-redirect-checker")
+    urls = [url for url in payload.get("urls") or [] if isinstance(url, str) and url.strip()]
+    if len(urls) > BULK_MAX_URLS:
+        return JSONResponse(
+            status_code=413, content={"success": False, "error": f"At most {BULK_MAX_URLS} URLs per request"}
+        )
+    start_time = time.perf_counter()
+    try:
+        concurrency, per_host = _bulk_limits(payload)
+        engine = module.BulkRedirectChecker(
+            concurrency=concurrency,
+            per_host=per_host,
+            header_profile=payload.get("header_profile") or "seo"
+        )
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"success": False, "error": str(e)})
+    async with engine:
+        results = await engine.check_all(urls)
+        graph = engine.graph_report()
+    for result in results:
+        metrics.observe_result("redirect-checker", result)
+    result = {"success": True, "results": results, "summary": module.summarize_results(results), "graph": graph}
+    metrics.observe_result("bulk-redirect-checker", result, time.perf_counter() - start_time)
+    return tool_response(request, "bulk-redirect-checker", result)
+
+
+@app.post("/redirect-chain/bulk/stream")
+async def redirect_chain_bulk_stream(request: Request):
+    """NDJSON, one line per chain as it completes (or a CSV / columnar ndjson.gz export)
+
+    The body is either JSON ({"sitemap_url": ...} or {"urls": [...]}) or a CSV
+    list that is read while it uploads; concurrency, per_host, header_profile,
+    format and graph come from the JSON body or the query string. The redirect
+    graph grows with the list, so it is only collected with graph=true and
+    capped at STREAM_GRAPH_MAX_NODES nodes; the hop memo keeps the last
+    STREAM_HOP_MEMO_SIZE hops.
+    """
+    module = get_tool("bulk-redirect-checker")
+    options = dict(request.query_params)
+    payload = None
+    if "json" in request.headers.get("content-type", ""):
+        payload = await request.json()
+        options.update(payload)
+
+    export_format = options.get("format") or "ndjson"
+    try:
+        encoder = module.get_encoder(export_format)
+        concurrency, per_host = _bulk_limits(options)
+        engine = module.BulkRedirectChecker(
+            concurrency=concurrency,
+            per_host=per_host,
+            header_profile=options.get("header_profile") or "seo",
+            collect_graph=_as_bool(options.get("graph")),
+            graph_max_nodes=module.STREAM_GRAPH_MAX_NODES,
+            hop_memo_size=module.STREAM_HOP_MEMO_SIZE
+        )
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"success": False, "error": str(e)})
+    if payload is None:
+        urls = module.iter_csv_urls(module.aiter_lines(request.stream()))
+    elif payload.get("sitemap_url"):
+        urls = engine.iter_sitemap_urls(payload["sitemap_url"])
+    else:
+        urls = [url for url in payload.get("urls") or [] if isinstance(url, str) and url.strip()]
+
+    async def lines():
+        start_time = time.perf_counter()
+        try:
+            async for chunk in engine.stream_export(urls, export_format):
+                yield chunk
+        finally:
+            await engine.close()
+            metrics.request_seconds.observe(("bulk-redirect-checker", "stream"), time.perf_counter() - start_time)
+
+    headers = {}
+    if export_format != "ndjson":
+        headers["Content-Disposition"] = f'attachment; filename="redirect-audit.{encoder.extension}"'
+    return StreamingResponse(lines(), media_type=encoder.media_type, headers=headers)
+
+
+@app.post("/redirect-chain/verify")
+async def redirect_chain_verify(request: Request):
+    """NDJSON of the migration map rows whose redirects do not match, then a summary
+
+    The body is the map as CSV (old URL, new URL, optional expected status),
+    read while it uploads, or JSON {"rows": [[old, new, status?], ...]};
+    concurrency and per_host come from the query string.
+    """
+    module = get_tool("bulk-redirect-checker")
+    options = dict(request.query_params)
+    try:
+        concurrency, per_host = _bulk_limits(options)
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"success": False, "error": str(e)})
+    if "json" in request.headers.get("content-type", ""):
+        payload = await request.json()
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(row for row in payload.get("rows") or [] if isinstance(row, list))
+        rows = module.iter_migration_rows(module._aiter(buffer.getvalue().splitlines()))
+    else:
+        rows = module.iter_migration_rows(module.aiter_lines(request.stream()))
+
+    # Memory stays bounded by concurrency: no headers kept and no redirect graph
+    engine = module.BulkRedirectChecker(
+        concurrency=concurrency,
+        per_host=per_host,
+        header_profile="none",
+        collect_graph=False,
+        hop_memo_size=module.STREAM_HOP_MEMO_SIZE,
+        meta_refresh=False
+    )
+
+    async def lines_out():
+        start_time = time.perf_counter()
+        try:
+            async for line in engine.stream_verification(rows):
+                yield line
+        finally:
+            await engine.close()
+            metrics.request_seconds.observe(("bulk-redirect-checker", "verify"), time.perf_counter() - start_time)
+
+    return StreamingResponse(lines_out(), media_type="application/x-ndjson")
+
+
+@app.post("/redirect-chain/recheck")
+async def redirect_chain_recheck(request: Request):
+    """NDJSON of the chains that changed since they were last stored, then a summary
+
+    The body is a CSV list read while it uploads or JSON {"urls": [...]} /
+    {"sitemap_url": ...}; every chain is stored in REDIRECT_STORE for the
+    next re-check. concurrency and per_host come from the query string.
+    """
+    module = get_tool("bulk-redirect-checker")
+    options = dict(request.query_params)
+    payload = None
+    if "json" in request.headers.get("content-type", ""):
+        payload = await request.json()
+        options.update(payload)
+
+    try:
+        concurrency, per_host = _bulk_limits(options)
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"success": False, "error": str(e)})
+    try:
+        store = await asyncio.to_thread(module.ChainStore, REDIRECT_STORE)
+    except sqlite3.Error as e:
+        return JSONResponse(status_code=503, content={"success": False, "error": f"Chain store failed: {str(e)}"})
+    engine = module.BulkRedirectChecker(
+        concurrency=concurrency,
+        per_host=per_host,
+        header_profile="none",
+        collect_graph=False,
+        hop_memo_size=module.STREAM_HOP_MEMO_SIZE,
+        meta_refresh=False,
+        store=store
+    )
+    if payload is None:
+        urls = module.iter_csv_urls(module.aiter_lines(request.stream()))
+    elif payload.get("sitemap_url"):
+        urls = engine.iter_sitemap_urls(payload["sitemap_url"])
+    else:
+        urls = [url for url in payload.get("urls") or [] if isinstance(url, str) and url.strip()]
+
+    async def lines_out():
+        start_time = time.perf_counter()
+        try:
+            async for line in engine.stream_changes(urls):
+                yield line
+        finally:
+            await engine.close()
+            await asyncio.to_thread(store.close)
+            metrics.request_seconds.observe(("bulk-redirect-checker", "recheck"), time.perf_counter() - start_time)
+
+    return StreamingResponse(lines_out(), media_type="application/x-ndjson")
+
+
+@app.post("/redirect-chain/report")
+async def redirect_chain_report(payload: Dict[str, Any]):
+    module = get_tool("redirect-checker")
+    checker = module.RedirectChainChecker()
+    report = checker.generate_report(payload.get("result") or {}, payload.get("format") or "text")
+    return {"report": report}
+
+
+@app.post("/schema-tester/validate-url")
+async def schema_validate_url(request: Request, payload: Dict[str, Any]):
+    module = get_tool("schema-validator")
+    tester = module.SchemaMarkupTester()
+    try:
+        formats = module.parse_formats(payload.get("formats"))
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"success": False, "error": str(e)})
+    result = await run_tool(
+        "schema-validator", tester.validate_from_url, payload.get("url", ""), formats,
+        convert=module.validation_result_to_dict
+    )
+    return tool_response(request, "schema-validator", result)
+
+
+@app.post("/schema-tester/validate-html")
+async def schema_validate_html(request: Request, payload: Dict[str, Any]):
+    module = get_tool("schema-validator")
+    tester = module.SchemaMarkupTester()
+    try:
+        formats = module.parse_formats(payload.get("formats"))
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"success": False, "error": str(e)})
+    result = await run_tool(
+        "schema-validator", tester.process_html_content, payload.get("html", ""), "", None, formats,
+        convert=module.validation_result_to_dict
+    )
+    return tool_response(request, "schema-validator", result)
+
+
+@app.post("/schema-tester/report")
+async def schema_report(payload: Dict[str, Any]):
+    module = get_tool("schema-validator")
+    tester = module.SchemaMarkupTester()
+    validation_result = module.validation_result_from_dict(payload.get("result") or {})
+    return {"report": tester.generate_report(validation_result, payload.get("format") or "text")}
+
+
+@app.post("/safe-browsing-checker")
+async def safe_browsing_checker(request: Request, payload: Dict[str, Any]):
+    module = get_tool("safe-browsing-checker")
+    result = await run_tool("safe-browsing-checker", module.check_safe_browsing, payload.get("url", ""))
+    return tool_response(request, "safe-browsing-checker", result)
+
+
+@app.post("/ip-geolocation-finder")
+async def ip_geolocation_finder(request: Request, payload: Dict[str, Any]):
+    module = get_tool("ip-geolocation-finder")
+    result = await run_tool("ip-geolocation-finder", module.get_ip_geolocation, payload.get("ip", ""))
+    return tool_response(request, "ip-geolocation-finder", result)
+
+
+@app.post("/domain-age-checker")
+async def domain_age_checker(request: Request, payload: Dict[str, Any]):
+    module = get_tool("domain-age-checker")
+    result = await run_tool("domain-age-checker", module.check_domain_age, payload.get("domain", ""))
+    return tool_response(request, "domain-age-checker", result)
+
+
+@app.post("/adsense-ban-checker")
+async def adsense_ban_checker(request: Request, payload: Dict[str, Any]):
+    module = get_tool("adsense-ban-checker")
+    result = await run_tool(
+        "adsense-ban-checker", module.check_adsense_ban, payload.get("domain", ""), payload.get("publisher_id") or None
+    )
+    return tool_response(request, "adsense-ban-checker", result)
+
+
+# Text and coding tools
+
+@app.post("/jwt-decoder")
+async def jwt_decoder(request: Request, payload: Dict[str, Any]):
+    module = get_tool("jwt-decoder")
+    result = await run_tool("jwt-decoder", module.decode_jwt, payload.get("token", ""))
+    return tool_response(request, "jwt-decoder", result)
+
+
+@app.post("/regex-generator")
+async def regex_generator(request: Request, payload: Dict[str, Any]):
+    module = get_tool("regex-generator")
+    result = await run_tool(
+        "regex-generator", module.generate_regex,
+        payload.get("pattern") or "", payload.get("options") or {}, payload.get("testString") or ""
+    )
+    return tool_response(request, "regex-generator", result)
+
+
+@app.post("/js-obfuscator")
+async def js_obfuscator(request: Request, payload: Dict[str, Any]):
+    module = get_tool("js-obfuscator")
+    result = await run_tool(
+        "js-obfuscator", module.process_obfuscation, payload.get("code", ""), payload.get("level") or "basic"
+    )
+    return tool_response(request, "js-obfuscator", result)
+
+
+@app.post("/html-to-markdown")
+async def html_to_markdown(request: Request, payload: Dict[str, Any]):
+    module = get_tool("html-to-markdown-converter")
+    result = await run_tool(
+        "html-to-markdown-converter", module.convert_html_to_markdown, payload.get("html", "")
+    )
+    return tool_response(request, "html-to-markdown-converter", result)
+
+
+@app.post("/csv-to-json-converter")
+async def csv_to_json_converter(request: Request, payload: Dict[str, Any]):
+    module = get_tool("csv-to-json-converter")
+    prettify = payload.get("prettify", True)
+    if isinstance(prettify, str):
+        prettify = _as_bool(prettify)
+    result = await run_tool(
+        "csv-to-json-converter", module.convert_csv_to_json, payload.get("csv_content", ""), prettify
+    )
+    return tool_response(request, "csv-to-json-converter", result)
+
+
+# Upload tools (multipart bodies are streamed to a spooled file by Starlette;
+# binary results go back as frames to callers that accept them)
+
+@app.post("/image-to-text-ocr")
+async def image_to_text_ocr(request: Request, image: UploadFile = File(...)):
+    module = get_tool("image-to-text-ocr")
+    image_data = await image.read()
+    result = await run_tool("image-to-text-ocr", module.process_ocr, image_data)
+    return tool_response(request, "image-to-text-ocr", result)
+
+
+@app.post("/background-remover")
+async def background_remover(
+    request: Request,
+    image: UploadFile = File(...),
+    smooth_edges: str = Form("true"),
+    hd_mode: str = Form("false")
+):
+    module = get_tool("background-remover")
+    image_data = await image.read()
+    result = await run_tool(
+        "background-remover", module.process_background_removal, image_data, _as_bool(smooth_edges), _as_bool(hd_mode)
+    )
+    return tool_response(request, "background-remover", result)
+
+
+@app.post("/image-dpi-converter")
+async def image_dpi_converter(request: Request, image: UploadFile = File(...), target_dpi: str = Form(...)):
+    module = get_tool("image-dpi-converter")
+    image_data = await image.read()
+    result = await run_tool("image-dpi-converter", module.process_dpi_conversion, image_data, target_dpi)
+    return tool_response(request, "image-dpi-converter", result)
+
+
+@app.post("/webp-to-jpg-converter")
+async def webp_to_jpg_converter(
+    request: Request,
+    image: UploadFile = File(...),
+    compression_level: str = Form("medium"),
+    quality: str = Form("85")
+):
+    module = get_tool("webp-to-jpg-converter")
+    image_data = await image.read()
+    result = await run_tool(
+        "webp-to-jpg-converter", module.process_webp_conversion, image_data, compression_level, quality
+    )
+    return tool_response(request, "webp-to-jpg-converter", result)
+
+
+@app.post("/profile-picture-maker/process")
+async def profile_picture_process(request: Request, image: UploadFile = File(...), options: str = Form("{}")):
+    module = get_tool("profile-picture-maker")
+    image_data = await image.read()
+    result = await run_tool(
+        "profile-picture-maker", module.process_profile_picture, image_data, json.loads(options or "{}")
+    )
+    return tool_response(request, "profile-picture-maker", result)
+
+
+@app.post("/profile-picture-practice-sheet")
+async def profile_picture_practice_sheet(request: Request, image: UploadFile = File(...), options: str = Form("{}")):
+    module = get_tool("profile-picture-maker")
+    image_data = await image.read()
+    result = await run_tool(
+        "profile-picture-maker", module.generate_practice_sheet, image_data, json.loads(options or "{}")
+    )
+    return tool_response(request, "profile-picture-maker", result)
+
+
+@app.post("/pdf-password-remover")
+async def pdf_password_remover(request: Request, pdf: UploadFile = File(...)):
+    module = get_tool("enhanced-pdf-cracker")
+    pdf_data = await pdf.read()
+    result = await run_tool("enhanced-pdf-cracker", module.process_pdf, pdf_data)
+    return tool_response(request, "enhanced-pdf-cracker", result)
+
+
+def main():
+    """Main function for command line usage"""
+    import argparse
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run the resident Python tool service")
+    parser.add_argument("--host", default=os.environ.get("TOOL_SERVICE_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("TOOL_SERVICE_PORT", "8001")))
+    parser.add_argument("--groups", default=None, help="Comma separated tool groups to serve (default: all)")
+    parser.add_argument("--lazy", action="store_true", help="Import tool modules on first use instead of at startup")
+    args = parser.parse_args()
+
+    global served_groups, preload_tools
+    if args.groups is not None:
+        served_groups = _parse_groups(args.groups)
+    if args.lazy:
+        preload_tools = False
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+import { spawn, type ChildProcess } from "child_process";
+import path from "path";
+import { log } from "./vite";
+
+// Resident Python tool service (server/tool-service.py). Tool modules are
+// imported once in that process; routes proxy to it over loopback HTTP
+// instead of spawning a python3 interpreter per request.
+const TOOL_SERVICE_HOST = process.env.TOOL_SERVICE_HOST || "127.0.0.1";
+const TOOL_SERVICE_PORT = parseInt(process.env.TOOL_SERVICE_PORT || "8001", 10);
+const TOOL_SERVICE_URL = process.env.TOOL_SERVICE_URL || `http://${TOOL_SERVICE_HOST}:${TOOL_SERVICE_PORT}`;
+const STARTUP_TIMEOUT_MS = 60000;
+const RESTART_DELAY_MS = 1000;
+
+let serviceProcess: ChildProcess | null = null;
+let readyPromise: Promise<void> | null = null;
+
+// Binary framed payloads (see server/seo_tools/framing.py): binary outputs come
+// back as raw bytes next to a JSON header instead of base64 inside JSON.
+const FRAME_MAGIC = "STF1";
+const FRAME_CONTENT_TYPE = "application/x-seo-tools-frame";
+const FRAME_PREFIX_SIZE = 8;
+
+// Response headers forwarded to the client (backpressure hints)
+const FORWARDED_HEADERS = ["retry-after"];
+
+export interface ToolServiceResponse {
+  status: number;
+  headers: Record<string, string>;
+  data: any;
+}
+
+export interface ToolBlob {
+  data: Buffer;
+  mime: string;
+}
+
+export function isToolBlob(value: any): value is ToolBlob {
+  return value != null && Buffer.isBuffer(value.data) && typeof value.mime === "string";
+}
+
+function joinBlobs(fields: any, blobs: ToolBlob[]): any {
+  if (Array.isArray(fields)) {
+    return fields.map((item) => joinBlobs(item, blobs));
+  }
+  if (fields && typeof fields === "object") {
+    const keys = Object.keys(fields);
+    if (keys.length === 1 && keys[0] === "$blob") {
+      return blobs[fields.$blob];
+    }
+    const joined: Record<string, any> = {};
+    for (const key of keys) {
+      joined[key] = joinBlobs(fields[key], blobs);
+    }
+    return joined;
+  }
+  return fields;
+}
+
+export function decodeFrame(buffer: Buffer): any {
+  if (buffer.length < FRAME_PREFIX_SIZE || buffer.toString("latin1", 0, 4) !== FRAME_MAGIC) {
+    throw new Error("Invalid tool service frame");
+  }
+  const headerLength = buffer.readUInt32BE(4);
+  let offset = FRAME_PREFIX_SIZE + headerLength;
+  const header = JSON.parse(buffer.toString("utf8", FRAME_PREFIX_SIZE, offset));
+
+  const blobs: ToolBlob[] = [];
+  for (const entry of header.blobs || []) {
+    if (buffer.length < offset + entry.size) {
+      throw new Error("Truncated tool service frame");
+    }
+    // subarray shares memory with the response buffer (no copy)
+    blobs.push({ data: buffer.subarray(offset, offset + entry.size), mime: entry.mime });
+    offset += entry.size;
+  }
+  return joinBlobs(header.fields || {}, blobs);
+}
+
+async function waitForHealthy(deadline: number): Promise<void> {
+  while (Date.now() < deadline) {
+    try {
+      const response = await fetch(`${TOOL_SERVICE_URL}/health`);
+      if (response.ok) {
+        return;
+      }
+    } catch {
+      // Service is still starting up
+    }
+    await new Promise((resolve) => setTimeout(resolve, 250));
+  }
+  throw new Error("Python tool service did not become healthy in time");
+}
+
+function spawnToolService(): void {
+  // An externally managed service (TOOL_SERVICE_URL) is never spawned here
+  if (process.env.TOOL_SERVICE_URL) {
+    return;
+  }
+
+  serviceProcess = spawn("python3", [
+    path.join("server", "tool-service.py"),
+    "--host", TOOL_SERVICE_HOST,
+    "--port", String(TOOL_SERVICE_PORT),
+  ], { stdio: ["ignore", "inherit", "inherit"] });
+
+  serviceProcess.on("error", (error) => {
+    log(`failed to spawn python tool service: ${error.message}`, "tool-service");
+  });
+
+  serviceProcess.on("exit", (code, signal) => {
+    log(`python tool service exited (code=${code}, signal=${signal}), restarting`, "tool-service");
+    serviceProcess = null;
+    readyPromise = null;
+    setTimeout(() => {
+      startToolService().catch((error) => log(error.message, "tool-service"));
+    }, RESTART_DELAY_MS);
+  });
+}
+
+export function startToolService(): Promise<void> {
+  if (!readyPromise) {
+    if (!serviceProcess) {
+      spawnToolService();
+    }
+    readyPromise = waitForHealthy(Date.now() + STARTUP_TIMEOUT_MS)
+      .then(() => log(`python tool service ready at ${TOOL_SERVICE_URL}`, "tool-service"))
+      .catch((error) => {
+        readyPromise = null;
+        throw error;
+      });
+  }
+  return readyPromise;
+}
+
+export function stopToolService(): void {
+  if (serviceProcess) {
+    serviceProcess.removeAllListeners("exit");
+    serviceProcess.kill();
+    serviceProcess = null;
+  }
+  readyPromise = null;
+}
+
+async function parseResponse(response: Response): Promise<ToolServiceResponse> {
+  const headers: Record<string, string> = {};
+  for (const name of FORWARDED_HEADERS) {
+    const value = response.headers.get(name);
+    if (value !== null) {
+      headers[name] = value;
+    }
+  }
+
+  const contentType = response.headers.get("content-type") || "";
+  if (contentType.includes(FRAME_CONTENT_TYPE)) {
+    const buffer = Buffer.from(await response.arrayBuffer());
+    return { status: response.status, headers, data: decodeFrame(buffer) };
+  }
+  const data = contentType.includes("application/json") ? await response.json() : await response.text();
+  return { status: response.status, headers, data };
+}
+
+export async function callToolService(route: string, body: Record<string, any>): Promise<ToolServiceResponse> {
+  await startToolService();
+  const response = await fetch(`${TOOL_SERVICE_URL}${route}`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(body),
+  });
+  return parseResponse(response);
+}
+
+export async function callToolServiceUpload(
+  route: string,
+  fieldName: string,
+  file: Express.Multer.File,
+  fields: Record<string, string> = {},
+): Promise<ToolServiceResponse> {
+  await startToolService();
+  const form = new FormData();
+  form.append(fieldName, new Blob([file.buffer], { type: file.mimetype }), file.originalname);
+  for (const [key, value] of Object.entries(fields)) {
+    form.append(key, value);
+  }
+  // Binary results (images, PDFs) come back as frames; blobs are ToolBlob values
+  const response = await fetch(`${TOOL_SERVICE_URL}${route}`, {
+    method: "POST",
+    headers: { Accept: `${FRAME_CONTENT_TYPE}, application/json` },
+    body: form,
+  });
+  return parseResponse(response);
+}
+
+// Streaming call: the request body is passed through as-is and the raw
+// response (e.g. NDJSON) is returned for the caller to pipe
+export async function streamToolService(
+  route: string,
+  body: BodyInit,
+  contentType: string,
+): Promise<Response> {
+  await startToolService();
+  return fetch(`${TOOL_SERVICE_URL}${route}`, {
+    method: "POST",
+    headers: { "Content-Type": contentType },
+    body,
+    duplex: "half",
+  } as RequestInit);
+}
+
+// Prometheus text exposition of per-tool stage and request timings
+export async function fetchToolServiceMetrics(): Promise<string> {
+  await startToolService();
+  const response = await fetch(`${TOOL_SERVICE_URL}/metrics`);
+  return response.text();
+}